@@ -16,22 +16,188 @@ Selenium.
 :license: MIT, see LICENSE for more details.
 """
 
-from . import abilities, actions, questions, resolutions
-from .abilities import *  # noqa: F403
-from .actions import *  # noqa: F403
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from .configuration import settings
 from .exceptions import BrowsingError, TargetingError
 from .protocols import Chainable
-from .questions import *  # noqa: F403
-from .resolutions import *  # noqa: F403
-from .target import Target
+
+if TYPE_CHECKING:
+    from . import abilities, actions, questions, resolutions  # noqa: F401
+    from .abilities import *  # noqa: F403
+    from .actions import *  # noqa: F403
+    from .questions import *  # noqa: F403
+    from .resolutions import *  # noqa: F403
+    from .target import Target  # noqa: F401
+
+# The Actions, Questions and Resolutions (and everything they import) are
+# only imported once one of their names is asked for, so importing the
+# package stays cheap. These must match each subpackage's __all__.
+LAZY_NAMES: dict[str, tuple[str, ...]] = {
+    "target": ("Target",),
+    "abilities": ("BrowseTheWeb",),
+    "actions": (
+        "AcceptAlert",
+        "AcceptsAlert",
+        "Chain",
+        "Chains",
+        "Clear",
+        "Clears",
+        "Click",
+        "Clicks",
+        "ContextClick",
+        "ContextClicks",
+        "DismissAlert",
+        "DismissesAlert",
+        "DoubleClick",
+        "DoubleClicks",
+        "Enter",
+        "Enter2FAToken",
+        "Enters",
+        "Enters2FAToken",
+        "FillForm",
+        "FillsForm",
+        "GoBack",
+        "GoForward",
+        "GoesBack",
+        "GoesForward",
+        "HoldDown",
+        "HoldsDown",
+        "Hover",
+        "Hovers",
+        "MoveMouse",
+        "MovesMouse",
+        "Open",
+        "Opens",
+        "Pause",
+        "Pauses",
+        "Press",
+        "Presses",
+        "Refresh",
+        "RefreshPage",
+        "Refreshes",
+        "RefreshesPage",
+        "Release",
+        "Releases",
+        "Reload",
+        "ReloadPage",
+        "Reloads",
+        "ReloadsPage",
+        "RespondToPrompt",
+        "RespondToThePrompt",
+        "RespondsToPrompt",
+        "RespondsToThePrompt",
+        "RightClick",
+        "RightClicks",
+        "SaveConsoleLog",
+        "SaveScreenshot",
+        "SavesConsoleLog",
+        "SavesScreenshot",
+        "Select",
+        "SelectByIndex",
+        "SelectByText",
+        "SelectByValue",
+        "Selects",
+        "SelectsByIndex",
+        "SelectsByText",
+        "SelectsByValue",
+        "SwitchTo",
+        "SwitchToTab",
+        "SwitchToWindow",
+        "SwitchesTo",
+        "SwitchesToTab",
+        "SwitchesToWindow",
+        "TakeScreenshot",
+        "TakesScreenshot",
+        "Visit",
+        "Visits",
+        "Wait",
+        "Waits",
+    ),
+    "questions": (
+        "Attribute",
+        "BrowserTitle",
+        "BrowserURL",
+        "Cookies",
+        "Element",
+        "List",
+        "Number",
+        "Selected",
+        "Table",
+        "Text",
+        "TextOfTheAlert",
+        "TheAttribute",
+        "TheBrowserTitle",
+        "TheBrowserURL",
+        "TheCookies",
+        "TheElement",
+        "TheList",
+        "TheNumber",
+        "TheSelected",
+        "TheTable",
+        "TheText",
+        "TheTextOfTheAlert",
+    ),
+    "resolutions": (
+        "AllClickable",
+        "AllDisplayed",
+        "AllEnabled",
+        "AllVisible",
+        "AnyDisplayed",
+        "AnyVisible",
+        "AreAllClickable",
+        "AreAllVisible",
+        "AreNoneVisible",
+        "Clickable",
+        "Displayed",
+        "Enabled",
+        "Exist",
+        "Exists",
+        "Invisible",
+        "IsAnyVisible",
+        "IsClickable",
+        "IsDisplayed",
+        "IsEnabled",
+        "IsInvisible",
+        "IsNotDisplayed",
+        "IsPresent",
+        "IsVisible",
+        "NoneDisplayed",
+        "NoneVisible",
+        "NotDisplayed",
+        "Present",
+        "Visible",
+    ),
+}
+LAZY_MODULES = {name: module for module, names in LAZY_NAMES.items() for name in names}
+SUBPACKAGES = ("abilities", "actions", "questions", "resolutions")
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    """Import the module which holds the name the first time it is asked for."""
+    if name in SUBPACKAGES:
+        return import_module(f".{name}", __name__)
+    if name in LAZY_MODULES:
+        value = getattr(import_module(f".{LAZY_MODULES[name]}", __name__), name)
+        globals()[name] = value
+        return value
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
+
+
+def __dir__() -> list[str]:
+    """List the lazily imported names along with everything already here."""
+    return sorted({*globals(), *SUBPACKAGES, *LAZY_MODULES})
+
 
 __all__ = [
     "BrowsingError",
     "Chainable",
-    "Target",
     "TargetingError",
     "settings",
 ]
 
-__all__ += abilities.__all__ + actions.__all__ + questions.__all__ + resolutions.__all__
+__all__ += list(LAZY_MODULES)
@@ -3,17 +3,28 @@
 from __future__ import annotations
 
 import os
-from typing import TYPE_CHECKING
+from contextlib import suppress
+from typing import TYPE_CHECKING, Callable, ClassVar
 
+from selenium.common.exceptions import WebDriverException
 from selenium.webdriver import Chrome, Firefox, Remote, Safari
 from selenium.webdriver.common.options import ArgOptions
 
+from ..browser_pool import BrowserPool
+from ..console_log import ConsoleLogCollector
+from ..element_cache import ElementCache
 from ..exceptions import BrowsingError
+from ..instrumentation import CommandLog
+from ..page_snapshot import PageSnapshot
+from ..screenshots import screenshot_writer
 
 if TYPE_CHECKING:
     from selenium.webdriver.remote.webdriver import WebDriver
     from typing_extensions import Self
 
+    from ..target import Target
+    from ..tracing import Tracer
+
 DEFAULT_APPIUM_HUB_URL = "http://localhost:4723/wd/hub"
 
 
@@ -29,24 +40,69 @@ class BrowseTheWeb:
         Perry = AnActor.named("Perry").who_can(
             BrowseTheWeb.using(driver)
         )
+
+        Perry = AnActor.named("Perry").who_can(
+            BrowseTheWeb.using_chrome().with_element_cache()
+        )
+
+        Perry = AnActor.named("Perry").who_can(
+            BrowseTheWeb.from_pool(pool)
+        )
+
+        Perry = AnActor.named("Perry").who_can(
+            BrowseTheWeb.using_chrome().with_command_log()
+        )
+        ...
+        print(Perry.ability_to(BrowseTheWeb).command_log.report())
+
+        # in your conftest.py, to have Chrome ready before it is needed
+        BrowseTheWeb.warm_up(Chrome)
+
+        # answer many Questions about these Targets with one round-trip
+        Perry.ability_to(BrowseTheWeb).take_snapshot(HEADER, PRICES, COUNTRY)
     """
 
     browser: WebDriver
+    element_cache: ElementCache | None
+    command_log: CommandLog | None
+    console_log: ConsoleLogCollector | None
+    pool: BrowserPool | None
+    snapshot: PageSnapshot | None
+    forgotten: bool
+    warm_pools: ClassVar[dict[Callable[[], WebDriver], BrowserPool]] = {}
+
+    @classmethod
+    def warm_up(
+        cls, start_browser: Callable[[], WebDriver], count: int | None = None
+    ) -> BrowserPool:
+        """Start browsers in the background, ready for the next Actor.
+
+        Afterwards, the matching ``using_*`` method (e.g. ``using_chrome`` for
+        ``Chrome``) leases one of these browsers instead of starting a new
+        one. Once every browser the pool can hold is leased, it starts a new
+        one which isn't pooled, as it would have without warming up.
+        ``count`` defaults to the ``BROWSER_WARM_UP`` setting.
+        """
+        if start_browser not in cls.warm_pools:
+            cls.warm_pools[start_browser] = BrowserPool(start_browser)
+        pool = cls.warm_pools[start_browser]
+        pool.warm_up(count)
+        return pool
 
     @classmethod
     def using_chrome(cls) -> Self:
         """Create and use a default Chrome Selenium webdriver instance."""
-        return cls.using(browser=Chrome())
+        return cls._using_warm_or_new(Chrome)
 
     @classmethod
     def using_firefox(cls) -> Self:
         """Create and use a default Firefox Selenium webdriver instance."""
-        return cls.using(browser=Firefox())
+        return cls._using_warm_or_new(Firefox)
 
     @classmethod
     def using_safari(cls) -> Self:
         """Create and use a default Safari Selenium webdriver instance."""
-        return cls.using(browser=Safari())
+        return cls._using_warm_or_new(Safari)
 
     @classmethod
     def using_ios(cls) -> Self:
@@ -129,9 +185,107 @@ class BrowseTheWeb:
         """Provide an already-set-up WebDriver to use to browse the web."""
         return cls(browser=browser)
 
+    @classmethod
+    def from_pool(cls, pool: BrowserPool) -> Self:
+        """Lease an already-started browser from a BrowserPool.
+
+        When the Actor forgets this Ability, the browser is reset and given
+        back to the pool instead of being quit.
+        """
+        ability = cls.using(browser=pool.lease())
+        ability.pool = pool
+        return ability
+
+    @classmethod
+    def _using_warm_or_new(cls, start_browser: Callable[[], WebDriver]) -> Self:
+        """Lease a warmed-up browser, if there are any, or start a new one."""
+        pool = cls.warm_pools.get(start_browser)
+        if pool is not None:
+            # if the pool is full, this Actor gets a browser of its own
+            with suppress(BrowsingError):
+                return cls.from_pool(pool)
+        return cls.using(browser=start_browser())
+
+    def with_element_cache(self) -> Self:
+        """Reuse the elements found by Targets until the page changes.
+
+        Navigating, switching windows or frames, clicking, typing, running a
+        script which might change the page, or encountering a stale element
+        reference will clear the cache. A remembered element which has gone
+        stale is found again.
+        """
+        if self.element_cache is None:
+            self.element_cache = ElementCache()
+            self.element_cache.watch(self.browser)
+        return self
+
+    def with_command_log(self) -> Self:
+        """Record every WebDriver command, tagged with the step which sent it.
+
+        See :class:`~screenpy_selenium.instrumentation.CommandLog` for how to
+        read the records.
+        """
+        if self.command_log is None:
+            self.command_log = CommandLog()
+            self.command_log.watch(self.browser)
+        return self
+
+    def with_console_log(self, path: str | None = None) -> Self:
+        """Collect the browser's console log every so often during the test.
+
+        Otherwise, older entries can be lost before SaveConsoleLog reads them.
+        If a path is given, every entry is also appended to that file.
+
+        Raises:
+            BrowsingError: if the browser can't give its console log.
+        """
+        if self.console_log is None:
+            self.console_log = ConsoleLogCollector(self.browser, path)
+            self.console_log.watch()
+        return self
+
+    def with_tracer(self, tracer: Tracer) -> Self:
+        """Record every WebDriver command as a span in the Tracer's timeline."""
+        tracer.watch(self.browser)
+        return self
+
+    def take_snapshot(self, *targets: Target) -> PageSnapshot:
+        """Read the page and what the Targets find, to answer Questions from.
+
+        Until the browser is sent a command which might change the page, the
+        Questions which can are answered from this snapshot instead. See
+        :class:`~screenpy_selenium.page_snapshot.PageSnapshot` for which.
+        """
+        self.snapshot = PageSnapshot.take(self.browser, targets)
+        self.snapshot.watch(self.browser)
+        return self.snapshot
+
     def forget(self) -> None:
-        """Quit the attached browser."""
-        self.browser.quit()
+        """Quit the attached browser, or give it back to its pool.
+
+        The console log is collected one last time first. Afterwards, any of
+        this Ability's screenshots still being written in the background are
+        finished, even if the browser could not be quit. Forgetting it again
+        does nothing, so a pooled browser is never given back twice.
+        """
+        if self.forgotten:
+            return
+        self.forgotten = True
+        self.snapshot = None
+        try:
+            if self.console_log is not None:
+                with suppress(AttributeError, WebDriverException):
+                    self.console_log.collect()
+            if self.element_cache is not None:
+                self.element_cache.clear()
+            if self.pool is None:
+                self.browser.quit()
+            else:
+                if self.element_cache is not None:
+                    self.element_cache.unwatch(self.browser)
+                self.pool.release(self.browser)
+        finally:
+            screenshot_writer.flush(self)
 
     def __repr__(self) -> str:
         """Repr."""
@@ -141,3 +295,9 @@ class BrowseTheWeb:
 
     def __init__(self, browser: WebDriver) -> None:
         self.browser = browser
+        self.element_cache = None
+        self.command_log = None
+        self.console_log = None
+        self.pool = None
+        self.forgotten = False
+        self.snapshot = None
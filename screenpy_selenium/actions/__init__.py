@@ -8,6 +8,7 @@ from .dismiss_alert import DismissAlert
 from .double_click import DoubleClick
 from .enter import Enter
 from .enter_2fa_token import Enter2FAToken
+from .fill_form import FillForm
 from .go_back import GoBack
 from .go_forward import GoForward
 from .hold_down import HoldDown
@@ -36,6 +37,7 @@ DismissTheAlert = DismissesTheAlert = DismissAlert
 DoubleClicks = DoubleClick
 Enters = Enter
 Enters2FAToken = Enter2FAToken
+FillsForm = FillForm
 GoesBack = GoBack
 GoesForward = GoForward
 HoldsDown = HoldDown
@@ -84,6 +86,8 @@ __all__ = [
     "Enter2FAToken",
     "Enters",
     "Enters2FAToken",
+    "FillForm",
+    "FillsForm",
     "GoBack",
     "GoForward",
     "GoesBack",
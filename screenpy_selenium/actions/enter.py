@@ -9,6 +9,7 @@ from screenpy.exceptions import DeliveryError, UnableToAct
 from screenpy.pacing import aside, beat
 from screenpy.speech_tools import represent_prop
 from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.common.keys import Keys
 
 from ..common import pos_args_deprecated
 from ..speech_tools import KEY_NAMES
@@ -20,6 +21,9 @@ if TYPE_CHECKING:
 
     from ..target import Target
 
+MODIFIER_KEYS = {Keys.ALT, Keys.COMMAND, Keys.CONTROL, Keys.META, Keys.SHIFT}
+"""Keys which stay held down until the end of the ``send_keys`` call."""
+
 
 class Enter:
     """Enter text into an input field, or press specific keys.
@@ -27,17 +31,31 @@ class Enter:
     Abilities Required:
         :class:`~screenpy_selenium.abilities.BrowseTheWeb`
 
+    The text and any following keys are sent together in as few commands as
+    possible. A modifier key (like |Keys|.SHIFT) stays held until the end of
+    the command it was sent in, so the keys after one are sent in another.
+    Use :meth:`~screenpy_selenium.actions.Enter.one_key_at_a_time` to send
+    each following key in its own command instead.
+
     Examples::
 
         the_actor.attempts_to(
             Enter.the_text("Hello world!").into_the(COMMENT_FIELD)
         )
+
+        the_actor.attempts_to(
+            Enter.the_text("hunter2")
+            .into_the(PASSWORD_FIELD)
+            .then_hit(Keys.ENTER)
+            .one_key_at_a_time()
+        )
     """
 
     target: Target | None
     following_keys: list[str]
     text: str
     mask: bool
+    separately: bool
 
     @classmethod
     def the_text(cls, text: str) -> Self:
@@ -110,6 +128,11 @@ class Enter:
         """Alias for :meth:`~screenpy_selenium.actions.Enter.then_hit`."""
         return self.then_hit(*keys)
 
+    def one_key_at_a_time(self) -> Self:
+        """Send each following key in its own command, for touchy pages."""
+        self.separately = True
+        return self
+
     @property
     def text_to_log(self) -> str:
         """Get a proper representation of the text."""
@@ -138,10 +161,16 @@ class Enter:
         element = self.target.found_by(the_actor)
 
         try:
-            element.send_keys(self.text)
+            pending = [self.text]
             for key in self.following_keys:
+                if self.separately or any(
+                    modifier in keys for keys in pending for modifier in MODIFIER_KEYS
+                ):
+                    element.send_keys(*pending)
+                    pending = []
                 aside(f"then hits the {KEY_NAMES[key]} key")
-                element.send_keys(key)
+                pending.append(key)
+            element.send_keys(*pending)
         except WebDriverException as e:
             msg = (
                 "Encountered an issue while attempting to enter text into "
@@ -168,3 +197,4 @@ class Enter:
         self.target = None
         self.following_keys = []
         self.mask = mask
+        self.separately = False
@@ -0,0 +1,150 @@
+"""Fill in many fields of a form at once."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from screenpy.exceptions import DeliveryError
+from screenpy.pacing import beat
+from selenium.common.exceptions import WebDriverException
+
+from ..abilities import BrowseTheWeb
+from ..exceptions import TargetingError
+from ..scripts import FILL_FIELDS, SCRIPTABLE_STRATEGIES
+from ..target import Target
+
+if TYPE_CHECKING:
+    from screenpy import Actor
+    from typing_extensions import Self
+
+
+class FillForm:
+    """Fill in many fields of a form, finding all of them in one go.
+
+    Each field's value is replaced, rather than added to. By default, every
+    field is found with a single call to the browser, then each field is
+    cleared and its new value typed in. (This differs from
+    :class:`~screenpy_selenium.actions.Enter`, which types after whatever is
+    already in the field.)
+
+    With :meth:`using_script`, every field's value is set by one script
+    instead, which also fires each field's ``input`` and ``change`` events.
+    This is much faster, but no keys are pressed, so anything listening for
+    key events will not hear them. Fields with a locator the script cannot
+    use are filled in by typing.
+
+    Only the fields' names are logged, never the values, since some of them
+    are probably secret.
+
+    Abilities Required:
+        :class:`~screenpy_selenium.abilities.BrowseTheWeb`
+
+    Examples::
+
+        the_actor.attempts_to(
+            FillForm({FIRST_NAME_FIELD: "Perry", LAST_NAME_FIELD: "Goy"})
+        )
+
+        the_actor.attempts_to(FillForm(SHIPPING_DETAILS).using_script())
+    """
+
+    fields: dict[Target, str]
+    scripted: bool
+
+    @classmethod
+    def with_the(cls, fields: dict[Target, str]) -> Self:
+        """Provide the value to fill in for each Target.
+
+        Aliases:
+            * :meth:`~screenpy_selenium.actions.FillForm.with_`
+        """
+        return cls(fields=fields)
+
+    @classmethod
+    def with_(cls, fields: dict[Target, str]) -> Self:
+        """Alias for :meth:`~screenpy_selenium.actions.FillForm.with_the`."""
+        return cls.with_the(fields=fields)
+
+    def using_script(self) -> Self:
+        """Set every value with one script, instead of typing each one."""
+        self.scripted = True
+        return self
+
+    @property
+    def field_names(self) -> str:
+        """Get the names of the fields being filled in."""
+        return ", ".join(str(target) for target in self.fields)
+
+    def describe(self) -> str:
+        """Describe the Action in present tense."""
+        return f"Fill in the {self.field_names}."
+
+    @beat("{} fills in the {field_names}.")
+    def perform_as(self, the_actor: Actor) -> None:
+        """Direct the Actor to fill in every field."""
+        fields = list(self.fields.items())
+        if self.scripted:
+            fields = self.fill_by_script(the_actor, fields)
+        if fields:
+            self.fill_by_typing(the_actor, fields)
+
+    def fill_by_script(
+        self, the_actor: Actor, fields: list[tuple[Target, str]]
+    ) -> list[tuple[Target, str]]:
+        """Set the values of all the scriptable fields in one script.
+
+        Returns:
+            The fields which could not be filled in by the script.
+        """
+        locators = [target.get_locator() for target, _ in fields]
+        scripted = [
+            i for i, (using, _) in enumerate(locators) if using in SCRIPTABLE_STRATEGIES
+        ]
+        if not scripted:
+            return fields
+
+        browser = the_actor.ability_to(BrowseTheWeb).browser
+        try:
+            results = browser.execute_script(
+                FILL_FIELDS, [[*locators[i], fields[i][1]] for i in scripted]
+            )
+        except WebDriverException:
+            # the fields can still be typed into
+            return fields
+
+        for i, result in zip(scripted, results):
+            target = fields[i][0]
+            if result == "not found":
+                msg = f"Could not find the {target} to fill in."
+                raise TargetingError(msg)
+            if result is not None:
+                msg = (
+                    "Encountered an issue while attempting to fill in "
+                    f"{target}: {result}"
+                )
+                raise DeliveryError(msg)
+        return [field for i, field in enumerate(fields) if i not in scripted]
+
+    def fill_by_typing(
+        self, the_actor: Actor, fields: list[tuple[Target, str]]
+    ) -> None:
+        """Find all the fields in one go, then clear and type into each one."""
+        targets = [target for target, _ in fields]
+        elements = Target.resolve_all(the_actor, *targets)
+        for (target, value), element in zip(fields, elements):
+            if element is None:
+                msg = f"Could not find the {target} to fill in."
+                raise TargetingError(msg)
+            try:
+                element.clear()
+                element.send_keys(value)
+            except WebDriverException as e:
+                msg = (
+                    "Encountered an issue while attempting to fill in "
+                    f"{target}: {e.__class__.__name__}"
+                )
+                raise DeliveryError(msg) from e
+
+    def __init__(self, fields: dict[Target, str]) -> None:
+        self.fields = fields
+        self.scripted = False
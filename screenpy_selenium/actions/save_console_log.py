@@ -22,6 +22,11 @@ class SaveConsoleLog:
     the Actor's browser to enable the console log (e.g. setting
     ``capabilities["goog:loggingPrefs"] = {"browser": "ALL"}``.)
 
+    If the Actor's BrowseTheWeb Ability is collecting the console log (see
+    :meth:`~screenpy_selenium.abilities.BrowseTheWeb.with_console_log`), the
+    collected entries are saved, including those from before any previous
+    save.
+
     Use the :meth:`~screenpy_selenium.actions.SaveConsoleLog.and_attach_it`
     method to indicate that this text file should be attached to all reports
     through the Narrator's adapters. This method also accepts any keyword
@@ -79,8 +84,13 @@ class SaveConsoleLog:
     @beat("{} saves their browser's console log as {filename}")
     def perform_as(self, the_actor: Actor) -> None:
         """Direct the actor to save their browser's console log."""
-        browser = the_actor.ability_to(BrowseTheWeb).browser
-        js_log = "\n".join([str(entry) for entry in browser.get_log("browser")])
+        browse_the_web = the_actor.ability_to(BrowseTheWeb)
+        if browse_the_web.console_log is not None:
+            browse_the_web.console_log.collect()
+            js_log = "\n".join(browse_the_web.console_log.entries)
+        else:
+            browser = browse_the_web.browser
+            js_log = "\n".join([str(entry) for entry in browser.get_log("browser")])
 
         with open(self.path, "w+", encoding="utf-8") as js_log_file:
             js_log_file.write(js_log)
@@ -9,11 +9,20 @@ from screenpy.actions import AttachTheFile
 from screenpy.pacing import beat
 
 from ..abilities import BrowseTheWeb
+from ..configuration import settings
+from ..screenshots import (
+    crop_screenshot,
+    save_screenshot,
+    screenshot_path,
+    screenshot_writer,
+)
 
 if TYPE_CHECKING:
     from screenpy import Actor
     from typing_extensions import Self
 
+    from ..target import Target
+
 
 class SaveScreenshot:
     """Save a screenshot from the actor's browser.
@@ -23,6 +32,15 @@ class SaveScreenshot:
     through the Narrator's adapters. This method also accepts any keyword
     arguments those adapters might require.
 
+    If the ``BACKGROUND_SCREENSHOTS`` setting is on, the screenshot is written
+    on a background thread. Screenshots which are attached are still written
+    before they are attached. The ``DEDUPLICATE_SCREENSHOTS`` and
+    ``SCREENSHOT_FORMAT`` settings can make them smaller to store.
+
+    Use :meth:`~screenpy_selenium.actions.SaveScreenshot.of_the` to capture
+    only one element, which the browser can do faster than the whole page.
+    Cropping and downscaling (which need Pillow) happen after capture.
+
     Abilities Required:
         :class:`~screenpy_selenium.abilities.BrowseTheWeb`
 
@@ -32,6 +50,12 @@ class SaveScreenshot:
 
         the_actor.attempts_to(SaveScreenshot.as_(filepath))
 
+        the_actor.attempts_to(SaveScreenshot.as_(filepath).of_the(LOGIN_FORM))
+
+        the_actor.attempts_to(
+            SaveScreenshot.as_(filepath).cropped_to(0, 0, 800, 600).downscaled(2)
+        )
+
         # attach file to the Narrator's reports (behavior depends on adapter).
         the_actor.attempts_to(SaveScreenshot.as_(filepath).and_attach_it())
 
@@ -47,10 +71,20 @@ class SaveScreenshot:
     attach_kwargs: dict | None
     path: str
     filename: str
+    target: Target | None
+    region: tuple[int, int, int, int] | None
+    factor: float
+
+    @property
+    def screenshot_of(self) -> str:
+        """Describe what the screenshot is of, if it is not the whole page."""
+        if self.target is None:
+            return ""
+        return f" of the {self.target}"
 
     def describe(self) -> str:
         """Describe the Action in present tense."""
-        return f"Save screenshot as {self.filename}"
+        return f"Save screenshot{self.screenshot_of} as {self.filename}"
 
     @classmethod
     def as_(cls, path: str) -> Self:
@@ -72,19 +106,55 @@ class SaveScreenshot:
 
     and_attach_it_with = and_attach_it
 
-    @beat("{} saves a screenshot as {filename}")
+    def of_the(self, target: Target) -> Self:
+        """Capture only the element, instead of the whole page."""
+        self.target = target
+        return self
+
+    of = of_the
+
+    def cropped_to(self, x: int, y: int, width: int, height: int) -> Self:
+        """Crop the screenshot to this region, in the screenshot's pixels."""
+        self.region = (x, y, width, height)
+        return self
+
+    def downscaled(self, factor: float) -> Self:
+        """Shrink the screenshot's width and height by this factor.
+
+        For example, ``downscaled(2)`` saves the screenshot at half its width
+        and half its height.
+        """
+        self.factor = factor
+        return self
+
+    @beat("{} saves a screenshot{screenshot_of} as {filename}")
     def perform_as(self, the_actor: Actor) -> None:
         """Direct the actor to save a screenshot."""
-        browser = the_actor.ability_to(BrowseTheWeb).browser
-        screenshot = browser.get_screenshot_as_png()
+        browse_the_web = the_actor.ability_to(BrowseTheWeb)
+        if self.target is None:
+            screenshot = browse_the_web.browser.get_screenshot_as_png()
+        else:
+            screenshot = self.target.found_by(the_actor).screenshot_as_png
+
+        if self.region is not None or self.factor != 1:
+            screenshot = crop_screenshot(screenshot, self.region, self.factor)
+
+        path = screenshot_path(self.path)
 
-        with open(self.path, "wb+") as screenshot_file:
-            screenshot_file.write(screenshot)
+        if settings.BACKGROUND_SCREENSHOTS:
+            written = screenshot_writer.write(path, screenshot, browse_the_web)
+            if self.attach_kwargs is not None:
+                written.result()
+        else:
+            save_screenshot(path, screenshot)
 
         if self.attach_kwargs is not None:
-            the_actor.attempts_to(AttachTheFile(self.path, **self.attach_kwargs))
+            the_actor.attempts_to(AttachTheFile(path, **self.attach_kwargs))
 
     def __init__(self, path: str) -> None:
         self.path = path
         self.filename = path.split(os.path.sep)[-1]
         self.attach_kwargs = None
+        self.target = None
+        self.region = None
+        self.factor = 1
@@ -9,19 +9,48 @@ from screenpy.pacing import beat
 from selenium.common.exceptions import WebDriverException
 from selenium.webdriver.support.ui import Select as SeleniumSelect
 
+from ..abilities import BrowseTheWeb
+from ..configuration import settings
+from ..scripts import SELECT_OPTION
+
 if TYPE_CHECKING:
     from screenpy import Actor
+    from selenium.webdriver.remote.webelement import WebElement
     from typing_extensions import Self
 
     from ..target import Target
 
 
+def select_in_page(
+    the_actor: Actor, element: WebElement, how: str, option: int | str
+) -> bool:
+    """Select the option with a single script, if ``SCRIPTED_SELECT`` is on.
+
+    Returns:
+        True if the option was selected. False means Selenium's ``Select``
+        should be used instead, which will also raise the right error if
+        there is no such option.
+    """
+    if not settings.SCRIPTED_SELECT:
+        return False
+
+    browser = the_actor.ability_to(BrowseTheWeb).browser
+    try:
+        return browser.execute_script(SELECT_OPTION, element, how, str(option)) is True
+    except WebDriverException:
+        return False
+
+
 class Select:
     """Select an option from a dropdown menu.
 
     This is an entry point that will create the correct specific Select Action
     to be used, depending on how the option needs to be selected.
 
+    If the ``SCRIPTED_SELECT`` setting is on, the option is found and selected
+    by a single script run in the page, which is much faster for dropdowns
+    with thousands of options.
+
     Abilities Required:
         :class:`~screenpy_selenium.abilities.BrowseTheWeb`
 
@@ -91,6 +120,9 @@ class SelectByText:
             raise UnableToAct(msg)
 
         element = self.target.found_by(the_actor)
+        if select_in_page(the_actor, element, "text", self.text):
+            return
+
         select = SeleniumSelect(element)
         try:
             select.select_by_visible_text(self.text)
@@ -141,6 +173,9 @@ class SelectByIndex:
             raise UnableToAct(msg)
 
         element = self.target.found_by(the_actor)
+        if select_in_page(the_actor, element, "index", self.index):
+            return
+
         select = SeleniumSelect(element)
         try:
             select.select_by_index(self.index)
@@ -191,6 +226,9 @@ class SelectByValue:
             raise UnableToAct(msg)
 
         element = self.target.found_by(the_actor)
+        if select_in_page(the_actor, element, "value", self.value):
+            return
+
         select = SeleniumSelect(element)
         try:
             select.select_by_value(self.value)
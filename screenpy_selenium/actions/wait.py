@@ -2,24 +2,172 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Callable, Iterable
+import random
+import time
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator
 
 from screenpy import settings
 from screenpy.exceptions import DeliveryError
-from screenpy.pacing import beat
-from selenium.common.exceptions import WebDriverException
+from screenpy.pacing import aside, beat
+from selenium.common.exceptions import (
+    InvalidSelectorException,
+    NoSuchElementException,
+    StaleElementReferenceException,
+    TimeoutException,
+    WebDriverException,
+)
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
+from .. import tracing
 from ..abilities import BrowseTheWeb
+from ..configuration import settings as selenium_settings
+from ..scripts import ARE_DISPLAYED, SCRIPTABLE_STRATEGIES, WAIT_FOR_CONDITION
 
 if TYPE_CHECKING:
     from screenpy import Actor
+    from selenium.webdriver.remote.webdriver import WebDriver
     from typing_extensions import Self
 
     from ..target import Target
 
 
+class CompoundCondition:
+    """Check several conditions in each poll, sharing one deadline.
+
+    Conditions can be Targets, which are met when their element is visible,
+    or callables like Selenium's Expected Conditions, which are given the
+    driver. All the Targets are checked with one script each poll.
+    """
+
+    conditions: tuple[Any, ...]
+    met: list[bool]
+
+    @property
+    def names(self) -> list[str]:
+        """Get a human-readable name for each condition."""
+        return [self.name_of(condition) for condition in self.conditions]
+
+    @staticmethod
+    def name_of(condition: Any) -> str:  # noqa: ANN401
+        """Name a Target, or an Expected Condition by its function name."""
+        if not callable(condition):
+            return str(condition)
+        qualname = getattr(condition, "__qualname__", repr(condition))
+        return qualname.split(".<locals>")[0]
+
+    @property
+    def unmet(self) -> list[str]:
+        """Get the names of the conditions which were not met last time."""
+        return [name for name, met in zip(self.names, self.met) if not met]
+
+    def evaluate(self, driver: WebDriver) -> list[bool]:
+        """Check every condition, remembering which ones were met."""
+        met = [False] * len(self.conditions)
+        scripted, individual = [], []
+        for i, condition in enumerate(self.conditions):
+            if callable(condition):
+                individual.append(i)
+            elif next(iter(condition)) in SCRIPTABLE_STRATEGIES:
+                scripted.append(i)
+            else:
+                individual.append(i)
+
+        if scripted:
+            locators = [list(self.conditions[i]) for i in scripted]
+            results = driver.execute_script(ARE_DISPLAYED, locators)
+            for i, result in zip(scripted, results):
+                if isinstance(result, dict):
+                    msg = f"{result['error']} while looking for {self.conditions[i]}."
+                    raise InvalidSelectorException(msg)
+                met[i] = bool(result)
+
+        for i in individual:
+            condition = self.conditions[i]
+            if not callable(condition):
+                condition = EC.visibility_of_element_located(condition)
+            try:
+                met[i] = bool(condition(driver))
+            except (NoSuchElementException, StaleElementReferenceException):
+                met[i] = False
+
+        self.met = met
+        return met
+
+    def __init__(self, *conditions: Any) -> None:  # noqa: ANN401
+        self.conditions = conditions
+        self.met = [False] * len(conditions)
+
+
+class AllOf(CompoundCondition):
+    """Met once all of the conditions are met in the same poll."""
+
+    def __call__(self, driver: WebDriver) -> bool:
+        """Check the conditions."""
+        return all(self.evaluate(driver))
+
+
+class AnyOf(CompoundCondition):
+    """Met once any of the conditions is met, giving back its name."""
+
+    def __call__(self, driver: WebDriver) -> str | bool:
+        """Check the conditions."""
+        for name, met in zip(self.names, self.evaluate(driver)):
+            if met:
+                return name
+        return False
+
+
+class BackoffWait(WebDriverWait):
+    """A WebDriverWait which polls quickly at first, then less and less often.
+
+    The first interval is ``BACKOFF_POLLING_START`` seconds, and each one
+    after grows by ``BACKOFF_POLLING_FACTOR`` until it reaches
+    ``BACKOFF_POLLING_MAX``. Each interval is shortened by a random amount of
+    up to a quarter, so many waiting Actors do not poll in lockstep.
+    """
+
+    JITTER = 0.25
+
+    @staticmethod
+    def intervals() -> Iterator[float]:
+        """Generate the polling intervals."""
+        interval = selenium_settings.BACKOFF_POLLING_START
+        while True:
+            yield interval * (1 - random.uniform(0, BackoffWait.JITTER))
+            interval = min(
+                interval * selenium_settings.BACKOFF_POLLING_FACTOR,
+                selenium_settings.BACKOFF_POLLING_MAX,
+            )
+
+    def until(
+        self, method: Callable[[Any], Any], message: str = ""
+    ) -> Any:  # noqa: ANN401
+        """Wait until the method returns a truthy value, backing off.
+
+        Raises:
+            TimeoutException: if the method did not return a truthy value
+                within the timeout.
+        """
+        screen = None
+        stacktrace = None
+
+        end_time = time.monotonic() + self._timeout
+        for interval in self.intervals():
+            try:
+                value = method(self._driver)
+                if value:
+                    return value
+            except self._ignored_exceptions as exc:
+                screen = getattr(exc, "screen", None)
+                stacktrace = getattr(exc, "stacktrace", None)
+            remaining = end_time - time.monotonic()
+            if remaining <= 0:
+                break
+            time.sleep(min(interval, remaining))
+        raise TimeoutException(message, screen, stacktrace)
+
+
 class Wait:
     """Wait for the application to fulfill a given condition.
 
@@ -49,11 +197,20 @@ class Wait:
                 cookies_to_contain, "for a cookie that has {0}"
             ).with_("delicious=true")
         )
+
+        the_actor.attempts_to(Wait.for_the(SEARCH_RESULTS).to_appear().reactively())
+
+        the_actor.attempts_to(
+            Wait.for_all(HEADER, SIDEBAR, EC.title_contains("Dashboard"))
+        )
+
+        the_actor.attempts_to(Wait.for_any(ERROR_BANNER, SUCCESS_BANNER))
     """
 
     args: Iterable[Any]
     timeout: float
     log_detail: str | None
+    reactive: bool
 
     @classmethod
     def for_the(cls, target: Target) -> Self:
@@ -69,6 +226,41 @@ class Wait:
         """Alias for :meth:`~screenpy_selenium.actions.Wait.for_the`."""
         return cls.for_the(target=target)
 
+    @classmethod
+    def for_all(cls, *conditions: Any) -> Self:  # noqa: ANN401
+        """Wait for all the Targets to appear and all the conditions to be met.
+
+        Conditions can be Targets or Expected Conditions (e.g.
+        ``EC.title_contains("Welcome")``). They are all checked in each poll,
+        within one shared timeout, and the Targets are checked together in a
+        single script. If the Wait times out, the unmet conditions are named.
+        """
+        return (
+            cls(seconds=settings.TIMEOUT)
+            .using(AllOf, cls._compound_log_detail("all", conditions))
+            .with_(*conditions)
+        )
+
+    @classmethod
+    def for_any(cls, *conditions: Any) -> Self:  # noqa: ANN401
+        """Wait for any of the Targets to appear or any condition to be met.
+
+        Works like :meth:`~screenpy_selenium.actions.Wait.for_all`, and the
+        condition which was met first is named in the log.
+        """
+        return (
+            cls(seconds=settings.TIMEOUT)
+            .using(AnyOf, cls._compound_log_detail("any", conditions))
+            .with_(*conditions)
+        )
+
+    @staticmethod
+    def _compound_log_detail(quantity: str, conditions: Iterable[Any]) -> str:
+        """Describe a compound condition, escaped for ``str.format``."""
+        names = ", ".join(CompoundCondition.name_of(c) for c in conditions)
+        names = names.replace("{", "{{").replace("}", "}}")
+        return f"for {quantity} of: {names}..."
+
     def seconds_for_the(self, target: Target) -> Self:
         """Set the Target to wait for, after changing the default timeout."""
         self.args = [target]
@@ -120,6 +312,21 @@ class Wait:
             EC.text_to_be_present_in_element, 'for "{1}" to appear in the {0}...'
         ).with_(*self.args, text)
 
+    def reactively(self) -> Self:
+        """Wait for the page to change, rather than asking over and over.
+
+        A MutationObserver is installed in the page, and the Actor is told as
+        soon as the condition is met. This only works for the
+        :meth:`~screenpy_selenium.actions.Wait.to_appear`,
+        :meth:`~screenpy_selenium.actions.Wait.to_be_clickable`,
+        :meth:`~screenpy_selenium.actions.Wait.to_disappear`, and
+        :meth:`~screenpy_selenium.actions.Wait.to_contain_text` strategies;
+        other strategies, or a page which cannot run asynchronous scripts,
+        fall back to polling.
+        """
+        self.reactive = True
+        return self
+
     @property
     def log_message(self) -> str:
         """Format the nice log message, or give back the default."""
@@ -136,18 +343,87 @@ class Wait:
     def perform_as(self, the_actor: Actor) -> None:
         """Direct the Actor to wait for the condition to be satisfied."""
         browser = the_actor.ability_to(BrowseTheWeb).browser
+        condition = self.condition(*self.args)
+        timeout = self.timeout
 
         try:
-            WebDriverWait(browser, self.timeout, settings.POLLING).until(
-                self.condition(*self.args)
-            )
+            if self.reactive:
+                started = time.monotonic()
+                if self._wait_reactively(browser):
+                    return
+                timeout = max(self.timeout - (time.monotonic() - started), 0)
+            poll = condition
+            if tracing.active_tracer is not None:
+                poll = tracing.active_tracer.traced(
+                    condition, f"poll {self.condition.__name__}", "poll"
+                )
+            waiter = BackoffWait if selenium_settings.BACKOFF_POLLING else WebDriverWait
+            result = waiter(browser, timeout, settings.POLLING).until(poll)
         except WebDriverException as e:
             msg = (
                 f"Encountered an exception using {self.condition.__name__} with "
                 f"[{', '.join(map(str, self.args))}]: {e.__class__.__name__}"
             )
+            if isinstance(condition, CompoundCondition):
+                msg += f". Unmet: {', '.join(condition.unmet)}"
             raise DeliveryError(msg) from e
 
+        if isinstance(condition, AnyOf):
+            aside(f"the {result} came through first")
+
+    def _wait_reactively(self, browser: WebDriver) -> bool:
+        """Wait for the condition inside the page.
+
+        Returns:
+            True if the condition was met. False if it could not be watched
+            for, in which case the caller should fall back to polling.
+
+        Raises:
+            TimeoutException: if the condition was not met in time.
+        """
+        reactive_conditions = {
+            EC.visibility_of_element_located: "appear",
+            EC.element_to_be_clickable: "clickable",
+            EC.invisibility_of_element_located: "disappear",
+            EC.text_to_be_present_in_element: "contain text",
+        }
+        condition = reactive_conditions.get(self.condition)
+        args = list(self.args)
+        if condition is None or not args:
+            return False
+        try:
+            using, value = args[0]
+        except (TypeError, ValueError):
+            return False
+        if using not in SCRIPTABLE_STRATEGIES:
+            return False
+        text = args[1] if condition == "contain text" and len(args) > 1 else ""
+
+        try:
+            script_timeout = browser.timeouts.script
+            browser.set_script_timeout(self.timeout + 1)
+            try:
+                result = browser.execute_async_script(
+                    WAIT_FOR_CONDITION,
+                    using,
+                    value,
+                    condition,
+                    text,
+                    int(self.timeout * 1000),
+                    int(settings.POLLING * 1000),
+                )
+            finally:
+                browser.set_script_timeout(script_timeout)
+        except WebDriverException:
+            return False
+
+        if result is True:
+            return True
+        if result is False:
+            msg = f"Condition was not met after {self.timeout} seconds."
+            raise TimeoutException(msg)
+        return False
+
     def __init__(
         self, seconds: float | None = None, args: Iterable[Any] | None = None
     ) -> None:
@@ -155,3 +431,4 @@ class Wait:
         self.timeout = seconds if seconds is not None else settings.TIMEOUT
         self.condition = EC.visibility_of_element_located
         self.log_detail = None
+        self.reactive = False
@@ -0,0 +1,337 @@
+"""
+Lend out browsers which have already started.
+
+Starting a browser takes seconds, and much longer on a remote grid. A pool
+keeps its browsers running between Actors, resetting each one when it is
+returned instead of quitting it.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from typing import TYPE_CHECKING, Any, Callable
+
+from selenium.common.exceptions import WebDriverException
+
+from .configuration import settings
+from .exceptions import BrowsingError
+from .scripts import CLEAR_STORAGE
+
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
+
+
+def is_responsive(browser: WebDriver) -> bool:
+    """Check that the browser still answers commands."""
+    try:
+        browser.current_window_handle  # noqa: B018
+    except WebDriverException:
+        return False
+    return True
+
+
+def reset(browser: WebDriver) -> None:
+    """Put the browser back the way it was when it started.
+
+    Closes every window but the first, clears the cookies and storage of the
+    page it was on, then goes to ``about:blank``. WebDriver can only clear the
+    current domain's cookies, so Chromium browsers are also told to clear
+    every domain's cookies and storage through the DevTools protocol. Other
+    browsers keep what other domains (like a single sign-on page) left behind.
+    """
+    first_window, *other_windows = browser.window_handles
+    for window in other_windows:
+        browser.switch_to.window(window)
+        browser.close()
+    browser.switch_to.window(first_window)
+    browser.delete_all_cookies()
+    browser.execute_script(CLEAR_STORAGE)
+    if hasattr(browser, "execute_cdp_cmd"):
+        browser.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        browser.execute_cdp_cmd(
+            "Storage.clearDataForOrigin", {"origin": "*", "storageTypes": "all"}
+        )
+    browser.get("about:blank")
+
+
+class BrowserPool:
+    """Start browsers on demand and lend them out, reusing returned ones.
+
+    The size of the pool, how many times each browser can be reused, how
+    long a browser can sit idle, and how long a lease waits for a warming
+    browser default to the ``BROWSER_POOL_SIZE``, ``BROWSER_POOL_MAX_USES``,
+    ``BROWSER_IDLE_TIMEOUT``, and ``BROWSER_LEASE_TIMEOUT`` settings. Idle
+    browsers are checked with the ``health_check`` before they are lent out
+    again; unhealthy ones are quit and replaced. Browsers which have been
+    idle too long are quit in the background, and replaced if the pool is
+    warmed up.
+
+    Returned browsers are put back with :func:`reset`, or the ``reset``
+    given. Outside of Chromium, it can't clear the cookies and storage of
+    domains other than the one the browser was last on, so an Actor may find
+    itself still logged in somewhere. Pass a ``reset`` which logs out, or
+    clears those domains, if that matters to your tests.
+
+    Browsers can also be started ahead of time, in the background, with
+    :meth:`warm_up`.
+
+    Examples::
+
+        pool = BrowserPool(Chrome)
+
+        Perry = AnActor.named("Perry").who_can(BrowseTheWeb.from_pool(pool))
+
+        pool = BrowserPool(lambda: Firefox(options=opts), max_size=2)
+        pool.warm_up(2)
+
+        pool = BrowserPool(Firefox, reset=log_out_and_reset)
+
+        # at the end of the suite
+        pool.close()
+    """
+
+    idle: list[WebDriver]
+    idle_since: dict[WebDriver, float]
+    uses: dict[WebDriver, int]
+    command_executors: dict[WebDriver, Any]
+    executor: ThreadPoolExecutor | None
+    retirement: threading.Timer | None
+
+    @property
+    def size(self) -> int:
+        """How many browsers are running (or starting), leased or not."""
+        return len(self.uses) + self.starting + self.warming
+
+    def warm_up(self, count: int | None = None) -> None:
+        """Keep this many idle browsers started, ready to be leased.
+
+        The browsers are started on background threads, so this returns right
+        away. Whenever a warm browser is leased, another is started to take
+        its place, as long as the pool has room. If a browser fails to start
+        in the background, the next lease starts one itself, which will raise
+        the error where it can be seen.
+        """
+        self.warm_count = settings.BROWSER_WARM_UP if count is None else count
+        self._top_up()
+
+    def lease(self) -> WebDriver:
+        """Lend out an idle browser, or start a new one if none are idle.
+
+        If browsers are warming up and none are idle yet, waits for the
+        first one to finish starting.
+
+        Raises:
+            BrowsingError: if every browser in the pool is already leased, or
+                none finished warming up within the lease timeout.
+        """
+        self._retire_expired()
+        deadline = time.monotonic() + self.lease_timeout
+        while True:
+            with self.lock:
+                while not self.idle and self.warming:
+                    remaining = deadline - time.monotonic()
+                    if self.lease_timeout and remaining <= 0:
+                        msg = (
+                            "No browser finished warming up within"
+                            f" {self.lease_timeout} seconds."
+                        )
+                        raise BrowsingError(msg)
+                    self.lock.wait(remaining if self.lease_timeout else None)
+                if not self.idle:
+                    if self.size >= self.max_size:
+                        msg = (
+                            f"All {self.max_size} browsers in the pool are leased."
+                            " Are Actors forgetting their BrowseTheWeb Ability?"
+                        )
+                        raise BrowsingError(msg)
+                    self.starting += 1
+                    break
+                browser = self.idle.pop()
+                del self.idle_since[browser]
+            if self.health_check(browser):
+                return self._lend(browser)
+            self._discard(browser)
+
+        try:
+            browser = self.start_browser()
+        finally:
+            with self.lock:
+                self.starting -= 1
+        with self.lock:
+            self.uses[browser] = 0
+        return self._lend(browser)
+
+    def release(self, browser: WebDriver) -> None:
+        """Take back a leased browser, resetting it for the next Actor.
+
+        Anything wrapping the browser's command executor (like an element
+        cache) is removed. Browsers which cannot be reset, or which have been
+        leased ``max_uses`` times, are quit instead. Releasing a browser which
+        is already idle does nothing.
+        """
+        with self.lock:
+            if browser in self.idle or browser not in self.uses:
+                # it was already given back, or was never leased from here
+                return
+
+        if browser in self.command_executors:
+            browser.command_executor = self.command_executors[browser]
+
+        if self.max_uses and self.uses.get(browser, 0) >= self.max_uses:
+            self._discard(browser)
+            self._top_up()
+            return
+
+        try:
+            self.reset(browser)
+        except (ValueError, WebDriverException):
+            # ValueError means it had no windows left to reset
+            self._discard(browser)
+            self._top_up()
+            return
+
+        with self.lock:
+            if browser in self.uses:
+                self._add_idle(browser)
+
+    def close(self) -> None:
+        """Quit every browser in the pool, leased or not."""
+        self.warm_count = 0
+        with self.lock:
+            if self.retirement is not None:
+                self.retirement.cancel()
+                self.retirement = None
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+            self.executor = None
+        with self.lock:
+            browsers = list(self.uses)
+        for browser in browsers:
+            self._discard(browser)
+
+    def _lend(self, browser: WebDriver) -> WebDriver:
+        """Count another use of the browser and hand it over."""
+        with self.lock:
+            self.uses[browser] += 1
+            self.command_executors.setdefault(browser, browser.command_executor)
+        self._top_up()
+        return browser
+
+    def _add_idle(self, browser: WebDriver) -> None:
+        """Put the browser in the idle list. Must be called with the lock."""
+        self.idle.append(browser)
+        self.idle_since[browser] = time.monotonic()
+        self._schedule_retirement()
+        self.lock.notify_all()
+
+    def _schedule_retirement(self) -> None:
+        """Retire the longest-idle browser when it expires. Needs the lock."""
+        if not self.idle_timeout or self.retirement is not None or not self.idle:
+            return
+        expires = min(self.idle_since.values()) + self.idle_timeout
+        delay = max(expires - time.monotonic(), 0)
+        self.retirement = threading.Timer(delay, self._retire_on_time)
+        self.retirement.daemon = True
+        self.retirement.start()
+
+    def _retire_on_time(self) -> None:
+        """Retire expired browsers, then wait for the next one to expire."""
+        with self.lock:
+            self.retirement = None
+        self._retire_expired()
+        with self.lock:
+            self._schedule_retirement()
+
+    def _discard(self, browser: WebDriver) -> None:
+        """Quit the browser and forget about it."""
+        with self.lock:
+            self.uses.pop(browser, None)
+            self.command_executors.pop(browser, None)
+            if browser in self.idle:
+                self.idle.remove(browser)
+                del self.idle_since[browser]
+        # if it has already gone away, that's what we wanted anyway
+        with suppress(WebDriverException):
+            browser.quit()
+
+    def _retire_expired(self) -> None:
+        """Quit any browsers which have been idle longer than the timeout."""
+        if not self.idle_timeout:
+            return
+        cutoff = time.monotonic() - self.idle_timeout
+        with self.lock:
+            expired = [b for b, since in self.idle_since.items() if since < cutoff]
+            # take them out of the idle list now, so they can't be leased
+            for browser in expired:
+                self.idle.remove(browser)
+                del self.idle_since[browser]
+        for browser in expired:
+            self._discard(browser)
+        if expired:
+            self._top_up()
+
+    def _top_up(self) -> None:
+        """Start enough browsers in the background to reach the warm count."""
+        with self.lock:
+            missing = self.warm_count - len(self.idle) - self.warming
+            room = self.max_size - self.size
+            count = max(min(missing, room), 0)
+            self.warming += count
+        if not count:
+            return
+
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(
+                max_workers=self.max_size, thread_name_prefix="BrowserPool"
+            )
+        for _ in range(count):
+            self.executor.submit(self._warm_one)
+
+    def _warm_one(self) -> None:
+        """Start a browser and put it in the idle list."""
+        try:
+            browser = self.start_browser()
+        except Exception:  # noqa: BLE001
+            # the next lease will try again, and raise where it can be seen
+            with self.lock:
+                self.warming -= 1
+                self.lock.notify_all()
+            return
+
+        with self.lock:
+            self.warming -= 1
+            self.uses[browser] = 0
+            self._add_idle(browser)
+
+    def __init__(  # noqa: PLR0913
+        self,
+        start_browser: Callable[[], WebDriver],
+        max_size: int | None = None,
+        max_uses: int | None = None,
+        health_check: Callable[[WebDriver], bool] = is_responsive,
+        idle_timeout: float | None = None,
+        *,
+        reset: Callable[[WebDriver], None] = reset,
+    ) -> None:
+        self.start_browser = start_browser
+        self.max_size = settings.BROWSER_POOL_SIZE if max_size is None else max_size
+        self.max_uses = settings.BROWSER_POOL_MAX_USES if max_uses is None else max_uses
+        self.health_check = health_check
+        self.reset = reset
+        self.idle_timeout = (
+            settings.BROWSER_IDLE_TIMEOUT if idle_timeout is None else idle_timeout
+        )
+        self.lease_timeout = settings.BROWSER_LEASE_TIMEOUT
+        self.idle = []
+        self.idle_since = {}
+        self.uses = {}
+        self.command_executors = {}
+        self.starting = 0
+        self.warming = 0
+        self.warm_count = 0
+        self.executor = None
+        self.retirement = None
+        self.lock = threading.Condition()
@@ -1,5 +1,7 @@
 """Define settings for the StdOutAdapter."""
 
+from typing import Literal
+
 from pydantic_settings import SettingsConfigDict
 from screenpy.configuration import ScreenPySettings
 
@@ -19,6 +21,108 @@ class ScreenPySeleniumSettings(ScreenPySettings):
     CHAIN_DURATION: int = 10
     """Default duration of ActionChains in milleseconds"""
 
+    BACKOFF_POLLING: bool = False
+    """
+    If True, :class:`~screenpy_selenium.actions.Wait` polls quickly at first,
+    then less often the longer it waits, instead of every ``POLLING`` seconds.
+    """
+
+    BACKOFF_POLLING_START: float = 0.05
+    """The first polling interval (in seconds) when backing off."""
+
+    BACKOFF_POLLING_FACTOR: float = 2.0
+    """How much each polling interval grows by when backing off."""
+
+    BACKOFF_POLLING_MAX: float = 2.0
+    """The longest polling interval (in seconds) when backing off."""
+
+    BROWSER_POOL_SIZE: int = 4
+    """
+    The most browsers a :class:`~screenpy_selenium.browser_pool.BrowserPool`
+    will have running at once.
+    """
+
+    BROWSER_POOL_MAX_USES: int = 0
+    """
+    How many times a pooled browser can be leased before it is quit and
+    replaced. 0 means there is no limit.
+    """
+
+    BROWSER_WARM_UP: int = 1
+    """
+    How many idle browsers :meth:`~screenpy_selenium.abilities.BrowseTheWeb.warm_up`
+    keeps started in the background, ready for the next Actor.
+    """
+
+    BROWSER_IDLE_TIMEOUT: float = 300
+    """
+    How long (in seconds) a pooled browser can sit idle before it is quit.
+    If the pool is warmed up, a fresh browser is started to take its place.
+    0 means they can idle forever.
+    """
+
+    BROWSER_LEASE_TIMEOUT: float = 120
+    """
+    How long (in seconds) leasing a pooled browser waits for one to finish
+    warming up before giving up. 0 means it waits forever.
+    """
+
+    BACKGROUND_SCREENSHOTS: bool = False
+    """
+    If True, :class:`~screenpy_selenium.actions.SaveScreenshot` writes the
+    screenshot to disk on a background thread instead of waiting for it.
+    """
+
+    SCREENSHOT_QUEUE_SIZE: int = 8
+    """
+    How many screenshots can be waiting to be written in the background before
+    saving another one waits for room.
+    """
+
+    DEDUPLICATE_SCREENSHOTS: bool = False
+    """
+    If True, a screenshot identical to one already saved is hard-linked to
+    that file instead of being written again.
+    """
+
+    SCREENSHOT_FORMAT: Literal["png", "palette", "jpeg", "webp"] = "png"
+    """
+    The format to save screenshots in. Anything but "png" is re-encoded with
+    Pillow, and "palette" is a PNG with fewer colors. The file's extension is
+    changed to match.
+    """
+
+    SCREENSHOT_QUALITY: int = 80
+    """
+    The quality (1-100) of re-encoded screenshots. For "palette", this is the
+    percentage of 256 colors to keep.
+    """
+
+    CONSOLE_LOG_INTERVAL: float = 5
+    """
+    How often (in seconds) a watching
+    :class:`~screenpy_selenium.console_log.ConsoleLogCollector` collects the
+    browser's console log.
+    """
+
+    CONSOLE_LOG_BUFFER_SIZE: int = 10000
+    """How many console log entries a ConsoleLogCollector keeps in memory."""
+
+    BULK_QUERIES: bool = False
+    """
+    Answer Questions about many elements (e.g. ``Text.of_all``) with a single
+    script run in the browser, instead of one command per element. Questions
+    fall back to reading each element when the script cannot be used.
+    """
+
+    SCRIPTED_SELECT: bool = False
+    """
+    Select dropdown options with a single script run in the browser, instead
+    of checking each ``<option>`` over the wire. The script fires the
+    dropdown's ``input`` and ``change`` events, but no mouse events. Selenium's
+    ``Select`` is used whenever the script cannot select the option.
+    """
+
 
 # initialized instance
 settings = ScreenPySeleniumSettings()
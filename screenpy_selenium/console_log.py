@@ -0,0 +1,126 @@
+"""
+Collect the browser's console log as the test goes, instead of all at once.
+
+Reading the console log empties the browser's buffer, and the browser only
+keeps so much of it. Collecting it every so often keeps all of it, while
+holding only a bounded number of entries in memory.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import deque
+from contextlib import suppress
+from typing import TYPE_CHECKING, Any
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.command import Command
+
+from .configuration import settings
+from .exceptions import BrowsingError
+
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
+
+
+class ConsoleLogCollector:
+    """Drain the browser's console log into a bounded buffer, and maybe a file.
+
+    Once it is watching a browser, the log is collected after any command
+    which comes at least ``CONSOLE_LOG_INTERVAL`` seconds after the last
+    collection. This happens on the test's own thread, in between its
+    commands, so it never talks to the browser at the same time as the test.
+
+    Only the latest ``CONSOLE_LOG_BUFFER_SIZE`` entries are kept in memory.
+    If a path is given, every entry is also appended to that file as it is
+    collected.
+
+    Only browsers which can give their log (e.g. Chrome and Edge) can have it
+    collected.
+
+    Examples::
+
+        collector = ConsoleLogCollector(driver)
+        collector.watch()
+
+        collector = ConsoleLogCollector(driver, path="console.log")
+    """
+
+    entries: deque[str]
+    total: int
+
+    def watch(self) -> None:
+        """Collect the log every so often, in between the browser's commands."""
+        executor = LogCollectingExecutor(self.browser.command_executor, self)
+        self.browser.command_executor = executor  # type: ignore[assignment]
+
+    def collect(self) -> list[str]:
+        """Drain the browser's console log now.
+
+        Returns:
+            The entries which were collected.
+        """
+        self.last_collected = time.monotonic()
+        self.collecting = True
+        try:
+            log = self.browser.get_log("browser")  # type: ignore[attr-defined]
+        finally:
+            self.collecting = False
+
+        new_entries = [str(entry) for entry in log]
+        self.entries.extend(new_entries)
+        self.total += len(new_entries)
+        if self.path is not None and new_entries:
+            with open(self.path, "a", encoding="utf-8") as log_file:
+                log_file.writelines(f"{entry}\n" for entry in new_entries)
+        return new_entries
+
+    def is_due(self) -> bool:
+        """Whether it has been long enough since the log was last collected."""
+        if self.collecting:
+            return False
+        return time.monotonic() - self.last_collected >= settings.CONSOLE_LOG_INTERVAL
+
+    def __init__(
+        self,
+        browser: WebDriver,
+        path: str | None = None,
+        max_entries: int | None = None,
+    ) -> None:
+        if not hasattr(browser, "get_log"):
+            msg = f"{browser.__class__.__name__} can't give its console log."
+            raise BrowsingError(msg)
+        if max_entries is None:
+            max_entries = settings.CONSOLE_LOG_BUFFER_SIZE
+        self.browser = browser
+        self.path = path
+        self.entries = deque(maxlen=max_entries)
+        self.total = 0
+        self.last_collected = time.monotonic()
+        self.collecting = False
+
+
+class LogCollectingExecutor:
+    """Wrap a command executor to collect the console log when it is due.
+
+    All other attributes are passed through to the wrapped executor.
+    """
+
+    def execute(self, command: str, params: dict) -> dict[str, Any]:
+        """Execute the command, then collect the console log if it is due."""
+        response = self.executor.execute(command, params)
+        if command not in {Command.GET_LOG, Command.QUIT} and self.collector.is_due():
+            # a browser which can't give its log shouldn't fail the test
+            with suppress(AttributeError, WebDriverException):
+                self.collector.collect()
+        return response
+
+    def __getattr__(self, name: str) -> Any:  # noqa: ANN401
+        """Pass everything else through to the wrapped executor."""
+        return getattr(self.executor, name)
+
+    def __init__(
+        self, executor: Any, collector: ConsoleLogCollector  # noqa: ANN401
+    ) -> None:
+        self.executor = executor
+        self.collector = collector
@@ -0,0 +1,178 @@
+"""
+Remember the elements a Target has already found.
+
+Finding an element is a round-trip to the browser. When an Actor asks about
+the same Target several times on a page that has not changed, the handle
+from the first lookup can be reused instead.
+
+If a remembered handle turns out to be stale anyway, its element is found
+again by its locator, once, and the command is retried with the new handle.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.command import Command
+
+from .scripts import is_read_only_script
+
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
+    from selenium.webdriver.remote.webelement import WebElement
+
+CONTEXT_CHANGING_COMMANDS = {
+    Command.CLOSE,
+    Command.GET,
+    Command.GO_BACK,
+    Command.GO_FORWARD,
+    Command.QUIT,
+    Command.REFRESH,
+    Command.SWITCH_TO_FRAME,
+    Command.SWITCH_TO_PARENT_FRAME,
+    Command.SWITCH_TO_WINDOW,
+}
+PAGE_CHANGING_COMMANDS = {
+    Command.CLEAR_ELEMENT,
+    Command.CLICK_ELEMENT,
+    Command.EXECUTE_ASYNC_SCRIPT,
+    Command.SEND_KEYS_TO_ELEMENT,
+    Command.W3C_ACTIONS,
+    Command.W3C_EXECUTE_SCRIPT,
+    Command.W3C_EXECUTE_SCRIPT_ASYNC,
+}
+STALE_ELEMENT_ERROR = "stale element reference"
+STALE_ELEMENT_STATUS = 10  # the legacy JSON Wire Protocol status code
+
+
+def changes_page(command: str, params: dict | None) -> bool:
+    """Check if the command could change the page, or which page it is on."""
+    if command in CONTEXT_CHANGING_COMMANDS:
+        return True
+    return command in PAGE_CHANGING_COMMANDS and not is_read_only_script(
+        command, params
+    )
+
+
+def is_stale_element_response(response: dict[str, Any] | None) -> bool:
+    """Check if a WebDriver response reports a stale element reference."""
+    if not response:
+        return False
+    value = response.get("value")
+    if isinstance(value, dict) and value.get("error") == STALE_ELEMENT_ERROR:
+        return True
+    return response.get("status") == STALE_ELEMENT_STATUS
+
+
+class ElementCache:
+    """Remember the |WebElement| handle found for each locator.
+
+    Only single elements are remembered; lists of elements can grow or shrink
+    without any of their members going stale.
+
+    The cache only ever holds elements from the current window, frame, and
+    page. Once it is watching a browser, any command which navigates,
+    switches windows or frames, interacts with an element or runs a script
+    clears it, as does any response which reports a stale element reference.
+    Scripts which only read the page (see
+    :data:`~screenpy_selenium.scripts.READ_ONLY`) leave it alone.
+
+    Examples::
+
+        cache = ElementCache()
+        cache.watch(driver)
+    """
+
+    elements: dict[tuple[str, str], WebElement]
+
+    def watch(self, browser: WebDriver) -> None:
+        """Watch the browser's commands for changes to the page."""
+        if isinstance(browser.command_executor, CacheClearingExecutor):
+            browser.command_executor.caches.append(self)
+            return
+        executor = CacheClearingExecutor(browser.command_executor, self, browser)
+        browser.command_executor = executor  # type: ignore[assignment]
+
+    def unwatch(self, browser: WebDriver) -> None:
+        """Stop watching the browser, e.g. before it is used by another Actor."""
+        executor = browser.command_executor
+        if not isinstance(executor, CacheClearingExecutor):
+            return
+        if self in executor.caches:
+            executor.caches.remove(self)
+        if not executor.caches:
+            browser.command_executor = executor.executor
+
+    def clear(self) -> None:
+        """Forget every remembered element."""
+        self.elements.clear()
+
+    def __init__(self) -> None:
+        self.elements = {}
+
+
+class CacheClearingExecutor:
+    """Wrap a command executor to clear element caches when the page changes.
+
+    All other attributes are passed through to the wrapped executor.
+    """
+
+    caches: list[ElementCache]
+
+    def execute(self, command: str, params: dict) -> dict[str, Any]:
+        """Execute the command, clearing the caches if the page may change.
+
+        If the command was sent to a remembered element which has gone stale,
+        the element is found again and the command is retried once.
+        """
+        try:
+            response = self.executor.execute(command, params)
+            if is_stale_element_response(response):
+                # find it again before clearing, while it is still remembered
+                element_id = params.get("id") if params else None
+                refound = (
+                    self.refind(element_id) if isinstance(element_id, str) else None
+                )
+                self.clear_caches()
+                if refound is not None:
+                    response = self.executor.execute(command, {**params, "id": refound})
+        finally:
+            if changes_page(command, params):
+                self.clear_caches()
+        return response
+
+    def refind(self, element_id: str) -> str | None:
+        """Find a remembered element again by its locator, updating its handle.
+
+        Returns:
+            The element's new id, or None if it was not remembered or could
+            not be found again.
+        """
+        for cache in self.caches:
+            for locator, element in cache.elements.items():
+                if element.id != element_id:
+                    continue
+                try:
+                    fresh_element = self.browser.find_element(*locator)
+                except WebDriverException:
+                    return None
+                element._id = fresh_element.id
+                return element.id
+        return None
+
+    def clear_caches(self) -> None:
+        """Clear every cache this executor is watching for."""
+        for cache in self.caches:
+            cache.clear()
+
+    def __getattr__(self, name: str) -> Any:  # noqa: ANN401
+        """Pass everything else through to the wrapped executor."""
+        return getattr(self.executor, name)
+
+    def __init__(
+        self, executor: Any, cache: ElementCache, browser: WebDriver  # noqa: ANN401
+    ) -> None:
+        self.executor = executor
+        self.caches = [cache]
+        self.browser = browser
@@ -0,0 +1,186 @@
+"""
+Record every WebDriver command, and which Action or Question sent it.
+
+Each WebDriver command is a round-trip to the browser. On a remote grid those
+round-trips are usually where the time goes, so knowing which steps send the
+most commands shows where to look first.
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import time
+from typing import TYPE_CHECKING, Any, Callable, NamedTuple
+
+if TYPE_CHECKING:
+    from types import FrameType
+
+    from selenium.webdriver.remote.webdriver import WebDriver
+
+STEP_METHODS = {"perform_as", "answered_by"}
+NO_STEP = "(no step)"
+
+
+def current_step() -> object | None:
+    """Find the innermost Action or Question being performed or answered."""
+    frame: FrameType | None = sys._getframe(1)
+    while frame is not None:
+        if frame.f_code.co_name in STEP_METHODS and "self" in frame.f_locals:
+            return frame.f_locals["self"]
+        frame = frame.f_back
+    return None
+
+
+def payload_size(payload: Any) -> int:  # noqa: ANN401
+    """Approximate how many bytes a payload takes up on the wire."""
+    if not payload:
+        return 0
+    return len(json.dumps(payload, default=str))
+
+
+def unwrap_executor(browser: WebDriver, is_wrapper: Callable[[Any], bool]) -> None:
+    """Take the matching wrappers out of the browser's chain of executors.
+
+    Each wrapper keeps the executor it wraps as its ``executor``, so the
+    wrappers which don't match stay wrapped around the rest, in order.
+    """
+    outer: Any = None
+    executor: Any = browser.command_executor
+    while executor is not None:
+        # look in __dict__, since wrappers pass missing attributes through
+        inner: Any = getattr(executor, "__dict__", {}).get("executor")
+        if not is_wrapper(executor):
+            outer = executor
+        elif outer is None:
+            browser.command_executor = inner
+        else:
+            outer.executor = inner
+        executor = inner
+
+
+class CommandRecord(NamedTuple):
+    """One WebDriver command, and the step which sent it."""
+
+    command: str
+    step: str
+    target: str | None
+    duration: float
+    sent: int
+    received: int
+
+
+class StepSummary(NamedTuple):
+    """The totals for all the commands one step sent."""
+
+    step: str
+    commands: int
+    duration: float
+    sent: int
+    received: int
+
+
+class CommandLog:
+    """Record the WebDriver commands sent by a browser.
+
+    Each record is tagged with the name of the Action or Question which sent
+    it (or ``"(no step)"``), along with its Target, if it has one.
+
+    Examples::
+
+        log = CommandLog()
+        log.watch(driver)
+
+        ...
+
+        print(log.report())
+        log.clear()
+    """
+
+    records: list[CommandRecord]
+
+    def watch(self, browser: WebDriver) -> None:
+        """Record every command the browser sends from now on."""
+        executor = RecordingExecutor(browser.command_executor, self)
+        browser.command_executor = executor  # type: ignore[assignment]
+
+    def unwatch(self, browser: WebDriver) -> None:
+        """Stop recording the browser's commands."""
+        unwrap_executor(
+            browser, lambda e: isinstance(e, RecordingExecutor) and e.log is self
+        )
+
+    def record(
+        self, command: str, duration: float, sent: int, received: int
+    ) -> CommandRecord:
+        """Record a command, tagged with the step which is sending it."""
+        step = current_step()
+        target = getattr(step, "target", None)
+        record = CommandRecord(
+            command=command,
+            step=NO_STEP if step is None else step.__class__.__name__,
+            target=None if target is None else str(target),
+            duration=duration,
+            sent=sent,
+            received=received,
+        )
+        self.records.append(record)
+        return record
+
+    def summary(self) -> list[StepSummary]:
+        """Total up the commands for each step, the most expensive first."""
+        totals: dict[str, list] = {}
+        for record in self.records:
+            total = totals.setdefault(record.step, [0, 0.0, 0, 0])
+            total[0] += 1
+            total[1] += record.duration
+            total[2] += record.sent
+            total[3] += record.received
+        summaries = [StepSummary(step, *total) for step, total in totals.items()]
+        return sorted(summaries, key=lambda s: s.duration, reverse=True)
+
+    def report(self) -> str:
+        """Describe the commands sent by each step, e.g. for a test's log."""
+        total_duration = sum(r.duration for r in self.records)
+        lines = [f"{len(self.records)} WebDriver commands in {total_duration:.3f}s"]
+        lines.extend(
+            f"    {s.step}: {s.commands} commands in {s.duration:.3f}s"
+            f" ({s.sent} bytes sent, {s.received} bytes received)"
+            for s in self.summary()
+        )
+        return "\n".join(lines)
+
+    def clear(self) -> None:
+        """Forget every recorded command, e.g. between tests."""
+        self.records.clear()
+
+    def __init__(self) -> None:
+        self.records = []
+
+
+class RecordingExecutor:
+    """Wrap a command executor to record each command it sends.
+
+    All other attributes are passed through to the wrapped executor.
+    """
+
+    def execute(self, command: str, params: dict) -> dict[str, Any]:
+        """Execute the command, recording how long it took and its size."""
+        start = time.perf_counter()
+        response: dict[str, Any] = {}
+        try:
+            response = self.executor.execute(command, params)
+        finally:
+            duration = time.perf_counter() - start
+            self.log.record(
+                command, duration, payload_size(params), payload_size(response)
+            )
+        return response
+
+    def __getattr__(self, name: str) -> Any:  # noqa: ANN401
+        """Pass everything else through to the wrapped executor."""
+        return getattr(self.executor, name)
+
+    def __init__(self, executor: Any, log: CommandLog) -> None:  # noqa: ANN401
+        self.executor = executor
+        self.log = log
@@ -0,0 +1,165 @@
+"""
+Read many things about a page at once, then answer Questions from memory.
+
+Each Question about a page is at least one round-trip to the browser. When
+many Questions are asked about a page that is not changing, a snapshot can
+read everything they need with one script, and answer them all from that.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Iterable, NamedTuple
+
+from selenium.webdriver.remote.command import Command
+
+from .scripts import SCRIPTABLE_STRATEGIES, TAKE_SNAPSHOT, is_read_only_script
+
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
+
+    from .target import Target
+
+READ_ONLY_COMMANDS = {
+    Command.ELEMENT_SCREENSHOT,
+    Command.FIND_CHILD_ELEMENT,
+    Command.FIND_CHILD_ELEMENTS,
+    Command.FIND_ELEMENT,
+    Command.FIND_ELEMENTS,
+    Command.GET_ALL_COOKIES,
+    Command.GET_AVAILABLE_LOG_TYPES,
+    Command.GET_COOKIE,
+    Command.GET_CURRENT_URL,
+    Command.GET_ELEMENT_ARIA_LABEL,
+    Command.GET_ELEMENT_ARIA_ROLE,
+    Command.GET_ELEMENT_ATTRIBUTE,
+    Command.GET_ELEMENT_PROPERTY,
+    Command.GET_ELEMENT_RECT,
+    Command.GET_ELEMENT_TAG_NAME,
+    Command.GET_ELEMENT_TEXT,
+    Command.GET_ELEMENT_VALUE_OF_CSS_PROPERTY,
+    Command.GET_LOG,
+    Command.GET_PAGE_SOURCE,
+    Command.GET_SHADOW_ROOT,
+    Command.GET_TITLE,
+    Command.GET_WINDOW_RECT,
+    Command.IS_ELEMENT_ENABLED,
+    Command.IS_ELEMENT_SELECTED,
+    Command.SCREENSHOT,
+    Command.W3C_GET_CURRENT_WINDOW_HANDLE,
+}
+"""Commands which cannot change the page, so leave a snapshot valid."""
+
+
+class ElementSnapshot(NamedTuple):
+    """What a snapshot knows about one element."""
+
+    text: str
+    attributes: dict[str, str | None]
+    selected: list[tuple[str, str, int]] | None
+
+
+class PageSnapshot:
+    """Remember the page's title and URL, and what some Targets found.
+
+    For each Target, every element it finds is remembered: its visible text,
+    the values of its attributes (and its ``checked``, ``disabled``,
+    ``selected`` and ``value`` properties), and its selected options, if it
+    is a dropdown. Targets with a locator strategy the script does not
+    understand are left out.
+
+    While the snapshot is valid, the :class:`~screenpy_selenium.questions.Text`,
+    :class:`~screenpy_selenium.questions.Attribute`,
+    :class:`~screenpy_selenium.questions.Number`,
+    :class:`~screenpy_selenium.questions.Selected`,
+    :class:`~screenpy_selenium.questions.BrowserTitle` and
+    :class:`~screenpy_selenium.questions.BrowserURL` Questions are answered
+    from it. Anything it doesn't know is still asked of the browser.
+
+    Once it is watching a browser, any command which might change the page
+    (anything but reading, including running a script which isn't known to
+    only read the page) invalidates it. It can't know if the page changes on
+    its own, though, so don't use one to wait for something to happen (e.g.
+    inside ``Eventually``).
+
+    Examples::
+
+        snapshot = PageSnapshot.take(driver, [HEADER, PRICES, COUNTRY_DROPDOWN])
+        snapshot.watch(driver)
+    """
+
+    elements: dict[tuple[str, str], list[ElementSnapshot]]
+    valid: bool
+
+    @classmethod
+    def take(cls, browser: WebDriver, targets: Iterable[Target]) -> PageSnapshot:
+        """Read the page, and everything the Targets find, with one script."""
+        locators = [target.get_locator() for target in targets]
+        scripted = [loc for loc in locators if loc[0] in SCRIPTABLE_STRATEGIES]
+        title, url, found = browser.execute_script(
+            TAKE_SNAPSHOT, [list(locator) for locator in scripted]
+        )
+
+        snapshot = cls(title=title, url=url)
+        for locator, elements in zip(scripted, found):
+            if elements is not None:
+                snapshot.elements[locator] = [
+                    ElementSnapshot(
+                        text=text,
+                        attributes=attributes,
+                        selected=(
+                            None
+                            if selected is None
+                            else [tuple(option) for option in selected]
+                        ),
+                    )
+                    for text, attributes, selected in elements
+                ]
+        return snapshot
+
+    def watch(self, browser: WebDriver) -> None:
+        """Invalidate this snapshot when the browser might change the page."""
+        if isinstance(browser.command_executor, SnapshotInvalidatingExecutor):
+            browser.command_executor.snapshot.invalidate()
+            browser.command_executor.snapshot = self
+            return
+        executor = SnapshotInvalidatingExecutor(browser.command_executor, self)
+        browser.command_executor = executor  # type: ignore[assignment]
+
+    def found(self, target: Target) -> list[ElementSnapshot] | None:
+        """Get what the Target found, or None if the snapshot doesn't know."""
+        if not self.valid:
+            return None
+        return self.elements.get(target.get_locator())
+
+    def invalidate(self) -> None:
+        """Stop answering from this snapshot; the page may have changed."""
+        self.valid = False
+
+    def __init__(self, title: str, url: str) -> None:
+        self.title = title
+        self.url = url
+        self.elements = {}
+        self.valid = True
+
+
+class SnapshotInvalidatingExecutor:
+    """Wrap a command executor to invalidate a snapshot if the page may change.
+
+    All other attributes are passed through to the wrapped executor.
+    """
+
+    def execute(self, command: str, params: dict) -> dict[str, Any]:
+        """Invalidate the snapshot unless the command only reads, then run it."""
+        if command not in READ_ONLY_COMMANDS and not is_read_only_script(
+            command, params
+        ):
+            self.snapshot.invalidate()
+        return self.executor.execute(command, params)
+
+    def __getattr__(self, name: str) -> Any:  # noqa: ANN401
+        """Pass everything else through to the wrapped executor."""
+        return getattr(self.executor, name)
+
+    def __init__(self, executor: Any, snapshot: PageSnapshot) -> None:  # noqa: ANN401
+        self.executor = executor
+        self.snapshot = snapshot
@@ -8,6 +8,7 @@ from .element import Element
 from .list import List
 from .number import Number
 from .selected import Selected
+from .table import Table
 from .text import Text
 from .text_of_the_alert import TextOfTheAlert
 
@@ -20,6 +21,7 @@ TheElement = Element
 TheList = List
 TheNumber = Number
 TheSelected = Selected
+TheTable = Table
 TheText = Text
 TheTextOfTheAlert = TextOfTheAlert
 
@@ -33,6 +35,7 @@ __all__ = [
     "List",
     "Number",
     "Selected",
+    "Table",
     "Text",
     "TextOfTheAlert",
     "TheAttribute",
@@ -43,6 +46,7 @@ __all__ = [
     "TheList",
     "TheNumber",
     "TheSelected",
+    "TheTable",
     "TheText",
     "TheTextOfTheAlert",
 ]
@@ -7,6 +7,10 @@ from typing import TYPE_CHECKING
 from screenpy.exceptions import UnableToAnswer
 from screenpy.pacing import beat
 
+from ..abilities import BrowseTheWeb
+from ..configuration import settings
+from ..scripts import READ_ATTRIBUTES
+
 if TYPE_CHECKING:
     from screenpy import Actor
 
@@ -29,9 +33,17 @@ class Attribute:
                 Attribute("aria-label").of_the(BALLOONS), ContainsTheText("balloon")),
             ),
         )
+
+        the_actor.should(
+            See.the(
+                Attribute("href", "data-id").of_all(LINKS),
+                ContainsTheItem(["/home", "home-link"]),
+            ),
+        )
     """
 
     target: Target | None
+    attributes: tuple[str, ...]
 
     def of_the(self, target: Target) -> Attribute:
         """Target the element to get the attribute from."""
@@ -41,18 +53,35 @@ class Attribute:
     of = of_the_first_of_the = of_the
 
     def of_all(self, target: Target) -> Attribute:
-        """Target the elements, plural, to get the attribute from."""
+        """Target the elements, plural, to get the attribute from.
+
+        If ``settings.BULK_QUERIES`` is on, the attributes of all the elements
+        are read by a single script run in the browser rather than one
+        command per element.
+        """
         self.target = target
         self.multi = True
         return self
 
+    @property
+    def attributes_to_log(self) -> str:
+        """Get a nice representation of the attribute name(s)."""
+        names = " and ".join(f'"{name}"' for name in self.attributes)
+        return f"{names} attribute{'s' if len(self.attributes) > 1 else ''}"
+
     def describe(self) -> str:
         """Describe the Question."""
-        return f'The "{self.attribute}" attribute of the {self.target}.'
+        return f"The {self.attributes_to_log} of the {self.target}."
+
+    @beat("{} examines the {attributes_to_log} of the {target}...")
+    def answered_by(
+        self, the_actor: Actor
+    ) -> str | list[str | None] | list[list[str | None]] | None:
+        """Direct the actor to investigate the attribute on the element.
 
-    @beat('{} examines the "{attribute}" attribute of the {target}...')
-    def answered_by(self, the_actor: Actor) -> str | list[str | None] | None:
-        """Direct the actor to investigate the attribute on the element."""
+        When several attribute names were given, each element's answer is a
+        list of their values, in the same order as the names.
+        """
         if self.target is None:
             msg = (
                 "No Target given to Attribute to investigate. Supply a Target"
@@ -60,12 +89,46 @@ class Attribute:
             )
             raise UnableToAnswer(msg)
 
+        snapshot = the_actor.ability_to(BrowseTheWeb).snapshot
+        found = None if snapshot is None else snapshot.found(self.target)
+        # an attribute the snapshot didn't read must be asked of the browser
+        if (
+            found is not None
+            and (self.multi or found)
+            and all(name in e.attributes for e in found for name in self.attributes)
+        ):
+            rows = [[e.attributes[name] for name in self.attributes] for e in found]
+            if self.multi:
+                return [row[0] for row in rows] if len(self.attributes) == 1 else rows
+            return rows[0][0] if len(self.attributes) == 1 else rows[0]
+
         if self.multi:
-            elements = self.target.all_found_by(the_actor)
-            return [element.get_attribute(self.attribute) for element in elements]
-        return self.target.found_by(the_actor).get_attribute(self.attribute)
+            rows = self._read_all(the_actor, self.target)
+            if len(self.attributes) == 1:
+                return [row[0] for row in rows]
+            return rows
+
+        element = self.target.found_by(the_actor)
+        if len(self.attributes) == 1:
+            return element.get_attribute(self.attribute)
+        return [element.get_attribute(name) for name in self.attributes]
+
+    def _read_all(self, the_actor: Actor, target: Target) -> list[list[str | None]]:
+        """Read every attribute of every element the Target finds."""
+        if settings.BULK_QUERIES:
+            rows = target.all_scripted_by(
+                the_actor, READ_ATTRIBUTES, list(self.attributes)
+            )
+            if rows is not None:
+                return rows
+
+        return [
+            [element.get_attribute(name) for name in self.attributes]
+            for element in target.all_found_by(the_actor)
+        ]
 
-    def __init__(self, attribute: str) -> None:
+    def __init__(self, attribute: str, *attributes: str) -> None:
         self.attribute = attribute
+        self.attributes = (attribute, *attributes)
         self.multi = False
         self.target = None
@@ -30,5 +30,8 @@ class BrowserTitle:
     @beat("{} reads the title of the page from their browser.")
     def answered_by(self, the_actor: Actor) -> str:
         """Direct the Actor to investigate the browser's title."""
-        browser = the_actor.ability_to(BrowseTheWeb).browser
-        return browser.title
+        browse_the_web = the_actor.ability_to(BrowseTheWeb)
+        snapshot = browse_the_web.snapshot
+        if snapshot is not None and snapshot.valid:
+            return snapshot.title
+        return browse_the_web.browser.title
@@ -30,5 +30,8 @@ class BrowserURL:
     @beat("{} reads the URL from their browser.")
     def answered_by(self, the_actor: Actor) -> str:
         """Direct the Actor to investigate the browser's current URL."""
-        browser = the_actor.ability_to(BrowseTheWeb).browser
-        return browser.current_url
+        browse_the_web = the_actor.ability_to(BrowseTheWeb)
+        snapshot = browse_the_web.snapshot
+        if snapshot is not None and snapshot.valid:
+            return snapshot.url
+        return browse_the_web.browser.current_url
@@ -6,6 +6,10 @@ from typing import TYPE_CHECKING
 
 from screenpy.pacing import beat
 
+from ..abilities import BrowseTheWeb
+from ..configuration import settings
+from ..scripts import COUNT_ELEMENTS
+
 if TYPE_CHECKING:
     from screenpy import Actor
     from typing_extensions import Self
@@ -26,7 +30,11 @@ class Number:
 
     @classmethod
     def of(cls, target: Target) -> Self:
-        """Target the element to be counted."""
+        """Target the element to be counted.
+
+        If ``settings.BULK_QUERIES`` is on, the elements are counted by a
+        script run in the browser, so only the number is sent back.
+        """
         return cls(target=target)
 
     def describe(self) -> str:
@@ -36,6 +44,15 @@ class Number:
     @beat("{} counts the number of {target}.")
     def answered_by(self, the_actor: Actor) -> int:
         """Direct the Actor to count the elements."""
+        snapshot = the_actor.ability_to(BrowseTheWeb).snapshot
+        found = None if snapshot is None else snapshot.found(self.target)
+        if found is not None:
+            return len(found)
+
+        if settings.BULK_QUERIES:
+            count = self.target.all_scripted_by(the_actor, COUNT_ELEMENTS)
+            if count is not None:
+                return int(count)
         return len(self.target.all_found_by(the_actor))
 
     def __init__(self, target: Target) -> None:
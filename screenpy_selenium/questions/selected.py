@@ -7,10 +7,14 @@ from typing import TYPE_CHECKING
 from screenpy.pacing import beat
 from selenium.webdriver.support.ui import Select as SeleniumSelect
 
+from ..abilities import BrowseTheWeb
 from ..common import pos_args_deprecated
+from ..configuration import settings
+from ..scripts import READ_SELECTED_OPTIONS
 
 if TYPE_CHECKING:
     from screenpy import Actor
+    from selenium.webdriver.remote.webelement import WebElement
     from typing_extensions import Self
 
     from ..target import Target
@@ -19,6 +23,16 @@ if TYPE_CHECKING:
 class Selected:
     """Ask for the text of selected option(s) in a dropdown or multi-select field.
 
+    Ask for their values or indexes instead with
+    :meth:`~screenpy_selenium.questions.Selected.as_values` or
+    :meth:`~screenpy_selenium.questions.Selected.as_indexes`.
+
+    If the Actor has taken a
+    :class:`~screenpy_selenium.page_snapshot.PageSnapshot` of the Target, the
+    answer comes from that. Otherwise, if ``settings.BULK_QUERIES`` is on, all
+    the selected options are read by a single script run in the browser,
+    rather than a few commands for each.
+
     Abilities Required:
         :class:`~screenpy_selenium.abilities.BrowseTheWeb`
 
@@ -29,10 +43,15 @@ class Selected:
         )
 
         the_actor.should(See.the(Selected.options_from(INDUSTRIES), HasLength(5)))
+
+        the_actor.should(
+            See.the(Selected.option_from(THE_STATE_DROPDOWN).as_values(), IsEqual("MN"))
+        )
     """
 
     target: Target
     multi: bool
+    answer_with: str
 
     @classmethod
     def option_from_the(cls, target: Target) -> Self:
@@ -74,18 +93,49 @@ class Selected:
         """Alias of :meth:`~screenpy_selenium.actions.Selected.options_from_the`."""
         return cls.options_from_the(multiselect_target=multiselect_target)
 
+    def as_values(self) -> Self:
+        """Answer with the values of the selected option(s), not their text."""
+        self.answer_with = "value"
+        return self
+
+    def as_indexes(self) -> Self:
+        """Answer with the indexes of the selected option(s), not their text."""
+        self.answer_with = "index"
+        return self
+
+    def read(self, option: WebElement) -> str | int | None:
+        """Read the text, value or index of the option, as was asked."""
+        if self.answer_with == "value":
+            return option.get_attribute("value")
+        if self.answer_with == "index":
+            return int(option.get_attribute("index") or 0)
+        return option.text
+
     def describe(self) -> str:
         """Describe the Question."""
         return f"The selected option(s) from the {self.target}."
 
     @beat("{} checks the selected option(s) from the {target}.")
-    def answered_by(self, the_actor: Actor) -> str | list[str]:
+    def answered_by(
+        self, the_actor: Actor
+    ) -> str | int | list[str | int | None] | None:
         """Direct the Actor to name the selected option(s)."""
+        snapshot = the_actor.ability_to(BrowseTheWeb).snapshot
+        found = None if snapshot is None else snapshot.found(self.target)
+        options = None if not found else found[0].selected
+        if options is None and settings.BULK_QUERIES:
+            options = self.target.all_scripted_by(the_actor, READ_SELECTED_OPTIONS)
+        # with nothing selected, let Selenium raise for a single option
+        if options is not None and (self.multi or options):
+            part = ("text", "value", "index").index(self.answer_with)
+            answers: list[str | int | None] = [option[part] for option in options]
+            return answers if self.multi else answers[0]
+
         select = SeleniumSelect(self.target.found_by(the_actor))
 
         if self.multi:
-            return [e.text for e in select.all_selected_options]
-        return select.first_selected_option.text
+            return [self.read(e) for e in select.all_selected_options]
+        return self.read(select.first_selected_option)
 
     @pos_args_deprecated("multi")
     def __init__(
@@ -93,3 +143,4 @@ class Selected:
     ) -> None:
         self.target = target
         self.multi = multi
+        self.answer_with = "text"
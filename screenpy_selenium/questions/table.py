@@ -0,0 +1,240 @@
+"""Investigate the data in a table or grid."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Callable
+
+from screenpy.exceptions import UnableToAnswer
+from screenpy.pacing import beat
+from selenium.webdriver.common.by import By
+
+from ..exceptions import TargetingError
+from ..scripts import READ_TABLE
+
+if TYPE_CHECKING:
+    from screenpy import Actor
+    from selenium.webdriver.remote.webelement import WebElement
+    from typing_extensions import Self
+
+    from ..target import Target
+
+GRID_ROLES = ("grid", "table", "treegrid")
+GRID_ROWS_XPATH = ".//*[@role='row']"
+GRID_CELLS_XPATH = (
+    ".//*[@role='cell' or @role='gridcell'"
+    " or @role='columnheader' or @role='rowheader']"
+)
+TABLE_CELLS_XPATH = "./th | ./td"
+
+
+def column_names(headers: list[str] | None, width: int) -> list[str]:
+    """Name each column after its header, or its index if it has none.
+
+    Repeated headers have the column's index added, so every name is unique.
+    """
+    headers = headers or []
+    names: list[str] = []
+    for index in range(width):
+        name = headers[index] if index < len(headers) else ""
+        if not name:
+            name = str(index)
+        elif name in names:
+            name = f"{name} {index}"
+        names.append(name)
+    return names
+
+
+def is_header(cell: WebElement) -> bool:
+    """Check if a cell is a header cell."""
+    return cell.tag_name.lower() == "th" or cell.get_attribute("role") == "columnheader"
+
+
+def read_row(cells: list[WebElement]) -> list[str]:
+    """Read the text of each cell, padding out cells which span columns."""
+    texts = []
+    for cell in cells:
+        texts.append(cell.text)
+        try:
+            span = int(cell.get_attribute("colspan") or 1)
+        except ValueError:
+            span = 1
+        texts.extend([""] * (span - 1))
+    return texts
+
+
+class Table:
+    """Ask for the data in a ``<table>`` or ARIA grid, column by column.
+
+    The whole table is read by a single script run in the browser. The
+    answer maps each column's name to a list of its cells' text, from top to
+    bottom. The columns are named after the table's headers, which are
+    found in its ``<thead>``, or its first row if that is all header cells.
+    Columns without a header are named by their index, starting from "0".
+
+    Columns can be parsed into other types with
+    :meth:`~screenpy_selenium.questions.Table.with_types`, and the answer can
+    be a list of rows instead, with
+    :meth:`~screenpy_selenium.questions.Table.as_records`, or a NumPy
+    structured array, with :meth:`~screenpy_selenium.questions.Table.as_numpy`.
+
+    Abilities Required:
+        :class:`~screenpy_selenium.abilities.BrowseTheWeb`
+
+    Examples::
+
+        the_actor.should(
+            See.the(Table.of(ORDERS), ContainsTheKey("Order Number")),
+        )
+
+        the_actor.should(
+            See.the(
+                Table.of(ORDERS).with_types({"Quantity": int}).as_records(),
+                ContainsTheItem({"Item": "Banana stand", "Quantity": 1}),
+            ),
+        )
+    """
+
+    target: Target
+    types: dict[str, Callable[[str], Any]]
+    detect_headers: bool
+    answer_as: str
+
+    @classmethod
+    def of_the(cls, target: Target) -> Self:
+        """Target the table or grid to read.
+
+        Aliases:
+            * :meth:`~screenpy_selenium.questions.Table.of`
+        """
+        return cls(target=target)
+
+    @classmethod
+    def of(cls, target: Target) -> Self:
+        """Alias of :meth:`~screenpy_selenium.questions.Table.of_the`."""
+        return cls.of_the(target=target)
+
+    def with_types(self, types: dict[str, Callable[[str], Any]]) -> Self:
+        """Parse the named columns' text with these functions (e.g. ``int``).
+
+        Empty cells are answered with ``None`` instead of being parsed.
+        """
+        self.types.update(types)
+        return self
+
+    def without_headers(self) -> Self:
+        """Read every row as data, naming the columns by their index."""
+        self.detect_headers = False
+        return self
+
+    def as_records(self) -> Self:
+        """Answer with a list of rows, each a dict of column name to value."""
+        self.answer_as = "records"
+        return self
+
+    def as_numpy(self) -> Self:
+        """Answer with a NumPy structured array, with a field for each column.
+
+        This needs NumPy to be installed.
+        """
+        self.answer_as = "numpy"
+        return self
+
+    def describe(self) -> str:
+        """Describe the Question."""
+        return f"The data in the {self.target}."
+
+    @beat("{} reads the data in the {target}.")
+    def answered_by(self, the_actor: Actor) -> Any:  # noqa: ANN401
+        """Direct the Actor to read the table.
+
+        Raises:
+            UnableToAnswer: if the Target is not a table or grid.
+        """
+        result = self.target.all_scripted_by(the_actor, READ_TABLE, self.detect_headers)
+        if result is None:
+            headers, rows = self._read_slowly(the_actor)
+        elif isinstance(result, dict):
+            if result["error"] == "not found":
+                msg = f"Could not find the {self.target} to read."
+                raise TargetingError(msg)
+            msg = f"The {self.target} is not a table or grid, so it can't be read."
+            raise UnableToAnswer(msg)
+        else:
+            headers, rows = result
+
+        width = max([len(headers or []), *(len(row) for row in rows)])
+        columns = {
+            name: [self._parse(name, row[i] if i < len(row) else None) for row in rows]
+            for i, name in enumerate(column_names(headers, width))
+        }
+
+        if self.answer_as == "records":
+            return [dict(zip(columns, values)) for values in zip(*columns.values())]
+        if self.answer_as == "numpy":
+            return self._to_numpy(columns)
+        return columns
+
+    def _parse(self, name: str, text: str | None) -> Any:  # noqa: ANN401
+        """Parse the cell's text, if its column has a type."""
+        if name not in self.types:
+            return text
+        if not text:
+            return None
+        return self.types[name](text)
+
+    def _read_slowly(
+        self, the_actor: Actor
+    ) -> tuple[list[str] | None, list[list[str]]]:
+        """Read the table one command at a time, when the script can't be used.
+
+        The rows, cells and headers are found the same way the script finds
+        them, so the answer is the same either way.
+        """
+        table = self.target.found_by(the_actor)
+        if table.tag_name.lower() == "table":
+            head_rows = table.find_elements(By.XPATH, "./thead/tr")
+            rows = [
+                *head_rows,
+                *table.find_elements(By.XPATH, "./tbody/tr | ./tr"),
+                *table.find_elements(By.XPATH, "./tfoot/tr"),
+            ]
+            cells_xpath = TABLE_CELLS_XPATH
+        elif table.get_attribute("role") in GRID_ROLES:
+            head_rows = []
+            rows = table.find_elements(By.XPATH, GRID_ROWS_XPATH)
+            cells_xpath = GRID_CELLS_XPATH
+        else:
+            msg = f"The {self.target} is not a table or grid, so it can't be read."
+            raise UnableToAnswer(msg)
+
+        cells = [row.find_elements(By.XPATH, cells_xpath) for row in rows]
+        headers = None
+        if self.detect_headers and cells:
+            header_index = len(head_rows) - 1 if head_rows else 0
+            header_cells = cells[header_index]
+            if header_cells and all(map(is_header, header_cells)):
+                headers = read_row(header_cells)
+                cells = [
+                    row_cells
+                    for i, row_cells in enumerate(cells)
+                    if i >= len(head_rows) and i != header_index
+                ]
+        return headers, [read_row(row_cells) for row_cells in cells]
+
+    def _to_numpy(self, columns: dict[str, list[Any]]) -> Any:  # noqa: ANN401
+        """Turn the columns into a NumPy structured array."""
+        try:
+            import numpy as np  # noqa: PLC0415
+        except ImportError as e:
+            msg = "Table.as_numpy needs NumPy. Install it with `pip install numpy`."
+            raise ImportError(msg) from e
+
+        return np.rec.fromarrays(
+            [np.array(values) for values in columns.values()], names=list(columns)
+        )
+
+    def __init__(self, target: Target) -> None:
+        self.target = target
+        self.types = {}
+        self.detect_headers = True
+        self.answer_as = "columns"
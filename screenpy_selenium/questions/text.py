@@ -6,7 +6,10 @@ from typing import TYPE_CHECKING
 
 from screenpy.pacing import beat
 
+from ..abilities import BrowseTheWeb
 from ..common import pos_args_deprecated
+from ..configuration import settings
+from ..scripts import READ_VISIBLE_TEXTS
 
 if TYPE_CHECKING:
     from screenpy import Actor
@@ -57,7 +60,11 @@ class Text:
 
     @classmethod
     def of_all(cls, multi_target: Target) -> Self:
-        """Target the elements, plural, to extract the text from."""
+        """Target the elements, plural, to extract the text from.
+
+        If ``settings.BULK_QUERIES`` is on, all the text is read by a single
+        script run in the browser rather than one command per element.
+        """
         return cls(target=multi_target, multi=True)
 
     def describe(self) -> str:
@@ -67,7 +74,16 @@ class Text:
     @beat("{} reads the text from the {target}.")
     def answered_by(self, the_actor: Actor) -> str | list[str]:
         """Direct the Actor to read off the text of the element(s)."""
+        snapshot = the_actor.ability_to(BrowseTheWeb).snapshot
+        found = None if snapshot is None else snapshot.found(self.target)
+        if found is not None and (self.multi or found):
+            return [e.text for e in found] if self.multi else found[0].text
+
         if self.multi:
+            if settings.BULK_QUERIES:
+                texts = self.target.all_scripted_by(the_actor, READ_VISIBLE_TEXTS)
+                if texts is not None:
+                    return texts
             return [e.text for e in self.target.all_found_by(the_actor)]
         return self.target.found_by(the_actor).text
 
@@ -1,24 +1,42 @@
 """Additional Resolutions to provide expected answers for Selenium tests."""
 
+from .all_clickable import AllClickable
+from .all_visible import AllVisible
+from .any_visible import AnyVisible
 from .is_clickable import IsClickable
 from .is_invisible import IsInvisible
 from .is_present import IsPresent
 from .is_visible import IsVisible
+from .none_visible import NoneVisible
 
 # Natural-language-enabling syntactic sugar
 IsEnabled = Enabled = Clickable = IsClickable
 IsDisplayed = Displayed = Visible = IsVisible
 IsNotDisplayed = NotDisplayed = Invisible = IsInvisible
 Exist = Exists = Present = IsPresent
+AllEnabled = AreAllClickable = AllClickable
+AllDisplayed = AreAllVisible = AllVisible
+AnyDisplayed = IsAnyVisible = AnyVisible
+NoneDisplayed = AreNoneVisible = NoneVisible
 
 
 __all__ = [
+    "AllClickable",
+    "AllDisplayed",
+    "AllEnabled",
+    "AllVisible",
+    "AnyDisplayed",
+    "AnyVisible",
+    "AreAllClickable",
+    "AreAllVisible",
+    "AreNoneVisible",
     "Clickable",
     "Displayed",
     "Enabled",
     "Exist",
     "Exists",
     "Invisible",
+    "IsAnyVisible",
     "IsClickable",
     "IsDisplayed",
     "IsEnabled",
@@ -26,6 +44,8 @@ __all__ = [
     "IsNotDisplayed",
     "IsPresent",
     "IsVisible",
+    "NoneDisplayed",
+    "NoneVisible",
     "NotDisplayed",
     "Present",
     "Visible",
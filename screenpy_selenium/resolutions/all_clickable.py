@@ -0,0 +1,30 @@
+"""Matches a list of WebElements which are all clickable."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from screenpy import beat
+
+from .custom_matchers import all_clickable_elements
+
+if TYPE_CHECKING:
+    from .custom_matchers.elements_in_state import ElementsInState
+
+
+class AllClickable:
+    """Match on a list of elements which are all clickable.
+
+    Examples::
+
+        the_actor.should(See.the(List.of(MENU_BUTTONS), AllClickable()))
+    """
+
+    def describe(self) -> str:
+        """Describe the Resolution's expectation."""
+        return "all clickable"
+
+    @beat("... hoping they're all clickable.")
+    def resolve(self) -> ElementsInState:
+        """Produce the Matcher to make the assertion."""
+        return all_clickable_elements()
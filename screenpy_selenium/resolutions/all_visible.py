@@ -0,0 +1,30 @@
+"""Matches a list of WebElements which are all visible."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from screenpy import beat
+
+from .custom_matchers import all_visible_elements
+
+if TYPE_CHECKING:
+    from .custom_matchers.elements_in_state import ElementsInState
+
+
+class AllVisible:
+    """Match on a list of elements which are all visible.
+
+    Examples::
+
+        the_actor.should(See.the(List.of(PRODUCT_CARDS), AllVisible()))
+    """
+
+    def describe(self) -> str:
+        """Describe the Resolution's expectation."""
+        return "all visible"
+
+    @beat("... hoping they're all visible.")
+    def resolve(self) -> ElementsInState:
+        """Produce the Matcher to make the assertion."""
+        return all_visible_elements()
@@ -0,0 +1,30 @@
+"""Matches a list of WebElements with at least one visible."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from screenpy import beat
+
+from .custom_matchers import any_visible_elements
+
+if TYPE_CHECKING:
+    from .custom_matchers.elements_in_state import ElementsInState
+
+
+class AnyVisible:
+    """Match on a list of elements with at least one which is visible.
+
+    Examples::
+
+        the_actor.should(See.the(List.of(ERROR_MESSAGES), AnyVisible()))
+    """
+
+    def describe(self) -> str:
+        """Describe the Resolution's expectation."""
+        return "any visible"
+
+    @beat("... hoping any of them are visible.")
+    def resolve(self) -> ElementsInState:
+        """Produce the Matcher to make the assertion."""
+        return any_visible_elements()
@@ -1,13 +1,23 @@
 """Custom matchers to extend the functionality of PyHamcrest for ScreenPy."""
 
+from .elements_in_state import (
+    all_clickable_elements,
+    all_visible_elements,
+    any_visible_elements,
+    no_visible_elements,
+)
 from .is_clickable_element import is_clickable_element
 from .is_invisible_element import is_invisible_element
 from .is_present_element import is_present_element
 from .is_visible_element import is_visible_element
 
 __all__ = [
+    "all_clickable_elements",
+    "all_visible_elements",
+    "any_visible_elements",
     "is_clickable_element",
     "is_invisible_element",
     "is_present_element",
     "is_visible_element",
+    "no_visible_elements",
 ]
@@ -0,0 +1,61 @@
+"""
+Read the state of elements for the custom matchers.
+
+The state of every element is read by one script, rather than a command for
+each of ``is_displayed`` and ``is_enabled`` for each element. The script
+checks visibility with the same atom ``is_displayed`` runs, so the answers
+are the same.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, NamedTuple
+
+from selenium.common.exceptions import (
+    StaleElementReferenceException,
+    WebDriverException,
+)
+
+from ...scripts import ELEMENT_STATES
+
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webelement import WebElement
+
+
+class ElementState(NamedTuple):
+    """Whether an element is present, displayed and enabled."""
+
+    present: bool
+    displayed: bool
+    enabled: bool
+
+
+def read_states(items: list[WebElement]) -> list[ElementState]:
+    """Read the state of every element with a single script.
+
+    If the script cannot be run, each element is asked with ``is_displayed``
+    and ``is_enabled`` instead.
+    """
+    if not items:
+        return []
+
+    try:
+        states = items[0].parent.execute_script(ELEMENT_STATES, items)
+    except StaleElementReferenceException:
+        raise
+    except WebDriverException:
+        states = None
+
+    if isinstance(states, list) and len(states) == len(items):
+        return [ElementState(*state) for state in states]
+    return [
+        ElementState(
+            present=True, displayed=item.is_displayed(), enabled=item.is_enabled()
+        )
+        for item in items
+    ]
+
+
+def read_state(item: WebElement) -> ElementState:
+    """Read the state of one element with a single script."""
+    return read_states([item])[0]
@@ -0,0 +1,128 @@
+"""
+A matcher that matches a list of elements which are (or aren't) visible.
+
+For example:
+
+    assert_that(driver.find_elements_by_css_selector(".card"), all_visible_elements())
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Sequence
+
+from hamcrest.core.base_matcher import BaseMatcher
+from selenium.webdriver.remote.webelement import WebElement
+
+from .element_state import read_states
+
+if TYPE_CHECKING:
+    from hamcrest.core.description import Description
+
+    from .element_state import ElementState
+
+STATE_NAMES = {"clickable": "enabled/clickable", "visible": "visible"}
+
+
+class ElementsInState(BaseMatcher[Sequence[WebElement]]):
+    """Matches a list of elements when all, any or none of them are in a state.
+
+    The state of every element is read by one script. A mismatch lists the
+    indexes of the elements which failed.
+    """
+
+    last_read: tuple[Sequence[WebElement], list[bool]] | None = None
+
+    def in_state(self, state: ElementState) -> bool:
+        """Whether one element is in the state being matched."""
+        if self.state == "clickable":
+            return state.displayed and state.enabled
+        return state.displayed
+
+    def states_of(self, items: Sequence[WebElement]) -> list[bool]:
+        """Get whether each element is in the state, reusing a fresh read."""
+        if self.last_read is not None and self.last_read[0] is items:
+            return self.last_read[1]
+        in_state = [self.in_state(state) for state in read_states(list(items))]
+        self.last_read = (items, in_state)
+        return in_state
+
+    def failing(self, items: Sequence[WebElement]) -> list[int]:
+        """Find the indexes of the elements which keep the list from matching."""
+        in_state = self.states_of(items)
+        if self.quantifier == "none":
+            return [i for i, result in enumerate(in_state) if result]
+        return [i for i, result in enumerate(in_state) if not result]
+
+    def _matches(self, items: Sequence[WebElement] | None) -> bool:
+        if items is None:
+            return False
+        self.last_read = None
+        if not items:
+            return self.quantifier == "none"
+        failing = self.failing(items)
+        if self.quantifier == "any":
+            return len(failing) < len(items)
+        return not failing
+
+    def describe_to(self, description: Description) -> None:
+        """Describe the passing case."""
+        name = STATE_NAMES[self.state]
+        if self.quantifier == "any":
+            description.append_text(f"at least one of the elements is {name}")
+            return
+        description.append_text(f"{self.quantifier} of the elements are {name}")
+
+    def describe_match(
+        self, items: Sequence[WebElement] | None, match_description: Description
+    ) -> None:
+        """Describe the matching case."""
+        name = STATE_NAMES[self.state]
+        if not items:
+            match_description.append_text("there were no elements")
+        elif self.quantifier == "any":
+            count = len(items) - len(self.failing(items))
+            match_description.append_text(f"{count} of {len(items)} were {name}")
+        else:
+            match_description.append_text(f"{self.quantifier} {len(items)} were {name}")
+
+    def describe_mismatch(
+        self, items: Sequence[WebElement] | None, mismatch_description: Description
+    ) -> None:
+        """Describe the failing case."""
+        name = STATE_NAMES[self.state]
+        if not items:
+            mismatch_description.append_text("there were no elements")
+            return
+        failing = self.failing(items)
+        if self.quantifier == "any":
+            mismatch_description.append_text(f"none of the {len(items)} were {name}")
+            return
+        indexes = ", ".join(str(i) for i in failing)
+        was = "were" if self.quantifier == "none" else "were not"
+        mismatch_description.append_text(
+            f"the elements at indexes {indexes} {was} {name}"
+        )
+
+    def __init__(self, quantifier: str, state: str) -> None:
+        self.quantifier = quantifier
+        self.state = state
+
+
+def all_visible_elements() -> ElementsInState:
+    """This matcher matches a list of elements which are all visible."""
+    return ElementsInState("all", "visible")
+
+
+def any_visible_elements() -> ElementsInState:
+    """This matcher matches a list with at least one visible element."""
+    return ElementsInState("any", "visible")
+
+
+def no_visible_elements() -> ElementsInState:
+    """This matcher matches a list of elements which are all invisible."""
+    return ElementsInState("none", "visible")
+
+
+def all_clickable_elements() -> ElementsInState:
+    """This matcher matches a list of elements which are all clickable."""
+    return ElementsInState("all", "clickable")
@@ -13,17 +13,37 @@ from typing import TYPE_CHECKING, Optional
 from hamcrest.core.base_matcher import BaseMatcher
 from selenium.webdriver.remote.webelement import WebElement
 
+from .element_state import read_state
+
 if TYPE_CHECKING:
     from hamcrest.core.description import Description
 
+    from .element_state import ElementState
+
 
 class IsClickableElement(BaseMatcher[Optional[WebElement]]):
-    """Matches an element which both ``is_enabled`` and ``is_displayed``."""
+    """Matches an element which both ``is_enabled`` and ``is_displayed``.
+
+    Both are read by one script. The state is kept to describe a mismatch,
+    so that doesn't need to ask the browser again.
+    """
+
+    last_read: tuple[WebElement, ElementState] | None = None
+
+    def state_of(self, item: WebElement) -> ElementState:
+        """Get the element's state, reusing it if it was just read."""
+        if self.last_read is not None and self.last_read[0] is item:
+            return self.last_read[1]
+        state = read_state(item)
+        self.last_read = (item, state)
+        return state
 
     def _matches(self, item: WebElement | None) -> bool:
         if item is None:
             return False
-        return item.is_displayed() and item.is_enabled()
+        self.last_read = None
+        state = self.state_of(item)
+        return state.displayed and state.enabled
 
     def describe_to(self, description: Description) -> None:
         """Describe the passing case."""
@@ -39,7 +59,7 @@ class IsClickableElement(BaseMatcher[Optional[WebElement]]):
         self, item: WebElement | None, mismatch_description: Description
     ) -> None:
         """Describe the failing case."""
-        if item is None or not item.is_displayed():
+        if item is None or not self.state_of(item).displayed:
             mismatch_description.append_text("was not even present")
             return
         mismatch_description.append_text("was not enabled/clickable")
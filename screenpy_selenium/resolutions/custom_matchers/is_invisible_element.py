@@ -13,6 +13,8 @@ from typing import TYPE_CHECKING, Optional
 from hamcrest.core.base_matcher import BaseMatcher
 from selenium.webdriver.remote.webelement import WebElement
 
+from .element_state import read_state
+
 if TYPE_CHECKING:
     from hamcrest.core.description import Description
 
@@ -23,7 +25,7 @@ class IsInvisibleElement(BaseMatcher[Optional[WebElement]]):
     def _matches(self, item: WebElement | None) -> bool:
         if item is None:
             return True
-        return item.is_displayed() is False
+        return not read_state(item).displayed
 
     def describe_to(self, description: Description) -> None:
         """Describe the passing case."""
@@ -0,0 +1,30 @@
+"""Matches a list of WebElements which are all invisible."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from screenpy import beat
+
+from .custom_matchers import no_visible_elements
+
+if TYPE_CHECKING:
+    from .custom_matchers.elements_in_state import ElementsInState
+
+
+class NoneVisible:
+    """Match on a list of elements which are all invisible.
+
+    Examples::
+
+        the_actor.should(See.the(List.of(LOADING_SPINNERS), NoneVisible()))
+    """
+
+    def describe(self) -> str:
+        """Describe the Resolution's expectation."""
+        return "none visible"
+
+    @beat("... hoping none of them are visible.")
+    def resolve(self) -> ElementsInState:
+        """Produce the Matcher to make the assertion."""
+        return no_visible_elements()
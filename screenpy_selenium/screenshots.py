@@ -0,0 +1,247 @@
+"""
+Write screenshots to disk cheaply.
+
+Taking a screenshot has to happen on the test's thread, but writing it out
+doesn't. A :class:`ScreenshotWriter` takes the image's bytes and writes them
+on a background thread instead.
+
+Screenshots can also be stored once per unique image (see the
+``DEDUPLICATE_SCREENSHOTS`` setting) and re-encoded into a smaller format
+(see ``SCREENSHOT_FORMAT``), which needs Pillow.
+"""
+
+from __future__ import annotations
+
+import atexit
+import hashlib
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextlib import suppress
+from io import BytesIO
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from .configuration import settings
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+    from PIL import Image
+
+
+FORMAT_SUFFIXES = {"jpeg": ".jpg", "palette": ".png", "png": ".png", "webp": ".webp"}
+
+saved_screenshots: dict[str, str] = {}
+"""The path each unique screenshot was first saved at, by its hash."""
+
+
+def screenshot_path(path: str) -> str:
+    """Give the path a screenshot will be saved at, in the configured format."""
+    if settings.SCREENSHOT_FORMAT == "png":
+        return path
+    return str(Path(path).with_suffix(FORMAT_SUFFIXES[settings.SCREENSHOT_FORMAT]))
+
+
+def open_image(data: bytes, purpose: str) -> Image.Image:
+    """Open the image bytes with Pillow.
+
+    Raises:
+        ImportError: if Pillow is not installed.
+    """
+    try:
+        from PIL import Image  # noqa: PLC0415
+    except ImportError as e:
+        msg = f"{purpose} needs Pillow. Install it with `pip install pillow`."
+        raise ImportError(msg) from e
+
+    return Image.open(BytesIO(data))
+
+
+def crop_screenshot(
+    data: bytes,
+    region: tuple[int, int, int, int] | None = None,
+    factor: float = 1,
+) -> bytes:
+    """Crop a PNG screenshot to the region, then shrink it by the factor.
+
+    The region is given as (x, y, width, height) in the screenshot's pixels.
+
+    Raises:
+        ImportError: if Pillow is not installed.
+    """
+    image = open_image(data, "Cropping or downscaling screenshots")
+    if region is not None:
+        x, y, width, height = region
+        image = image.crop((x, y, x + width, y + height))
+    if factor != 1:
+        width = max(1, round(image.width / factor))
+        height = max(1, round(image.height / factor))
+        image = image.resize((width, height))
+    cropped = BytesIO()
+    image.save(cropped, format="PNG")
+    return cropped.getvalue()
+
+
+def encode_screenshot(data: bytes, image_format: str, quality: int) -> bytes:
+    """Re-encode a PNG screenshot into a (usually) smaller format.
+
+    ``quality`` is the JPEG or WebP quality, or for a reduced-palette PNG,
+    the percentage of 256 colors to keep.
+
+    Raises:
+        ImportError: if Pillow is not installed.
+    """
+    image = open_image(data, f'Saving screenshots as "{image_format}"')
+    encoded = BytesIO()
+    if image_format == "palette":
+        colors = max(2, round(256 * quality / 100))
+        palette_image = image.convert("RGB").quantize(colors=colors)
+        palette_image.save(encoded, format="PNG", optimize=True)
+    elif image_format == "jpeg":
+        image.convert("RGB").save(encoded, format="JPEG", quality=quality)
+    else:
+        image.save(encoded, format=image_format.upper(), quality=quality)
+    return encoded.getvalue()
+
+
+def link_screenshot(original: str, path: str) -> bool:
+    """Hard-link the path to an identical screenshot which was already saved.
+
+    Returns:
+        True if the path now holds the screenshot, False if it could not be
+        linked (e.g. the original was deleted, or it is on another drive).
+    """
+    if os.path.abspath(original) == os.path.abspath(path):
+        return os.path.exists(path)
+    try:
+        with suppress(FileNotFoundError):
+            os.unlink(path)
+        os.link(original, path)
+    except OSError:
+        return False
+    return True
+
+
+def save_screenshot(path: str, data: bytes) -> None:
+    """Save the screenshot's bytes to the path, as the settings describe."""
+    digest = None
+    if settings.DEDUPLICATE_SCREENSHOTS:
+        digest = hashlib.sha256(data).hexdigest()
+        original = saved_screenshots.get(digest)
+        if original is not None and link_screenshot(original, path):
+            return
+        # the path may be linked to another screenshot, which must not change
+        with suppress(FileNotFoundError):
+            os.unlink(path)
+        for other_digest, saved_path in list(saved_screenshots.items()):
+            if saved_path == path:
+                del saved_screenshots[other_digest]
+
+    if settings.SCREENSHOT_FORMAT != "png":
+        data = encode_screenshot(
+            data, settings.SCREENSHOT_FORMAT, settings.SCREENSHOT_QUALITY
+        )
+
+    with open(path, "wb+") as screenshot_file:
+        screenshot_file.write(data)
+
+    if digest is not None:
+        saved_screenshots[digest] = path
+
+
+class ScreenshotWriter:
+    """Save screenshots on a background thread.
+
+    At most ``max_pending`` (by default, the ``SCREENSHOT_QUEUE_SIZE``
+    setting) screenshots can be waiting to be written. Writing another one
+    blocks until there is room, so a slow disk holds up the test rather than
+    filling up memory.
+
+    Call :meth:`flush` to make sure every file exists, e.g. before reports
+    are generated. BrowseTheWeb does this when it is forgotten, and it is
+    done when Python exits as well.
+
+    Examples::
+
+        screenshot_writer.write("screenshot.png", png_bytes)
+        ...
+        screenshot_writer.flush()
+    """
+
+    pending: dict[Future[None], object]
+    errors: list[tuple[object, BaseException]]
+    executor: ThreadPoolExecutor | None
+    slots: threading.BoundedSemaphore | None
+
+    def write(self, path: str, data: bytes, owner: object = None) -> Future[None]:
+        """Write the bytes to the path in the background.
+
+        Blocks while the queue is full. The owner (e.g. the Actor's
+        BrowseTheWeb) can later flush just its own screenshots.
+        """
+        if self.executor is None or self.slots is None:
+            max_pending = self.max_pending or settings.SCREENSHOT_QUEUE_SIZE
+            self.slots = threading.BoundedSemaphore(max_pending)
+            self.executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="ScreenshotWriter"
+            )
+        self.slots.acquire()
+        future = self.executor.submit(save_screenshot, path, data)
+        with self.lock:
+            self.pending[future] = owner
+        future.add_done_callback(self._finished)
+        return future
+
+    def flush(self, owner: object = None) -> None:
+        """Wait for every queued screenshot to be written.
+
+        If an owner is given, only its screenshots are waited for, and only
+        its errors are raised.
+
+        Raises:
+            OSError: (or whatever else was raised) if any screenshot could not
+                be written since the last flush.
+        """
+        with self.lock:
+            pending = [
+                future
+                for future, written_for in self.pending.items()
+                if owner is None or written_for is owner
+            ]
+        wait(pending)
+        with self.lock:
+            errors = [
+                error
+                for written_for, error in self.errors
+                if owner is None or written_for is owner
+            ]
+            self.errors = [
+                (written_for, error)
+                for written_for, error in self.errors
+                if owner is not None and written_for is not owner
+            ]
+        if errors:
+            raise errors[0]
+
+    def _finished(self, future: Future[None]) -> None:
+        """Free up the screenshot's slot in the queue."""
+        with self.lock:
+            owner = self.pending.pop(future, None)
+            error = future.exception()
+            if error is not None:
+                self.errors.append((owner, error))
+        if self.slots is not None:
+            self.slots.release()
+
+    def __init__(self, max_pending: int | None = None) -> None:
+        self.max_pending = max_pending
+        self.lock = threading.Lock()
+        self.pending = {}
+        self.errors = []
+        self.executor = None
+        self.slots = None
+
+
+screenshot_writer = ScreenshotWriter()
+atexit.register(screenshot_writer.flush)
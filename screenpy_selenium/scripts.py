@@ -0,0 +1,549 @@
+"""
+JavaScript run in the browser to answer many things in one round-trip.
+
+Each WebDriver command is a round-trip to the browser, which adds up quickly
+on a remote grid. These snippets let a single ``execute_script`` call do the
+work of many commands.
+"""
+
+from __future__ import annotations
+
+import pkgutil
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.command import Command
+
+
+def selenium_atom(name: str) -> str:
+    """Read one of the JavaScript atoms Selenium runs for its own commands."""
+    atom = pkgutil.get_data("selenium", f"webdriver/remote/{name}")
+    if atom is None:
+        msg = f"Could not read Selenium's {name} atom."
+        raise ImportError(msg)
+    return atom.decode("utf-8")
+
+
+SCRIPTABLE_STRATEGIES = {
+    By.CLASS_NAME,
+    By.CSS_SELECTOR,
+    By.ID,
+    By.LINK_TEXT,
+    By.NAME,
+    By.PARTIAL_LINK_TEXT,
+    By.TAG_NAME,
+    By.XPATH,
+}
+"""Locator strategies which the :data:`FIND_ELEMENTS` function understands."""
+
+READ_ONLY = "/* read-only */"
+"""Starts every script here which only reads the page, and never changes it."""
+
+READ_ONLY_MARKERS = (READ_ONLY, "/* getAttribute */", "/* isDisplayed */")
+"""How read-only scripts start, including Selenium's own for its commands."""
+
+SCRIPT_COMMANDS = {
+    Command.EXECUTE_ASYNC_SCRIPT,
+    Command.W3C_EXECUTE_SCRIPT,
+    Command.W3C_EXECUTE_SCRIPT_ASYNC,
+}
+
+
+def is_read_only_script(command: str, params: dict | None) -> bool:
+    """Check if the command runs a script which is known to only read the page.
+
+    Caches and snapshots can stay valid through these, even though other
+    scripts might change anything.
+    """
+    if command not in SCRIPT_COMMANDS or not params:
+        return False
+    script = params.get("script")
+    return isinstance(script, str) and script.startswith(READ_ONLY_MARKERS)
+
+
+FIND_ELEMENTS = """
+function findElements(using, value) {
+    if (using === "xpath") {
+        var snapshot = document.evaluate(
+            value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+        );
+        var nodes = [];
+        for (var i = 0; i < snapshot.snapshotLength; i++) {
+            nodes.push(snapshot.snapshotItem(i));
+        }
+        return nodes;
+    }
+    if (using === "link text" || using === "partial link text") {
+        return Array.prototype.filter.call(
+            document.querySelectorAll("a"),
+            function (link) {
+                var text = (link.innerText || link.textContent || "").trim();
+                if (using === "link text") {
+                    return text === value;
+                }
+                return text.indexOf(value) > -1;
+            }
+        );
+    }
+    var selectors = {
+        "class name": function () { return "." + CSS.escape(value); },
+        "css selector": function () { return value; },
+        "id": function () { return '[id="' + CSS.escape(value) + '"]'; },
+        "name": function () { return '[name="' + CSS.escape(value) + '"]'; },
+        "tag name": function () { return value; }
+    };
+    return Array.prototype.slice.call(
+        document.querySelectorAll(selectors[using]())
+    );
+}
+"""
+"""Define ``findElements(using, value)``, which mimics WebDriver's lookups."""
+
+IS_DISPLAYED = """
+function isDisplayed(element) {
+    if (!element || !element.isConnected) {
+        return false;
+    }
+    var tagName = element.tagName.toLowerCase();
+    if (tagName === "option" || tagName === "optgroup") {
+        var select = element.closest("select");
+        return select !== null && isDisplayed(select);
+    }
+    if (typeof element.checkVisibility === "function") {
+        var visible = element.checkVisibility({
+            checkOpacity: true,
+            checkVisibilityCSS: true,
+            opacityProperty: true,
+            visibilityProperty: true
+        });
+        if (!visible) {
+            return false;
+        }
+    } else {
+        var style = window.getComputedStyle(element);
+        if (
+            element.getClientRects().length === 0
+            || style.visibility !== "visible"
+            || Number(style.opacity) === 0
+        ) {
+            return false;
+        }
+    }
+    var rect = element.getBoundingClientRect();
+    if (rect.width > 0 && rect.height > 0) {
+        return true;
+    }
+    return Array.prototype.some.call(element.children, isDisplayed);
+}
+"""
+"""Define ``isDisplayed(element)``, which approximates WebDriver's check."""
+
+VISIBLE_TEXT = IS_DISPLAYED + """
+function visibleText(element) {
+    if (!isDisplayed(element)) {
+        return "";
+    }
+    return (element.innerText || "").replace(/\\u00a0/g, " ").trim();
+}
+"""
+"""Define ``visibleText(element)``, which approximates ``WebElement.text``."""
+
+SELENIUM_IS_DISPLAYED = f"var isDisplayed = {selenium_atom('isDisplayed.js')};\n"
+"""
+Define ``isDisplayed(element)`` as Selenium's atom, which ``is_displayed`` runs.
+
+Put after :data:`IS_DISPLAYED`, this replaces the approximation everywhere,
+including inside ``visibleText``.
+"""
+
+ATTRIBUTE_VALUE = """
+var BOOLEAN_ATTRIBUTES = [
+    "allowfullscreen", "async", "autofocus", "autoplay", "checked", "compact",
+    "complete", "controls", "declare", "default", "defaultchecked",
+    "defaultselected", "defer", "disabled", "ended", "formnovalidate", "hidden",
+    "indeterminate", "iscontenteditable", "ismap", "itemscope", "loop",
+    "multiple", "muted", "nohref", "nomodule", "noresize", "noshade",
+    "novalidate", "nowrap", "open", "paused", "playsinline", "pubdate",
+    "readonly", "required", "reversed", "scoped", "seamless", "seeking",
+    "selected", "truespeed", "willvalidate"
+];
+function attributeValue(element, name) {
+    var lowerName = name.toLowerCase();
+    if (lowerName === "style") {
+        return element.style.cssText;
+    }
+    if (lowerName === "class") {
+        return element.getAttribute("class");
+    }
+    if (lowerName === "readonly") {
+        name = "readOnly";
+    }
+    if (BOOLEAN_ATTRIBUTES.indexOf(lowerName) > -1) {
+        return element[name] === true || element.hasAttribute(lowerName)
+            ? "true"
+            : null;
+    }
+    var property = element[name];
+    if (
+        property !== undefined
+        && property !== null
+        && typeof property !== "object"
+        && typeof property !== "function"
+    ) {
+        return String(property);
+    }
+    return element.getAttribute(name);
+}
+"""
+"""Define ``attributeValue(element, name)``, like ``WebElement.get_attribute``."""
+
+FIND_FIRST_ELEMENTS = READ_ONLY + FIND_ELEMENTS + """
+return arguments[0].map(function (locator) {
+    try {
+        var found = findElements(locator[0], locator[1]);
+        return found.length ? found[0] : null;
+    } catch (error) {
+        return {"error": String(error)};
+    }
+});
+"""
+"""Find the first element for each ``[using, value]`` pair in ``arguments[0]``."""
+
+READ_VISIBLE_TEXTS = READ_ONLY + FIND_ELEMENTS + VISIBLE_TEXT + """
+return findElements(arguments[0], arguments[1]).map(visibleText);
+"""
+"""Read the visible text of every element the locator finds."""
+
+READ_ATTRIBUTES = READ_ONLY + FIND_ELEMENTS + ATTRIBUTE_VALUE + """
+var names = arguments[2];
+return findElements(arguments[0], arguments[1]).map(function (element) {
+    return names.map(function (name) {
+        return attributeValue(element, name);
+    });
+});
+"""
+"""Read the named attributes (``arguments[2]``) of every element found."""
+
+READ_SELECTED_OPTIONS = READ_ONLY + FIND_ELEMENTS + VISIBLE_TEXT + """
+var select = findElements(arguments[0], arguments[1])[0];
+if (select === undefined || select.tagName.toLowerCase() !== "select") {
+    return null;
+}
+return Array.prototype.filter.call(select.options, function (option) {
+    return option.selected;
+}).map(function (option) {
+    return [visibleText(option), option.value, option.index];
+});
+"""
+"""
+Read ``[text, value, index]`` for each selected option of the first element.
+
+Returns ``null`` if the first element found is not a ``<select>``.
+"""
+
+COUNT_ELEMENTS = READ_ONLY + FIND_ELEMENTS + """
+return findElements(arguments[0], arguments[1]).length;
+"""
+"""Count the elements the locator finds, without sending any of them back."""
+
+WAIT_FOR_CONDITION = (
+    READ_ONLY + FIND_ELEMENTS + VISIBLE_TEXT + SELENIUM_IS_DISPLAYED + """
+var using = arguments[0];
+var value = arguments[1];
+var condition = arguments[2];
+var text = arguments[3];
+var timeout = arguments[4];
+var interval = arguments[5];
+var done = arguments[arguments.length - 1];
+
+function isSatisfied() {
+    var element = findElements(using, value)[0];
+    var displayed = element !== undefined && isDisplayed(element);
+    switch (condition) {
+        case "disappear":
+            return !displayed;
+        case "clickable":
+            return displayed && !element.disabled;
+        case "contain text":
+            return element !== undefined && visibleText(element).indexOf(text) > -1;
+        default:
+            return displayed;
+    }
+}
+
+var finished = false;
+var observer = null;
+var timers = [];
+function finish(result) {
+    if (finished) {
+        return;
+    }
+    finished = true;
+    if (observer !== null) {
+        observer.disconnect();
+    }
+    timers.forEach(clearTimeout);
+    done(result);
+}
+function check() {
+    try {
+        if (isSatisfied()) {
+            finish(true);
+        }
+    } catch (error) {
+        finish({"error": String(error)});
+    }
+}
+
+check();
+if (!finished) {
+    observer = new MutationObserver(check);
+    observer.observe(document, {
+        attributes: true, characterData: true, childList: true, subtree: true
+    });
+    // styles can change without a mutation (e.g. transitions), so check
+    // now and then as well. This costs nothing over the wire.
+    timers.push(setInterval(check, interval));
+    timers.push(setTimeout(function () {
+        check();
+        finish(false);
+    }, timeout));
+}
+"""
+)
+"""
+Wait, inside the page, for an element to satisfy a condition.
+
+Run with ``execute_async_script``, passing the locator's strategy and value,
+the condition ("appear", "clickable", "disappear", or "contain text"), the
+text to look for, the timeout and the check interval (both in milliseconds).
+Calls back with ``true``, ``false`` if the timeout was reached, or an object
+with an ``error`` if the condition could not be checked. Visibility is checked
+with Selenium's own atom, so this finishes when polling would have.
+"""
+
+ARE_DISPLAYED = READ_ONLY + FIND_ELEMENTS + SELENIUM_IS_DISPLAYED + """
+return arguments[0].map(function (locator) {
+    try {
+        var element = findElements(locator[0], locator[1])[0];
+        return element !== undefined && isDisplayed(element);
+    } catch (error) {
+        return {"error": String(error)};
+    }
+});
+"""
+"""
+Check if the first element for each ``[using, value]`` pair is displayed.
+
+This uses Selenium's own atom, so each answer is the same as asking the
+element itself.
+"""
+
+CLEAR_STORAGE = """
+try {
+    window.localStorage.clear();
+} catch (error) {}
+try {
+    window.sessionStorage.clear();
+} catch (error) {}
+"""
+"""Clear the current page's local and session storage, where it is allowed."""
+
+FILL_FIELDS = FIND_ELEMENTS + """
+function fillField(element, text) {
+    if (element.disabled || element.readOnly) {
+        return "the field cannot be edited";
+    }
+    // use the native setter, so frameworks which track the value notice it
+    var descriptor = Object.getOwnPropertyDescriptor(
+        Object.getPrototypeOf(element), "value"
+    );
+    if (descriptor && descriptor.set) {
+        descriptor.set.call(element, text);
+    } else if (element.isContentEditable) {
+        element.textContent = text;
+    } else {
+        return "the element does not take a value";
+    }
+    element.dispatchEvent(new Event("input", {"bubbles": true}));
+    element.dispatchEvent(new Event("change", {"bubbles": true}));
+    return null;
+}
+return arguments[0].map(function (field) {
+    try {
+        var element = findElements(field[0], field[1])[0];
+        if (element === undefined) {
+            return "not found";
+        }
+        return fillField(element, field[2]);
+    } catch (error) {
+        return String(error);
+    }
+});
+"""
+"""
+Set the value of the first element for each ``[using, value, text]`` triple.
+
+Fires bubbling ``input`` and ``change`` events on each field it fills in.
+Returns, for each triple, ``null`` if the field was filled in, ``"not found"``
+if no element was found, or else a description of what went wrong.
+"""
+
+SELECT_OPTION = """
+var select = arguments[0];
+var how = arguments[1];
+var wanted = arguments[2];
+if (!select || select.tagName.toLowerCase() !== "select" || select.disabled) {
+    return false;
+}
+var matches = Array.prototype.filter.call(select.options, function (option) {
+    switch (how) {
+        case "index":
+            return String(option.index) === wanted;
+        case "value":
+            return option.value === wanted;
+        default:
+            return option.text === wanted;
+    }
+});
+if (!select.multiple) {
+    matches = matches.slice(0, 1);
+}
+if (
+    matches.length === 0
+    || matches.some(function (option) { return option.disabled; })
+) {
+    return false;
+}
+var changed = false;
+matches.forEach(function (option) {
+    if (!option.selected) {
+        option.selected = true;
+        changed = true;
+    }
+});
+if (changed) {
+    select.dispatchEvent(new Event("input", {"bubbles": true}));
+    select.dispatchEvent(new Event("change", {"bubbles": true}));
+}
+return true;
+"""
+"""
+Select the options of the ``<select>`` element in ``arguments[0]`` which match.
+
+``arguments[1]`` says how to match them ("text", "index", or "value"), and
+``arguments[2]`` is what to match, as a string. Only the first match is
+selected, unless the dropdown allows many. Returns ``true`` if they were
+selected, or ``false`` if there was no match, or the match was disabled.
+"""
+
+
+ELEMENT_STATES = READ_ONLY + SELENIUM_IS_DISPLAYED + """
+return arguments[0].map(function (element) {
+    var present = element.isConnected;
+    return [
+        present,
+        present && isDisplayed(element),
+        !(element.matches && element.matches(":disabled"))
+    ];
+});
+"""
+"""Read ``[present, displayed, enabled]`` for each element in ``arguments[0]``."""
+
+TAKE_SNAPSHOT = READ_ONLY + FIND_ELEMENTS + VISIBLE_TEXT + ATTRIBUTE_VALUE + """
+var PROPERTIES = ["checked", "disabled", "selected", "value"];
+function snapshotOf(element) {
+    var attributes = {};
+    element.getAttributeNames().concat(PROPERTIES).forEach(function (name) {
+        attributes[name] = attributeValue(element, name);
+    });
+    var selected = null;
+    if (element.tagName.toLowerCase() === "select") {
+        selected = Array.prototype.filter.call(element.options, function (option) {
+            return option.selected;
+        }).map(function (option) {
+            return [visibleText(option), option.value, option.index];
+        });
+    }
+    return [visibleText(element), attributes, selected];
+}
+return [
+    document.title,
+    document.URL,
+    arguments[0].map(function (locator) {
+        try {
+            return findElements(locator[0], locator[1]).map(snapshotOf);
+        } catch (error) {
+            return null;
+        }
+    })
+];
+"""
+"""
+Read the page's title and URL, and every element each locator finds.
+
+``arguments[0]`` is a list of ``[using, value]`` pairs. Each element is read
+as ``[text, attributes, selected]``, where ``attributes`` holds the value of
+each of its attributes (and a few common properties), and ``selected`` holds
+``[text, value, index]`` for each selected option of a ``<select>``. A
+locator which could not be used gives ``null``.
+"""
+
+READ_TABLE = READ_ONLY + FIND_ELEMENTS + VISIBLE_TEXT + """
+var table = findElements(arguments[0], arguments[1])[0];
+if (table === undefined) {
+    return {"error": "not found"};
+}
+var rows;
+var cellsOf;
+if (table.tagName.toLowerCase() === "table") {
+    rows = Array.prototype.slice.call(table.rows);
+    cellsOf = function (row) { return row.cells; };
+} else if (["grid", "table", "treegrid"].indexOf(table.getAttribute("role")) > -1) {
+    rows = Array.prototype.slice.call(table.querySelectorAll('[role="row"]'));
+    cellsOf = function (row) {
+        return row.querySelectorAll(
+            '[role="cell"], [role="gridcell"], '
+            + '[role="columnheader"], [role="rowheader"]'
+        );
+    };
+} else {
+    return {"error": "not a table"};
+}
+function isHeader(cell) {
+    return cell.tagName.toLowerCase() === "th"
+        || cell.getAttribute("role") === "columnheader";
+}
+function readRow(row) {
+    var texts = [];
+    Array.prototype.forEach.call(cellsOf(row), function (cell) {
+        texts.push(visibleText(cell));
+        // keep the columns lined up under cells which span several
+        for (var i = 1; i < (Number(cell.getAttribute("colspan")) || 1); i++) {
+            texts.push("");
+        }
+    });
+    return texts;
+}
+var headers = null;
+if (arguments[2] && rows.length) {
+    var headerRow = table.tHead && table.tHead.rows.length
+        ? table.tHead.rows[table.tHead.rows.length - 1]
+        : rows[0];
+    var headerCells = Array.prototype.slice.call(cellsOf(headerRow));
+    if (headerCells.length && headerCells.every(isHeader)) {
+        headers = readRow(headerRow);
+        rows = rows.filter(function (row) {
+            return !(table.tHead && table.tHead.contains(row)) && row !== headerRow;
+        });
+    }
+}
+return [headers, rows.map(readRow)];
+"""
+"""
+Read the text of every cell of the first ``<table>`` or ARIA grid found.
+
+If ``arguments[2]`` is true, the last row of the ``<thead>`` (or else the
+first row, if it is all header cells) is read as the headers. Returns
+``[headers, rows]``, where ``headers`` is ``null`` if none were found, or an
+object with an ``error`` if there is no table.
+"""
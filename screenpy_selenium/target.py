@@ -8,13 +8,14 @@ will be used by Actors to find elements.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Iterator
+from typing import TYPE_CHECKING, Any, Iterator
 
 from selenium.common.exceptions import WebDriverException
 from selenium.webdriver.common.by import By
 
 from .abilities.browse_the_web import BrowseTheWeb
 from .exceptions import TargetingError
+from .scripts import FIND_FIRST_ELEMENTS, SCRIPTABLE_STRATEGIES
 
 if TYPE_CHECKING:
     from screenpy.actor import Actor
@@ -109,14 +110,27 @@ class Target:
         return self.locator
 
     def found_by(self, the_actor: Actor) -> WebElement:
-        """Retrieve the |WebElement| as viewed by the Actor."""
-        browser = the_actor.ability_to(BrowseTheWeb).browser
+        """Retrieve the |WebElement| as viewed by the Actor.
+
+        If the Actor's :class:`~screenpy_selenium.abilities.BrowseTheWeb` has
+        an element cache, a previously found element will be reused.
+        """
+        browse_the_web = the_actor.ability_to(BrowseTheWeb)
+        cache = browse_the_web.element_cache
+        locator = self.get_locator()
+        if cache is not None and locator in cache.elements:
+            return cache.elements[locator]
+
         try:
-            return browser.find_element(*self)
+            element = browse_the_web.browser.find_element(*locator)
         except WebDriverException as e:
             msg = f"{e} raised while trying to find {self}."
             raise TargetingError(msg) from e
 
+        if cache is not None:
+            cache.elements[locator] = element
+        return element
+
     def all_found_by(self, the_actor: Actor) -> list[WebElement]:
         """Retrieve a list of |WebElement| objects as viewed by the Actor."""
         browser = the_actor.ability_to(BrowseTheWeb).browser
@@ -126,6 +140,88 @@ class Target:
             msg = f"{e} raised while trying to find {self}."
             raise TargetingError(msg) from e
 
+    def all_scripted_by(
+        self, the_actor: Actor, script: str, *args: Any  # noqa: ANN401
+    ) -> Any | None:  # noqa: ANN401
+        """Run a script against all of this Target's elements in one round-trip.
+
+        The script is given the locator's strategy and value as
+        ``arguments[0]`` and ``arguments[1]``, followed by any other args.
+        It can use the ``findElements`` function from
+        :data:`~screenpy_selenium.scripts.FIND_ELEMENTS` to find them.
+
+        Returns:
+            The script's result, or ``None`` if the locator's strategy cannot
+            be used in a script or the script could not be run. Callers can
+            then fall back to :meth:`all_found_by`.
+        """
+        using, value = self.get_locator()
+        if using not in SCRIPTABLE_STRATEGIES:
+            return None
+
+        browser = the_actor.ability_to(BrowseTheWeb).browser
+        try:
+            return browser.execute_script(script, using, value, *args)
+        except WebDriverException:
+            return None
+
+    @classmethod
+    def resolve_all(cls, the_actor: Actor, *targets: Target) -> list[WebElement | None]:
+        """Retrieve the |WebElement| for each Target in one call to the browser.
+
+        All the Targets are looked up by a single script, rather than a
+        ``find_element`` command for each. Targets with a locator strategy
+        the script does not understand are looked up individually.
+
+        Returns:
+            The first element found for each Target, in the same order, or
+            ``None`` for each Target which found nothing.
+
+        Raises:
+            TargetingError: if a Target has no locator, or its locator could
+                not be used to look for elements.
+        """
+        browse_the_web = the_actor.ability_to(BrowseTheWeb)
+        browser = browse_the_web.browser
+        cache = browse_the_web.element_cache
+        locators = [target.get_locator() for target in targets]
+        elements: list[WebElement | None] = [
+            cache.elements.get(locator) if cache is not None else None
+            for locator in locators
+        ]
+
+        unresolved = [i for i, element in enumerate(elements) if element is None]
+        scripted = [i for i in unresolved if locators[i][0] in SCRIPTABLE_STRATEGIES]
+        individual = [i for i in unresolved if i not in scripted]
+        if scripted:
+            try:
+                results = browser.execute_script(
+                    FIND_FIRST_ELEMENTS, [list(locators[i]) for i in scripted]
+                )
+            except WebDriverException as e:
+                names = ", ".join(str(targets[i]) for i in scripted)
+                msg = f"{e} raised while trying to find {names}."
+                raise TargetingError(msg) from e
+            for i, result in zip(scripted, results):
+                if isinstance(result, dict):
+                    msg = f"{result['error']} raised while trying to find {targets[i]}."
+                    raise TargetingError(msg)
+                elements[i] = result
+
+        for i in individual:
+            try:
+                found = browser.find_elements(*locators[i])
+            except WebDriverException as e:
+                msg = f"{e} raised while trying to find {targets[i]}."
+                raise TargetingError(msg) from e
+            elements[i] = found[0] if found else None
+
+        if cache is not None:
+            for locator, element in zip(locators, elements):
+                if element is not None:
+                    cache.elements[locator] = element
+        return elements
+
     def __repr__(self) -> str:
         """A Target is represented by its name."""
         return f"{self.target_name}"
@@ -0,0 +1,228 @@
+"""
+Record a timeline of a test, to view in Perfetto or ``chrome://tracing``.
+
+The timeline is written in the Chrome trace-event format. It shows each beat
+(every Action and Question with a ``@beat``), each poll of a Wait, and each
+WebDriver command, nested inside one another.
+
+Nothing is recorded unless a :class:`Tracer` has been started, and nothing is
+wrapped or patched until then either.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Generator
+
+from screenpy import the_narrator
+
+from .instrumentation import unwrap_executor
+
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
+
+active_tracer: Tracer | None = None
+"""The Tracer which is currently recording, if any."""
+
+
+class Tracer:
+    """Record spans of time, and write them out as a Chrome trace.
+
+    While started, every beat is recorded through the Narrator, and every
+    Wait records each time it polls its condition. Call :meth:`watch` (or use
+    :meth:`~screenpy_selenium.abilities.BrowseTheWeb.with_tracer`) to record
+    a browser's WebDriver commands as well.
+
+    Beats narrated while the Narrator is off the air (e.g. inside
+    ``Silently``) or while its mic cable is kinked are not recorded.
+
+    Examples::
+
+        tracer = Tracer().start()
+        Perry = AnActor.named("Perry").who_can(
+            BrowseTheWeb.using_chrome().with_tracer(tracer)
+        )
+
+        ...
+
+        tracer.save(f"traces/{test_name}.json")
+        tracer.stop()
+    """
+
+    events: list[dict[str, Any]]
+    browsers: list[WebDriver]
+
+    def start(self) -> Tracer:
+        """Start recording beats and Wait polls."""
+        global active_tracer  # noqa: PLW0603
+        if self.adapter not in the_narrator.adapters:
+            the_narrator.attach_adapter(self.adapter)
+        active_tracer = self
+        return self
+
+    def stop(self) -> None:
+        """Stop recording beats, Wait polls, and the watched browsers."""
+        global active_tracer  # noqa: PLW0603
+        if self.adapter in the_narrator.adapters:
+            the_narrator.adapters.remove(self.adapter)
+        if active_tracer is self:
+            active_tracer = None
+        for browser in list(self.browsers):
+            self.unwatch(browser)
+
+    def watch(self, browser: WebDriver) -> None:
+        """Record every command the browser sends from now on."""
+        executor = TracingExecutor(browser.command_executor, self)
+        browser.command_executor = executor  # type: ignore[assignment]
+        if browser not in self.browsers:
+            self.browsers.append(browser)
+
+    def unwatch(self, browser: WebDriver) -> None:
+        """Stop recording the browser's commands."""
+        unwrap_executor(
+            browser, lambda e: isinstance(e, TracingExecutor) and e.tracer is self
+        )
+        if browser in self.browsers:
+            self.browsers.remove(browser)
+
+    @contextmanager
+    def span(
+        self, name: str, category: str, **args: Any  # noqa: ANN401
+    ) -> Generator[None, None, None]:
+        """Record the time spent inside this context."""
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.record(name, category, start, time.perf_counter_ns(), args)
+
+    def traced(self, func: Callable, name: str, category: str) -> Callable:
+        """Wrap the function so each call to it is recorded as a span."""
+
+        def traced_func(*args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+            with self.span(name, category):
+                return func(*args, **kwargs)
+
+        return traced_func
+
+    def mark(self, name: str, category: str, **args: Any) -> None:  # noqa: ANN401
+        """Record a moment in time, like an aside or an error."""
+        self.events.append(
+            {
+                "name": name,
+                "cat": category,
+                "ph": "i",
+                "s": "t",
+                "ts": (time.perf_counter_ns() - self.origin) / 1000,
+                "pid": self.pid,
+                "tid": threading.get_ident(),
+                "args": args,
+            }
+        )
+
+    def record(
+        self,
+        name: str,
+        category: str,
+        start: int,
+        end: int,
+        args: dict[str, Any] | None = None,
+    ) -> None:
+        """Record a span, given its start and end in nanoseconds."""
+        self.events.append(
+            {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": (start - self.origin) / 1000,
+                "dur": (end - start) / 1000,
+                "pid": self.pid,
+                "tid": threading.get_ident(),
+                "args": args or {},
+            }
+        )
+
+    def save(self, path: str | Path) -> None:
+        """Write the recorded events to a trace file, then clear them."""
+        trace = {"traceEvents": self.events, "displayTimeUnit": "ms"}
+        Path(path).write_text(json.dumps(trace, default=str), encoding="utf-8")
+        self.clear()
+
+    def clear(self) -> None:
+        """Forget every recorded event, e.g. between tests."""
+        self.events = []
+
+    def __init__(self) -> None:
+        self.events = []
+        self.browsers = []
+        self.origin = time.perf_counter_ns()
+        self.pid = os.getpid()
+        self.adapter = TraceAdapter(self)
+
+
+class TraceAdapter:
+    """A Narrator adapter which records each narration in a Tracer."""
+
+    def act(
+        self, func: Callable, line: str, gravitas: str | None = None  # noqa: ARG002
+    ) -> Generator:
+        """Record the act as a span."""
+        with self.tracer.span(line, "act"):
+            yield func
+
+    def scene(
+        self, func: Callable, line: str, gravitas: str | None = None  # noqa: ARG002
+    ) -> Generator:
+        """Record the scene as a span."""
+        with self.tracer.span(line, "scene"):
+            yield func
+
+    def beat(
+        self, func: Callable, line: str, gravitas: str | None = None  # noqa: ARG002
+    ) -> Generator:
+        """Record the beat as a span."""
+        with self.tracer.span(line, "beat"):
+            yield func
+
+    def aside(
+        self, func: Callable, line: str, gravitas: str | None = None  # noqa: ARG002
+    ) -> Generator:
+        """Record the aside as a moment."""
+        self.tracer.mark(line, "aside")
+        yield func
+
+    def error(self, exc: Exception) -> None:
+        """Record the error as a moment."""
+        self.tracer.mark(exc.__class__.__name__, "error", message=str(exc))
+
+    def attach(self, filepath: Path | str, **kwargs: Any) -> None:  # noqa: ANN401
+        """Record the attachment as a moment."""
+        self.tracer.mark(str(filepath), "attach", **kwargs)
+
+    def __init__(self, tracer: Tracer) -> None:
+        self.tracer = tracer
+
+
+class TracingExecutor:
+    """Wrap a command executor to record each command as a span.
+
+    All other attributes are passed through to the wrapped executor.
+    """
+
+    def execute(self, command: str, params: dict) -> dict[str, Any]:
+        """Execute the command inside a span."""
+        with self.tracer.span(command, "command"):
+            return self.executor.execute(command, params)
+
+    def __getattr__(self, name: str) -> Any:  # noqa: ANN401
+        """Pass everything else through to the wrapped executor."""
+        return getattr(self.executor, name)
+
+    def __init__(self, executor: Any, tracer: Tracer) -> None:  # noqa: ANN401
+        self.executor = executor
+        self.tracer = tracer
@@ -19,6 +19,9 @@ def Tester() -> AnActor:
     AuthenticateWith2FA_Mocked.otp = mock.Mock()
     BrowseTheWeb_Mocked = mock.create_autospec(BrowseTheWeb, instance=True)
     BrowseTheWeb_Mocked.browser = mock.create_autospec(WebDriver, instance=True)
+    BrowseTheWeb_Mocked.element_cache = None
+    BrowseTheWeb_Mocked.console_log = None
+    BrowseTheWeb_Mocked.snapshot = None
 
     return AnActor.named("Tester").who_can(
         AuthenticateWith2FA_Mocked, BrowseTheWeb_Mocked
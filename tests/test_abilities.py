@@ -1,15 +1,47 @@
 from __future__ import annotations
 
+import json
 import os
+import threading
+import time
+from typing import TYPE_CHECKING, Any
 from unittest import mock
 
 import pytest
-from screenpy import Forgettable
+from screenpy import Forgettable, aside, beat, the_narrator
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver import Firefox
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.webelement import WebElement
 
-from screenpy_selenium import BrowseTheWeb, BrowsingError
+from screenpy_selenium import BrowseTheWeb, BrowsingError, Target, tracing
+from screenpy_selenium.browser_pool import BrowserPool, is_responsive, reset
+from screenpy_selenium.configuration import ScreenPySeleniumSettings
+from screenpy_selenium.console_log import ConsoleLogCollector, LogCollectingExecutor
+from screenpy_selenium.element_cache import CacheClearingExecutor, ElementCache
+from screenpy_selenium.instrumentation import (
+    CommandLog,
+    RecordingExecutor,
+    current_step,
+)
+from screenpy_selenium.page_snapshot import (
+    ElementSnapshot,
+    PageSnapshot,
+    SnapshotInvalidatingExecutor,
+)
+from screenpy_selenium.scripts import (
+    CLEAR_STORAGE,
+    ELEMENT_STATES,
+    READ_ATTRIBUTES,
+    TAKE_SNAPSHOT,
+)
+from screenpy_selenium.tracing import Tracer, TracingExecutor
 
 from .useful_mocks import get_mocked_webdriver
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
 
 class TestBrowseTheWeb:
     def test_can_be_instantiated(self) -> None:
@@ -70,9 +102,228 @@ class TestBrowseTheWeb:
 
         mocked_chrome.quit.assert_called_once()
 
+    @mock.patch(
+        "screenpy_selenium.abilities.browse_the_web.screenshot_writer", autospec=True
+    )
+    def test_forget_flushes_screenshots(self, mocked_writer: mock.Mock) -> None:
+        b = BrowseTheWeb(get_mocked_webdriver())
+
+        b.forget()
+
+        mocked_writer.flush.assert_called_once_with(b)
+
+    @mock.patch(
+        "screenpy_selenium.abilities.browse_the_web.screenshot_writer", autospec=True
+    )
+    def test_forget_quits_even_if_screenshots_failed(
+        self, mocked_writer: mock.Mock
+    ) -> None:
+        driver = get_mocked_webdriver()
+        mocked_writer.flush.side_effect = FileNotFoundError("no such directory")
+
+        with pytest.raises(FileNotFoundError):
+            BrowseTheWeb(driver).forget()
+
+        driver.quit.assert_called_once()
+
     def test_repr(self) -> None:
         assert repr(BrowseTheWeb(get_mocked_webdriver())) == "Browse the Web"
 
+    def test_no_element_cache_by_default(self) -> None:
+        assert BrowseTheWeb.using(get_mocked_webdriver()).element_cache is None
+
+    def test_with_element_cache(self) -> None:
+        driver = get_mocked_webdriver()
+        driver.command_executor = mock.Mock()
+
+        b = BrowseTheWeb.using(driver).with_element_cache()
+
+        assert isinstance(b.element_cache, ElementCache)
+        assert isinstance(driver.command_executor, CacheClearingExecutor)
+
+    def test_with_element_cache_twice_keeps_cache(self) -> None:
+        driver = get_mocked_webdriver()
+        driver.command_executor = mock.Mock()
+        b = BrowseTheWeb.using(driver).with_element_cache()
+        cache = b.element_cache
+
+        b.with_element_cache()
+
+        assert b.element_cache is cache
+
+    def test_forget_clears_element_cache(self) -> None:
+        driver = get_mocked_webdriver()
+        driver.command_executor = mock.Mock()
+        b = BrowseTheWeb.using(driver).with_element_cache()
+        assert b.element_cache is not None
+        b.element_cache.elements[("id", "spam")] = mock.Mock()
+
+        b.forget()
+
+        assert b.element_cache.elements == {}
+
+    def test_from_pool(self) -> None:
+        driver = get_mocked_webdriver()
+        pool = mock.create_autospec(BrowserPool, instance=True)
+        pool.lease.return_value = driver
+
+        b = BrowseTheWeb.from_pool(pool)
+
+        assert b.browser is driver
+        assert b.pool is pool
+
+    def test_forget_releases_pooled_browser(self) -> None:
+        driver = get_mocked_webdriver()
+        pool = mock.create_autospec(BrowserPool, instance=True)
+        pool.lease.return_value = driver
+        b = BrowseTheWeb.from_pool(pool)
+
+        b.forget()
+
+        pool.release.assert_called_once_with(driver)
+        driver.quit.assert_not_called()
+
+    def test_forget_unwatches_pooled_browser(self) -> None:
+        driver = get_mocked_webdriver()
+        executor = mock.Mock()
+        driver.command_executor = executor
+        pool = mock.create_autospec(BrowserPool, instance=True)
+        pool.lease.return_value = driver
+        b = BrowseTheWeb.from_pool(pool).with_element_cache()
+
+        b.forget()
+
+        assert driver.command_executor is executor
+
+    def test_with_command_log(self) -> None:
+        driver = get_mocked_webdriver()
+        driver.command_executor = mock.Mock()
+
+        b = BrowseTheWeb.using(driver).with_command_log()
+        command_log = b.command_log
+        b.with_command_log()
+
+        assert isinstance(b.command_log, CommandLog)
+        assert b.command_log is command_log
+        assert isinstance(driver.command_executor, RecordingExecutor)
+
+    def test_with_console_log(self) -> None:
+        driver = get_mocked_webdriver()
+        driver.command_executor = mock.Mock()
+        driver.get_log = mock.Mock(return_value=[])
+
+        b = BrowseTheWeb.using(driver).with_console_log("console.log")
+        collector = b.console_log
+        b.with_console_log()
+
+        assert isinstance(b.console_log, ConsoleLogCollector)
+        assert b.console_log is collector
+        assert b.console_log.path == "console.log"
+        assert isinstance(driver.command_executor, LogCollectingExecutor)
+
+    def test_forget_collects_console_log(self) -> None:
+        driver = get_mocked_webdriver()
+        driver.command_executor = mock.Mock()
+        driver.get_log = mock.Mock(return_value=["last words"])
+        b = BrowseTheWeb.using(driver).with_console_log()
+
+        b.forget()
+
+        assert b.console_log is not None
+        assert list(b.console_log.entries) == ["last words"]
+        driver.quit.assert_called_once()
+
+    def test_with_console_log_needs_get_log(self) -> None:
+        driver = mock.create_autospec(Firefox, instance=True)
+
+        with pytest.raises(BrowsingError, match="can't give its console log"):
+            BrowseTheWeb.using(driver).with_console_log()
+
+    def test_forget_quits_if_console_log_cannot_be_collected(self) -> None:
+        driver = get_mocked_webdriver()
+        driver.command_executor = mock.Mock()
+        driver.get_log = mock.Mock(side_effect=AttributeError("get_log"))
+        b = BrowseTheWeb.using(driver).with_console_log()
+
+        b.forget()
+
+        driver.quit.assert_called_once()
+
+    def test_forget_twice_releases_once(self) -> None:
+        pool = mock.create_autospec(BrowserPool, instance=True)
+        b = BrowseTheWeb.from_pool(pool)
+
+        b.forget()
+        b.forget()
+
+        pool.release.assert_called_once_with(b.browser)
+        b.browser.quit.assert_not_called()
+
+    def test_with_tracer(self) -> None:
+        driver = get_mocked_webdriver()
+        driver.command_executor = mock.Mock()
+
+        BrowseTheWeb.using(driver).with_tracer(Tracer())
+
+        assert isinstance(driver.command_executor, TracingExecutor)
+
+    def test_take_snapshot(self) -> None:
+        driver = get_mocked_webdriver()
+        driver.command_executor = mock.Mock()
+        driver.execute_script.return_value = ["Title", "https://example.com", [[]]]
+        target = Target.the("header").located_by("h1")
+
+        b = BrowseTheWeb.using(driver)
+        snapshot = b.take_snapshot(target)
+
+        assert b.snapshot is snapshot
+        assert isinstance(driver.command_executor, SnapshotInvalidatingExecutor)
+
+        b.forget()
+
+        assert b.snapshot is None
+
+    @mock.patch.dict(BrowseTheWeb.warm_pools, clear=True)
+    @mock.patch("screenpy_selenium.abilities.browse_the_web.BrowserPool", autospec=True)
+    @mock.patch("screenpy_selenium.abilities.browse_the_web.Chrome", autospec=True)
+    def test_warm_up(self, mocked_chrome: mock.Mock, mocked_pool: mock.Mock) -> None:
+        pool = BrowseTheWeb.warm_up(mocked_chrome, 2)
+        b = BrowseTheWeb.using_chrome()
+
+        assert pool is mocked_pool.return_value
+        mocked_pool.assert_called_once_with(mocked_chrome)
+        pool.warm_up.assert_called_once_with(2)
+        assert b.browser is pool.lease.return_value
+        assert b.pool is pool
+        mocked_chrome.assert_not_called()
+
+    @mock.patch.dict(BrowseTheWeb.warm_pools, clear=True)
+    @mock.patch("screenpy_selenium.abilities.browse_the_web.BrowserPool", autospec=True)
+    @mock.patch("screenpy_selenium.abilities.browse_the_web.Chrome", autospec=True)
+    def test_full_warm_pool_starts_unpooled_browser(
+        self, mocked_chrome: mock.Mock, mocked_pool: mock.Mock
+    ) -> None:
+        pool = BrowseTheWeb.warm_up(mocked_chrome, 1)
+        pool.lease.side_effect = BrowsingError("All 1 browsers in the pool are leased.")
+
+        b = BrowseTheWeb.using_chrome()
+
+        pool.lease.assert_called_once()
+        assert pool is mocked_pool.return_value
+        assert b.browser is mocked_chrome.return_value
+        assert b.pool is None
+
+    @mock.patch.dict(BrowseTheWeb.warm_pools, clear=True)
+    @mock.patch("screenpy_selenium.abilities.browse_the_web.BrowserPool", autospec=True)
+    def test_warm_up_twice_reuses_pool(self, mocked_pool: mock.Mock) -> None:
+        start_browser = mock.Mock()
+
+        first_pool = BrowseTheWeb.warm_up(start_browser)
+        second_pool = BrowseTheWeb.warm_up(start_browser)
+
+        assert first_pool is second_pool
+        mocked_pool.assert_called_once()
+
     def test_subclass(self) -> None:
         """test code for mypy to scan without issue"""
 
@@ -81,3 +332,864 @@ class TestBrowseTheWeb:
                 return True
 
         assert SubBrowseTheWeb.using(get_mocked_webdriver()).new_method() is True
+
+
+class TestElementCache:
+    def _watched_cache(self) -> tuple[ElementCache, mock.Mock]:
+        driver = get_mocked_webdriver()
+        executor = mock.Mock()
+        executor.execute.return_value = {"value": None}
+        driver.command_executor = executor
+        cache = ElementCache()
+        cache.watch(driver)
+        cache.elements[("id", "spam")] = mock.Mock()
+        return cache, driver
+
+    @pytest.mark.parametrize(
+        "command",
+        [
+            Command.GET,
+            Command.GO_BACK,
+            Command.GO_FORWARD,
+            Command.REFRESH,
+            Command.SWITCH_TO_FRAME,
+            Command.SWITCH_TO_PARENT_FRAME,
+            Command.SWITCH_TO_WINDOW,
+            Command.CLICK_ELEMENT,
+            Command.SEND_KEYS_TO_ELEMENT,
+            Command.W3C_ACTIONS,
+            Command.W3C_EXECUTE_SCRIPT,
+        ],
+    )
+    def test_context_change_clears(self, command: str) -> None:
+        cache, driver = self._watched_cache()
+
+        driver.command_executor.execute(command, {})
+
+        assert cache.elements == {}
+
+    def test_other_commands_keep_entries(self) -> None:
+        cache, driver = self._watched_cache()
+
+        driver.command_executor.execute(Command.GET_ELEMENT_TEXT, {})
+
+        assert ("id", "spam") in cache.elements
+
+    @pytest.mark.parametrize(
+        "script",
+        [
+            "/* getAttribute */return (function () {}).apply(null, arguments);",
+            "/* isDisplayed */return (function () {}).apply(null, arguments);",
+            READ_ATTRIBUTES,
+            ELEMENT_STATES,
+        ],
+    )
+    def test_read_only_scripts_keep_entries(self, script: str) -> None:
+        cache, driver = self._watched_cache()
+
+        driver.command_executor.execute(
+            Command.W3C_EXECUTE_SCRIPT, {"script": script, "args": []}
+        )
+
+        assert ("id", "spam") in cache.elements
+
+    def test_other_scripts_clear(self) -> None:
+        cache, driver = self._watched_cache()
+
+        driver.command_executor.execute(
+            Command.W3C_EXECUTE_SCRIPT, {"script": "location.reload();", "args": []}
+        )
+
+        assert cache.elements == {}
+
+    def test_stale_element_response_clears(self) -> None:
+        cache, driver = self._watched_cache()
+        executor = driver.command_executor.executor
+        executor.execute.return_value = {
+            "value": {"error": "stale element reference", "message": "gone"}
+        }
+
+        driver.command_executor.execute(Command.GET_ELEMENT_TEXT, {})
+
+        assert cache.elements == {}
+
+    def test_stale_cached_element_is_found_again(self) -> None:
+        cache, driver = self._watched_cache()
+        cached_element = WebElement(driver, "old")
+        cache.elements[("id", "spam")] = cached_element
+        driver.find_element.return_value = WebElement(driver, "new")
+        executor = driver.command_executor.executor
+        stale_response = {"value": {"error": "stale element reference"}}
+        executor.execute.side_effect = [stale_response, {"value": "spam"}]
+
+        response = driver.command_executor.execute(
+            Command.GET_ELEMENT_TEXT, {"id": "old"}
+        )
+
+        assert response == {"value": "spam"}
+        assert cached_element.id == "new"
+        driver.find_element.assert_called_once_with("id", "spam")
+        executor.execute.assert_called_with(Command.GET_ELEMENT_TEXT, {"id": "new"})
+
+    def test_stale_element_is_found_again_for_page_changing_commands(self) -> None:
+        cache, driver = self._watched_cache()
+        cached_element = WebElement(driver, "old")
+        cache.elements[("id", "spam")] = cached_element
+        driver.find_element.return_value = WebElement(driver, "new")
+        executor = driver.command_executor.executor
+        stale_response = {"value": {"error": "stale element reference"}}
+        executor.execute.side_effect = [stale_response, {"value": None}]
+
+        response = driver.command_executor.execute(Command.CLICK_ELEMENT, {"id": "old"})
+
+        assert response == {"value": None}
+        assert cached_element.id == "new"
+        executor.execute.assert_called_with(Command.CLICK_ELEMENT, {"id": "new"})
+        assert cache.elements == {}
+
+    def test_stale_element_not_in_cache_is_not_retried(self) -> None:
+        _, driver = self._watched_cache()
+        executor = driver.command_executor.executor
+        stale_response = {"value": {"error": "stale element reference"}}
+        executor.execute.return_value = stale_response
+
+        response = driver.command_executor.execute(
+            Command.GET_ELEMENT_TEXT, {"id": "unknown"}
+        )
+
+        assert response is stale_response
+        executor.execute.assert_called_once()
+        driver.find_element.assert_not_called()
+
+    def test_passes_through_attributes(self) -> None:
+        _, driver = self._watched_cache()
+        executor = driver.command_executor.executor
+
+        assert driver.command_executor.some_attribute is executor.some_attribute
+
+    def test_watching_twice_shares_executor(self) -> None:
+        cache, driver = self._watched_cache()
+        other_cache = ElementCache()
+        other_cache.elements[("id", "eggs")] = mock.Mock()
+
+        other_cache.watch(driver)
+        driver.command_executor.execute(Command.REFRESH, {})
+
+        assert isinstance(driver.command_executor.executor, mock.Mock)
+        assert cache.elements == {}
+        assert other_cache.elements == {}
+
+    def test_unwatch(self) -> None:
+        cache, driver = self._watched_cache()
+        other_cache = ElementCache()
+        other_cache.watch(driver)
+        executor = driver.command_executor.executor
+
+        cache.unwatch(driver)
+
+        assert driver.command_executor.caches == [other_cache]
+
+        other_cache.unwatch(driver)
+
+        assert driver.command_executor is executor
+
+
+def get_mocked_pooled_webdriver() -> mock.Mock:
+    driver = get_mocked_webdriver()
+    driver.window_handles = ["first"]
+    driver.command_executor = mock.Mock()
+    return driver
+
+
+class TestBrowserPool:
+    def test_lease_starts_browser(self) -> None:
+        driver = get_mocked_pooled_webdriver()
+        start_browser = mock.Mock(return_value=driver)
+
+        leased = BrowserPool(start_browser).lease()
+
+        assert leased is driver
+        start_browser.assert_called_once()
+
+    def test_release_resets_and_reuses_browser(self) -> None:
+        driver = get_mocked_pooled_webdriver()
+        start_browser = mock.Mock(return_value=driver)
+        pool = BrowserPool(start_browser)
+
+        pool.release(pool.lease())
+        leased = pool.lease()
+
+        assert leased is driver
+        start_browser.assert_called_once()
+        driver.get.assert_called_once_with("about:blank")
+        driver.quit.assert_not_called()
+
+    def test_lease_raises_when_full(self) -> None:
+        start_browser = mock.Mock(side_effect=get_mocked_pooled_webdriver)
+        pool = BrowserPool(start_browser, max_size=1)
+        pool.lease()
+
+        with pytest.raises(BrowsingError):
+            pool.lease()
+
+    def test_max_uses(self) -> None:
+        first_driver = get_mocked_pooled_webdriver()
+        second_driver = get_mocked_pooled_webdriver()
+        start_browser = mock.Mock(side_effect=[first_driver, second_driver])
+        pool = BrowserPool(start_browser, max_uses=1)
+
+        pool.release(pool.lease())
+        leased = pool.lease()
+
+        assert leased is second_driver
+        first_driver.quit.assert_called_once()
+
+    def test_unhealthy_browser_is_replaced(self) -> None:
+        first_driver = get_mocked_pooled_webdriver()
+        second_driver = get_mocked_pooled_webdriver()
+        start_browser = mock.Mock(side_effect=[first_driver, second_driver])
+        health_check = mock.Mock(return_value=False)
+        pool = BrowserPool(start_browser, health_check=health_check)
+
+        pool.release(pool.lease())
+        leased = pool.lease()
+
+        assert leased is second_driver
+        health_check.assert_called_once_with(first_driver)
+        first_driver.quit.assert_called_once()
+
+    def test_browser_which_fails_to_reset_is_quit(self) -> None:
+        driver = get_mocked_pooled_webdriver()
+        driver.delete_all_cookies.side_effect = WebDriverException("crashed")
+        pool = BrowserPool(mock.Mock(return_value=driver))
+
+        pool.release(pool.lease())
+
+        driver.quit.assert_called_once()
+        assert pool.size == 0
+
+    def test_browser_without_windows_is_quit(self) -> None:
+        driver = get_mocked_pooled_webdriver()
+        pool = BrowserPool(mock.Mock(return_value=driver))
+        leased = pool.lease()
+        driver.window_handles = []
+
+        pool.release(leased)
+
+        driver.quit.assert_called_once()
+        assert pool.size == 0
+
+    def test_release_twice_only_idles_once(self) -> None:
+        start_browser = mock.Mock(side_effect=get_mocked_pooled_webdriver)
+        pool = BrowserPool(start_browser)
+        driver = pool.lease()
+
+        pool.release(driver)
+        pool.release(driver)
+
+        assert pool.idle == [driver]
+        assert pool.lease() is driver
+        assert pool.lease() is not driver
+
+    def test_close(self) -> None:
+        leased_driver = get_mocked_pooled_webdriver()
+        idle_driver = get_mocked_pooled_webdriver()
+        idle_driver.quit.side_effect = WebDriverException("already gone")
+        start_browser = mock.Mock(side_effect=[idle_driver, leased_driver])
+        pool = BrowserPool(start_browser)
+        pool.release(pool.lease())
+        pool.lease()
+        pool.lease()
+
+        pool.close()
+
+        leased_driver.quit.assert_called_once()
+        idle_driver.quit.assert_called_once()
+        assert pool.size == 0
+
+    def test_warm_up(self) -> None:
+        drivers = [get_mocked_pooled_webdriver(), get_mocked_pooled_webdriver()]
+        start_browser = mock.Mock(side_effect=drivers)
+        pool = BrowserPool(start_browser, max_size=2)
+
+        pool.warm_up(2)
+        first_leased = pool.lease()
+        pool.close()
+
+        assert first_leased in drivers
+        assert start_browser.call_count == 2
+
+    def test_warm_up_replaces_leased_browsers(self) -> None:
+        start_browser = mock.Mock(side_effect=get_mocked_pooled_webdriver)
+        pool = BrowserPool(start_browser, max_size=3)
+
+        pool.warm_up(1)
+        pool.lease()
+        pool.lease()
+        pool.close()
+
+        assert start_browser.call_count == 3
+
+    def test_warm_up_respects_max_size(self) -> None:
+        start_browser = mock.Mock(side_effect=get_mocked_pooled_webdriver)
+        pool = BrowserPool(start_browser, max_size=1)
+
+        pool.warm_up(3)
+        pool.lease()
+        pool.close()
+
+        start_browser.assert_called_once()
+
+    def test_failed_warm_up_starts_browser_on_lease(self) -> None:
+        driver = get_mocked_pooled_webdriver()
+        start_browser = mock.Mock(side_effect=[WebDriverException("nope"), driver])
+        pool = BrowserPool(start_browser)
+
+        pool.warm_up(1)
+        pool.executor.shutdown(wait=True)  # type: ignore[union-attr]
+        pool.warm_count = 0
+        leased = pool.lease()
+
+        assert leased is driver
+
+    @mock.patch("screenpy_selenium.browser_pool.time.monotonic")
+    def test_idle_timeout(self, mocked_monotonic: mock.Mock) -> None:
+        first_driver = get_mocked_pooled_webdriver()
+        second_driver = get_mocked_pooled_webdriver()
+        start_browser = mock.Mock(side_effect=[first_driver, second_driver])
+        pool = BrowserPool(start_browser, idle_timeout=10)
+        mocked_monotonic.return_value = 0
+        pool.release(pool.lease())
+
+        mocked_monotonic.return_value = 11
+        leased = pool.lease()
+
+        assert leased is second_driver
+        first_driver.quit.assert_called_once()
+        pool.close()
+
+    def test_idle_browsers_are_retired_in_background(self) -> None:
+        driver = get_mocked_pooled_webdriver()
+        pool = BrowserPool(mock.Mock(return_value=driver), idle_timeout=0.01)
+
+        pool.release(pool.lease())
+        for _ in range(100):
+            if driver.quit.called:
+                break
+            time.sleep(0.01)
+        pool.close()
+
+        driver.quit.assert_called_once()
+        assert pool.idle == []
+
+    def test_retired_warm_browsers_are_replaced(self) -> None:
+        drivers = [get_mocked_pooled_webdriver() for _ in range(3)]
+        start_browser = mock.Mock(side_effect=drivers)
+        pool = BrowserPool(start_browser, max_size=1, idle_timeout=0.01)
+
+        pool.warm_up(1)
+        for _ in range(100):
+            if start_browser.call_count >= 2:
+                break
+            time.sleep(0.01)
+        pool.close()
+
+        assert start_browser.call_count >= 2
+        drivers[0].quit.assert_called_once()
+
+    def test_lease_gives_up_waiting_for_warm_up(self) -> None:
+        started = threading.Event()
+
+        def start_slowly() -> mock.Mock:
+            started.wait(1)
+            return get_mocked_pooled_webdriver()
+
+        pool = BrowserPool(start_slowly)
+        pool.lease_timeout = 0.01
+
+        pool.warm_up(1)
+        with pytest.raises(BrowsingError, match="No browser finished warming up"):
+            pool.lease()
+        started.set()
+        pool.close()
+
+    @mock.patch("screenpy_selenium.browser_pool.settings")
+    def test_defaults_from_settings(self, mocked_settings: mock.Mock) -> None:
+        mocked_settings.BROWSER_POOL_SIZE = 7
+        mocked_settings.BROWSER_POOL_MAX_USES = 3
+        mocked_settings.BROWSER_IDLE_TIMEOUT = 60
+        mocked_settings.BROWSER_WARM_UP = 0
+        mocked_settings.BROWSER_LEASE_TIMEOUT = 30
+
+        pool = BrowserPool(mock.Mock())
+        pool.warm_up()
+
+        assert pool.max_size == 7
+        assert pool.max_uses == 3
+        assert pool.idle_timeout == 60
+        assert pool.lease_timeout == 30
+        assert pool.warm_count == 0
+
+    def test_release_removes_executor_wrappers(self) -> None:
+        driver = get_mocked_pooled_webdriver()
+        executor = driver.command_executor
+        pool = BrowserPool(mock.Mock(return_value=driver))
+        ElementCache().watch(pool.lease())
+
+        pool.release(driver)
+
+        assert driver.command_executor is executor
+
+    def test_reset(self) -> None:
+        driver = get_mocked_webdriver()
+        driver.window_handles = ["first", "second"]
+
+        reset(driver)
+
+        driver.switch_to.window.assert_has_calls(
+            [mock.call("second"), mock.call("first")]
+        )
+        driver.close.assert_called_once()
+        driver.delete_all_cookies.assert_called_once()
+        driver.execute_script.assert_called_once_with(CLEAR_STORAGE)
+        driver.get.assert_called_once_with("about:blank")
+
+    def test_reset_clears_every_domain_through_devtools(self) -> None:
+        driver = get_mocked_webdriver()
+        driver.window_handles = ["first"]
+        driver.execute_cdp_cmd = mock.Mock()
+
+        reset(driver)
+
+        driver.execute_cdp_cmd.assert_has_calls(
+            [
+                mock.call("Network.clearBrowserCookies", {}),
+                mock.call(
+                    "Storage.clearDataForOrigin",
+                    {"origin": "*", "storageTypes": "all"},
+                ),
+            ]
+        )
+
+    def test_custom_reset(self) -> None:
+        driver = get_mocked_pooled_webdriver()
+        custom_reset = mock.Mock()
+        pool = BrowserPool(mock.Mock(return_value=driver), reset=custom_reset)
+
+        pool.release(pool.lease())
+
+        custom_reset.assert_called_once_with(driver)
+        driver.delete_all_cookies.assert_not_called()
+        assert pool.idle == [driver]
+
+    def test_is_responsive(self) -> None:
+        driver = get_mocked_webdriver()
+        type(driver).current_window_handle = mock.PropertyMock(
+            side_effect=WebDriverException("crashed")
+        )
+
+        assert not is_responsive(driver)
+
+
+class FakeAction:
+    def __init__(self, target: str | None = None) -> None:
+        self.target = target
+
+    def perform_as(self, driver: mock.Mock) -> None:
+        driver.command_executor.execute(Command.GET_TITLE, {"sessionId": "1"})
+
+
+class TestCommandLog:
+    def _watched_log(self) -> tuple[CommandLog, mock.Mock]:
+        driver = get_mocked_webdriver()
+        executor = mock.Mock()
+        executor.execute.return_value = {"value": "spam"}
+        driver.command_executor = executor
+        log = CommandLog()
+        log.watch(driver)
+        return log, driver
+
+    def test_records_commands(self) -> None:
+        log, driver = self._watched_log()
+
+        response = driver.command_executor.execute(Command.GET_TITLE, {})
+
+        assert response == {"value": "spam"}
+        assert len(log.records) == 1
+        record = log.records[0]
+        assert record.command == Command.GET_TITLE
+        assert record.step == "(no step)"
+        assert record.target is None
+        assert record.sent == 0
+        assert record.received == len('{"value": "spam"}')
+
+    def test_records_failed_commands(self) -> None:
+        log, driver = self._watched_log()
+        driver.command_executor.executor.execute.side_effect = WebDriverException()
+
+        with pytest.raises(WebDriverException):
+            driver.command_executor.execute(Command.GET_TITLE, {})
+
+        assert len(log.records) == 1
+
+    def test_tags_records_with_step(self) -> None:
+        log, driver = self._watched_log()
+
+        FakeAction("the spam").perform_as(driver)
+
+        assert log.records[0].step == "FakeAction"
+        assert log.records[0].target == "the spam"
+
+    def test_summary(self) -> None:
+        log, driver = self._watched_log()
+        FakeAction().perform_as(driver)
+        FakeAction().perform_as(driver)
+        driver.command_executor.execute(Command.GET_TITLE, {})
+
+        summary = {s.step: s for s in log.summary()}
+
+        assert summary["FakeAction"].commands == 2
+        assert summary["(no step)"].commands == 1
+
+    def test_report(self) -> None:
+        log, driver = self._watched_log()
+        FakeAction().perform_as(driver)
+
+        report = log.report()
+
+        assert report.startswith("1 WebDriver commands in ")
+        assert "FakeAction: 1 commands" in report
+
+    def test_clear(self) -> None:
+        log, driver = self._watched_log()
+        driver.command_executor.execute(Command.GET_TITLE, {})
+
+        log.clear()
+
+        assert log.records == []
+
+    def test_passes_through_attributes(self) -> None:
+        _, driver = self._watched_log()
+        executor = driver.command_executor.executor
+
+        assert driver.command_executor.some_attribute is executor.some_attribute
+
+    def test_unwatch(self) -> None:
+        log, driver = self._watched_log()
+        executor = driver.command_executor.executor
+        other_log = CommandLog()
+        other_log.watch(driver)
+
+        log.unwatch(driver)
+
+        assert driver.command_executor.log is other_log
+        assert driver.command_executor.executor is executor
+
+        other_log.unwatch(driver)
+
+        assert driver.command_executor is executor
+
+    def test_current_step(self) -> None:
+        class FakeQuestion:
+            def answered_by(self) -> object | None:
+                return current_step()
+
+        question = FakeQuestion()
+
+        assert question.answered_by() is question
+        assert current_step() is None
+
+
+class FakeBeatAction:
+    @beat("{} does a traced thing")
+    def perform_as(self, the_actor: str) -> None:
+        aside(f"{the_actor} is thinking")
+
+
+class TestTracer:
+    def test_start_and_stop(self) -> None:
+        tracer = Tracer()
+
+        tracer.start()
+        try:
+            assert tracer.adapter in the_narrator.adapters
+            assert tracing.active_tracer is tracer
+        finally:
+            tracer.stop()
+
+        assert tracer.adapter not in the_narrator.adapters
+        assert tracing.active_tracer is None
+
+    def test_records_beats_and_asides(self) -> None:
+        tracer = Tracer().start()
+        try:
+            FakeBeatAction().perform_as("Tester")
+        finally:
+            tracer.stop()
+
+        beats = [e for e in tracer.events if e["cat"] == "beat"]
+        asides = [e for e in tracer.events if e["cat"] == "aside"]
+        assert [b["name"] for b in beats] == ["Tester does a traced thing"]
+        assert beats[0]["ph"] == "X"
+        assert [a["name"] for a in asides] == ["Tester is thinking"]
+        assert asides[0]["ts"] >= beats[0]["ts"]
+
+    def test_nothing_recorded_when_stopped(self) -> None:
+        tracer = Tracer()
+
+        FakeBeatAction().perform_as("Tester")
+
+        assert tracer.events == []
+
+    def test_records_commands(self) -> None:
+        tracer = Tracer()
+        driver = get_mocked_webdriver()
+        driver.command_executor = mock.Mock()
+        tracer.watch(driver)
+
+        driver.command_executor.execute(Command.GET_TITLE, {})
+
+        assert [e["name"] for e in tracer.events] == [Command.GET_TITLE]
+        assert tracer.events[0]["cat"] == "command"
+
+    def test_unwatch(self) -> None:
+        tracer = Tracer()
+        driver = get_mocked_webdriver()
+        executor = mock.Mock()
+        driver.command_executor = executor
+        tracer.watch(driver)
+
+        tracer.unwatch(driver)
+        driver.command_executor.execute(Command.GET_TITLE, {})
+
+        assert driver.command_executor is executor
+        assert tracer.browsers == []
+        assert tracer.events == []
+
+    def test_stop_unwatches_browsers(self) -> None:
+        tracer = Tracer().start()
+        driver = get_mocked_webdriver()
+        executor = mock.Mock()
+        driver.command_executor = executor
+        tracer.watch(driver)
+        log = CommandLog()
+        log.watch(driver)
+
+        tracer.stop()
+
+        assert driver.command_executor.log is log
+        assert driver.command_executor.executor is executor
+        assert tracer.browsers == []
+
+    def test_span_nesting(self) -> None:
+        tracer = Tracer()
+
+        with tracer.span("outer", "beat"), tracer.span("inner", "command"):
+            pass
+
+        inner, outer = tracer.events
+        assert outer["ts"] <= inner["ts"]
+        assert inner["ts"] + inner["dur"] <= outer["ts"] + outer["dur"]
+
+    def test_traced(self) -> None:
+        tracer = Tracer()
+        func = mock.Mock(return_value="spam")
+
+        result = tracer.traced(func, "poll foo", "poll")("eggs")
+
+        assert result == "spam"
+        func.assert_called_once_with("eggs")
+        assert tracer.events[0]["name"] == "poll foo"
+
+    def test_save(self, tmp_path: Path) -> None:
+        tracer = Tracer()
+        with tracer.span("spam", "beat"):
+            pass
+        path = tmp_path / "trace.json"
+
+        tracer.save(path)
+
+        trace = json.loads(path.read_text())
+        assert [e["name"] for e in trace["traceEvents"]] == ["spam"]
+        assert tracer.events == []
+
+
+class TestConsoleLogCollector:
+    settings_path = "screenpy_selenium.console_log.settings"
+
+    def _collector(
+        self, **kwargs: Any  # noqa: ANN401
+    ) -> tuple[ConsoleLogCollector, mock.Mock]:
+        driver = get_mocked_webdriver()
+        driver.command_executor = mock.Mock()
+        driver.get_log = mock.Mock(return_value=[])
+        return ConsoleLogCollector(driver, **kwargs), driver
+
+    def test_collect(self) -> None:
+        collector, driver = self._collector()
+        driver.get_log.side_effect = [["one", "two"], ["three"]]
+
+        collector.collect()
+        collector.collect()
+
+        driver.get_log.assert_called_with("browser")
+        assert list(collector.entries) == ["one", "two", "three"]
+        assert collector.total == 3
+
+    def test_buffer_is_bounded(self) -> None:
+        collector, driver = self._collector(max_entries=2)
+        driver.get_log.return_value = ["one", "two", "three"]
+
+        collector.collect()
+
+        assert list(collector.entries) == ["two", "three"]
+        assert collector.total == 3
+
+    def test_appends_to_file(self, tmp_path: Path) -> None:
+        path = tmp_path / "console.log"
+        collector, driver = self._collector(path=str(path))
+        driver.get_log.side_effect = [["one"], ["two"]]
+
+        collector.collect()
+        collector.collect()
+
+        assert path.read_text() == "one\ntwo\n"
+
+    def test_collects_between_commands_when_due(self) -> None:
+        collector, driver = self._collector()
+        driver.get_log.return_value = ["spam"]
+        collector.watch()
+        mock_settings = ScreenPySeleniumSettings(CONSOLE_LOG_INTERVAL=0)
+
+        with mock.patch(self.settings_path, mock_settings):
+            driver.command_executor.execute(Command.GET_TITLE, {})
+
+        driver.get_log.assert_called_once_with("browser")
+        assert list(collector.entries) == ["spam"]
+
+    def test_waits_for_interval(self) -> None:
+        collector, driver = self._collector()
+        collector.watch()
+        mock_settings = ScreenPySeleniumSettings(CONSOLE_LOG_INTERVAL=60)
+
+        with mock.patch(self.settings_path, mock_settings):
+            driver.command_executor.execute(Command.GET_TITLE, {})
+
+        driver.get_log.assert_not_called()
+
+    def test_collection_errors_do_not_fail_commands(self) -> None:
+        collector, driver = self._collector()
+        driver.get_log.side_effect = WebDriverException("no logs here")
+        collector.watch()
+        executor = driver.command_executor.executor
+        mock_settings = ScreenPySeleniumSettings(CONSOLE_LOG_INTERVAL=0)
+
+        with mock.patch(self.settings_path, mock_settings):
+            response = driver.command_executor.execute(Command.GET_TITLE, {})
+
+        assert response is executor.execute.return_value
+
+    def test_collection_attribute_errors_do_not_fail_commands(self) -> None:
+        collector, driver = self._collector()
+        driver.get_log.side_effect = AttributeError("get_log")
+        collector.watch()
+        executor = driver.command_executor.executor
+        mock_settings = ScreenPySeleniumSettings(CONSOLE_LOG_INTERVAL=0)
+
+        with mock.patch(self.settings_path, mock_settings):
+            response = driver.command_executor.execute(Command.GET_TITLE, {})
+
+        assert response is executor.execute.return_value
+
+
+class TestPageSnapshot:
+    def test_take(self) -> None:
+        driver = get_mocked_webdriver()
+        header = Target.the("header").located_by("h1")
+        country = Target.the("country").located_by("//select")
+        driver.execute_script.return_value = [
+            "Title",
+            "https://example.com",
+            [
+                [["Welcome!", {"class": "big"}, None]],
+                [["Iowa", {"value": "ia"}, [["Iowa", "ia", 15]]]],
+            ],
+        ]
+
+        snapshot = PageSnapshot.take(driver, [header, country])
+
+        driver.execute_script.assert_called_once_with(
+            TAKE_SNAPSHOT, [["css selector", "h1"], ["xpath", "//select"]]
+        )
+        assert snapshot.title == "Title"
+        assert snapshot.url == "https://example.com"
+        assert snapshot.found(header) == [
+            ElementSnapshot(text="Welcome!", attributes={"class": "big"}, selected=None)
+        ]
+        assert snapshot.found(country) == [
+            ElementSnapshot(
+                text="Iowa", attributes={"value": "ia"}, selected=[("Iowa", "ia", 15)]
+            )
+        ]
+
+    def test_leaves_out_what_it_cannot_find(self) -> None:
+        driver = get_mocked_webdriver()
+        bad = Target.the("bad locator").located_by("//[")
+        unscriptable = Target.the("ios thing").located_by(
+            ("-ios predicate string", "x")
+        )
+        driver.execute_script.return_value = ["Title", "https://example.com", [None]]
+
+        snapshot = PageSnapshot.take(driver, [bad, unscriptable])
+
+        driver.execute_script.assert_called_once_with(TAKE_SNAPSHOT, [["xpath", "//["]])
+        assert snapshot.found(bad) is None
+        assert snapshot.found(unscriptable) is None
+
+    def test_invalidated_by_commands_which_might_change_the_page(self) -> None:
+        driver = get_mocked_webdriver()
+        driver.command_executor = mock.Mock()
+        snapshot = PageSnapshot("Title", "https://example.com")
+        snapshot.watch(driver)
+
+        driver.command_executor.execute(Command.GET_ELEMENT_TEXT, {})
+        driver.command_executor.execute(Command.GET_TITLE, {})
+
+        assert snapshot.valid
+
+        driver.command_executor.execute(Command.CLICK_ELEMENT, {})
+
+        assert not snapshot.valid
+        assert snapshot.found(Target.the("header").located_by("h1")) is None
+
+    def test_read_only_scripts_keep_it_valid(self) -> None:
+        driver = get_mocked_webdriver()
+        driver.command_executor = mock.Mock()
+        snapshot = PageSnapshot("Title", "https://example.com")
+        snapshot.watch(driver)
+
+        for script in ("/* getAttribute */return 1;", ELEMENT_STATES):
+            driver.command_executor.execute(
+                Command.W3C_EXECUTE_SCRIPT, {"script": script, "args": []}
+            )
+
+        assert snapshot.valid
+
+        driver.command_executor.execute(
+            Command.W3C_EXECUTE_SCRIPT, {"script": "location.reload();", "args": []}
+        )
+
+        assert not snapshot.valid
+
+    def test_watching_again_replaces_the_old_snapshot(self) -> None:
+        driver = get_mocked_webdriver()
+        driver.command_executor = mock.Mock()
+        old_snapshot = PageSnapshot("Title", "https://example.com")
+        new_snapshot = PageSnapshot("Title", "https://example.com")
+
+        old_snapshot.watch(driver)
+        new_snapshot.watch(driver)
+
+        assert not old_snapshot.valid
+        assert driver.command_executor.snapshot is new_snapshot
+        assert isinstance(driver.command_executor.executor, mock.Mock)
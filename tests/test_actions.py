@@ -1,8 +1,14 @@
 from __future__ import annotations
 
 import logging
+import os
+import pkgutil
+import sys
+import threading
 import warnings
+from collections import deque
 from contextlib import contextmanager
+from io import BytesIO
 from typing import TYPE_CHECKING, Generator, cast
 from unittest import mock
 
@@ -10,13 +16,19 @@ import pytest
 from screenpy import DeliveryError, Describable, Performable, UnableToAct, settings
 from screenpy.configuration import ScreenPySettings
 from screenpy_pyotp.abilities import AuthenticateWith2FA
-from selenium.common.exceptions import WebDriverException
+from selenium.common.exceptions import (
+    InvalidSelectorException,
+    NoSuchElementException,
+    TimeoutException,
+    WebDriverException,
+)
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support import expected_conditions as EC
 
 from screenpy_selenium import (
     AcceptAlert,
+    BrowseTheWeb,
     Chain,
     Chainable,
     Clear,
@@ -25,6 +37,7 @@ from screenpy_selenium import (
     DoubleClick,
     Enter,
     Enter2FAToken,
+    FillForm,
     GoBack,
     GoForward,
     HoldDown,
@@ -44,18 +57,41 @@ from screenpy_selenium import (
     SwitchTo,
     SwitchToTab,
     Target,
+    TargetingError,
     Wait,
 )
+from screenpy_selenium.actions.wait import AllOf, AnyOf, BackoffWait, CompoundCondition
+from screenpy_selenium.configuration import ScreenPySeleniumSettings
+from screenpy_selenium.console_log import ConsoleLogCollector
+from screenpy_selenium.screenshots import (
+    ScreenshotWriter,
+    crop_screenshot,
+    encode_screenshot,
+    save_screenshot,
+    saved_screenshots,
+    screenshot_path,
+)
+from screenpy_selenium.scripts import (
+    ARE_DISPLAYED,
+    FILL_FIELDS,
+    SELECT_OPTION,
+    WAIT_FOR_CONDITION,
+)
+from screenpy_selenium.tracing import Tracer
 
 from .unittest_protocols import ChainableAction
 from .useful_mocks import (
     get_mock_target_class,
     get_mocked_browser,
     get_mocked_chain,
+    get_mocked_element,
     get_mocked_target_and_element,
+    get_mocked_webdriver,
 )
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from screenpy import Actor
 
 FakeTarget = get_mock_target_class()
@@ -387,10 +423,61 @@ class TestEnter:
 
         Enter.the_text(text).into_the(target).then_hit(additional).perform_as(Tester)
 
-        assert element.send_keys.call_count == 2
-        [call1_args, _], [call2_args, _] = element.send_keys.call_args_list
-        assert text in call1_args
-        assert additional in call2_args
+        element.send_keys.assert_called_once_with(text, additional)
+
+    def test_perform_one_key_at_a_time(self, Tester: Actor) -> None:
+        text = 'Speak "Friend" and...'
+        target, element = get_mocked_target_and_element()
+
+        Enter.the_text(text).into_the(target).then_hit(
+            Keys.TAB, Keys.ENTER
+        ).one_key_at_a_time().perform_as(Tester)
+
+        assert element.send_keys.call_args_list == [
+            mock.call(text),
+            mock.call(Keys.TAB),
+            mock.call(Keys.ENTER),
+        ]
+
+    def test_keys_after_a_modifier_are_sent_separately(self, Tester: Actor) -> None:
+        target, element = get_mocked_target_and_element()
+
+        Enter.the_text("a").into_the(target).then_hit(
+            Keys.TAB, Keys.SHIFT, Keys.TAB, Keys.ENTER
+        ).perform_as(Tester)
+
+        assert element.send_keys.call_args_list == [
+            mock.call("a", Keys.TAB, Keys.SHIFT),
+            mock.call(Keys.TAB, Keys.ENTER),
+        ]
+
+    def test_text_with_a_modifier_is_sent_separately(self, Tester: Actor) -> None:
+        text = f"{Keys.CONTROL}a"
+        target, element = get_mocked_target_and_element()
+
+        Enter.the_text(text).into_the(target).then_hit(Keys.DELETE).perform_as(Tester)
+
+        assert element.send_keys.call_args_list == [
+            mock.call(text),
+            mock.call(Keys.DELETE),
+        ]
+
+    def test_aside_for_each_following_key(
+        self, Tester: Actor, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        target, element = get_mocked_target_and_element()
+        caplog.set_level(logging.INFO)
+
+        Enter.the_text("a").into_the(target).then_hit(Keys.TAB, Keys.ENTER).perform_as(
+            Tester
+        )
+
+        element.send_keys.assert_called_once_with("a", Keys.TAB, Keys.ENTER)
+        assert [r.msg for r in caplog.records] == [
+            f"Tester enters 'a' into the {target}.",
+            "    then hits the TAB key",
+            "    then hits the ENTER key",
+        ]
 
     def test_chain_enter_with_target(self, Tester: Actor) -> None:
         chain = get_mocked_chain()
@@ -544,6 +631,130 @@ class TestEnter2FAToken:
         assert SubEnter2FA.into(TARGET).new_method() is True
 
 
+class TestFillForm:
+    field = Target.the("name field").located_by("#name")
+
+    def test_can_be_instantiated(self) -> None:
+        ff1 = FillForm({self.field: "value"})
+        ff2 = FillForm.with_the({self.field: "value"})
+        ff3 = FillForm.with_({self.field: "value"}).using_script()
+
+        assert isinstance(ff1, FillForm)
+        assert isinstance(ff2, FillForm)
+        assert isinstance(ff3, FillForm)
+
+    def test_implements_protocol(self) -> None:
+        ff = FillForm({})
+
+        assert isinstance(ff, Performable)
+        assert isinstance(ff, Describable)
+
+    def test_describe(self) -> None:
+        first = Target.the("first name field").located_by("#first")
+        last = Target.the("last name field").located_by("#last")
+
+        ff = FillForm({first: "Perry", last: "Goy"})
+
+        assert ff.describe() == "Fill in the first name field, last name field."
+
+    def test_perform_fill_form(self, Tester: Actor) -> None:
+        first = Target.the("first name field").located_by("#first")
+        last = Target.the("last name field").located_by("#last")
+        first_element, last_element = get_mocked_element(), get_mocked_element()
+        browser = get_mocked_browser(Tester)
+        browser.execute_script.return_value = [first_element, last_element]
+
+        FillForm({first: "Perry", last: "Goy"}).perform_as(Tester)
+
+        browser.execute_script.assert_called_once()
+        browser.find_element.assert_not_called()
+        first_element.clear.assert_called_once_with()
+        first_element.send_keys.assert_called_once_with("Perry")
+        last_element.clear.assert_called_once_with()
+        last_element.send_keys.assert_called_once_with("Goy")
+
+    def test_missing_field_raises(self, Tester: Actor) -> None:
+        browser = get_mocked_browser(Tester)
+        browser.execute_script.return_value = [None]
+
+        with pytest.raises(TargetingError, match="Could not find the"):
+            FillForm({self.field: "value"}).perform_as(Tester)
+
+    def test_exception(self, Tester: Actor) -> None:
+        element = get_mocked_element()
+        element.send_keys.side_effect = WebDriverException
+        browser = get_mocked_browser(Tester)
+        browser.execute_script.return_value = [element]
+
+        with pytest.raises(DeliveryError):
+            FillForm({self.field: "value"}).perform_as(Tester)
+
+    def test_using_script(self, Tester: Actor) -> None:
+        first = Target.the("first name field").located_by("#first")
+        last = Target.the("last name field").located_by("//input[@name='last']")
+        browser = get_mocked_browser(Tester)
+        browser.execute_script.return_value = [None, None]
+
+        FillForm({first: "Perry", last: "Goy"}).using_script().perform_as(Tester)
+
+        browser.execute_script.assert_called_once_with(
+            FILL_FIELDS,
+            [
+                ["css selector", "#first", "Perry"],
+                ["xpath", "//input[@name='last']", "Goy"],
+            ],
+        )
+
+    def test_using_script_types_unscriptable_fields(self, Tester: Actor) -> None:
+        scripted = Target.the("first name field").located_by("#first")
+        typed = Target.the("last name field").located_by(("-ios predicate string", "x"))
+        element = get_mocked_element()
+        browser = get_mocked_browser(Tester)
+        browser.execute_script.return_value = [None]
+        browser.find_elements.return_value = [element]
+
+        FillForm({scripted: "Perry", typed: "Goy"}).using_script().perform_as(Tester)
+
+        browser.execute_script.assert_called_once_with(
+            FILL_FIELDS, [["css selector", "#first", "Perry"]]
+        )
+        element.send_keys.assert_called_once_with("Goy")
+
+    def test_using_script_falls_back_when_script_fails(self, Tester: Actor) -> None:
+        element = get_mocked_element()
+        browser = get_mocked_browser(Tester)
+        browser.execute_script.side_effect = [WebDriverException, [element]]
+
+        FillForm({self.field: "value"}).using_script().perform_as(Tester)
+
+        element.send_keys.assert_called_once_with("value")
+
+    def test_using_script_missing_field_raises(self, Tester: Actor) -> None:
+        browser = get_mocked_browser(Tester)
+        browser.execute_script.return_value = ["not found"]
+
+        with pytest.raises(TargetingError, match="Could not find the"):
+            FillForm({self.field: "value"}).using_script().perform_as(Tester)
+
+    def test_using_script_problem_raises(self, Tester: Actor) -> None:
+        browser = get_mocked_browser(Tester)
+        browser.execute_script.return_value = ["the field cannot be edited"]
+
+        with pytest.raises(DeliveryError, match="the field cannot be edited"):
+            FillForm({self.field: "value"}).using_script().perform_as(Tester)
+
+    def test_values_are_not_logged(
+        self, Tester: Actor, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        browser = get_mocked_browser(Tester)
+        browser.execute_script.return_value = [None]
+
+        with caplog.at_level(logging.INFO):
+            FillForm({self.field: "hunter2"}).using_script().perform_as(Tester)
+
+        assert [r.msg for r in caplog.records] == ["Tester fills in the name field."]
+
+
 class TestGoBack:
     def test_can_be_instantiated(self) -> None:
         gb = GoBack()
@@ -1125,6 +1336,19 @@ class TestSaveConsoleLog:
 
         mocked_atf.assert_called_once_with(test_path, **test_kwargs)
 
+    @mock.patch("builtins.open", new_callable=mock.mock_open)
+    def test_saves_collected_console_log(
+        self, mocked_open: mock.Mock, Tester: Actor
+    ) -> None:
+        collector = mock.create_autospec(ConsoleLogCollector, instance=True)
+        collector.entries = deque(["first", "second"])
+        Tester.ability_to(BrowseTheWeb).console_log = collector
+
+        SaveConsoleLog("console.log").perform_as(Tester)
+
+        collector.collect.assert_called_once()
+        mocked_open().write.assert_called_once_with("first\nsecond")
+
     def test_describe(self) -> None:
         assert SaveConsoleLog("pth").describe() == "Save browser console log as pth"
 
@@ -1139,6 +1363,8 @@ class TestSaveConsoleLog:
 
 
 class TestSaveScreenshot:
+    settings_path = "screenpy_selenium.actions.save_screenshot.settings"
+
     def test_can_be_instantiated(self) -> None:
         ss1 = SaveScreenshot("")
         ss2 = SaveScreenshot.as_("")
@@ -1189,6 +1415,101 @@ class TestSaveScreenshot:
 
         mocked_atf.assert_called_once_with(test_path, **test_kwargs)
 
+    @mock.patch("builtins.open", new_callable=mock.mock_open)
+    @mock.patch(
+        "screenpy_selenium.actions.save_screenshot.screenshot_writer", autospec=True
+    )
+    def test_perform_writes_in_background(
+        self, mocked_writer: mock.Mock, mocked_open: mock.Mock, Tester: Actor
+    ) -> None:
+        test_path = "rpattinson/images/a_bat.png"
+        browser = get_mocked_browser(Tester)
+        mock_settings = ScreenPySeleniumSettings(BACKGROUND_SCREENSHOTS=True)
+
+        with mock.patch(self.settings_path, mock_settings):
+            SaveScreenshot(test_path).perform_as(Tester)
+
+        mocked_open.assert_not_called()
+        mocked_writer.write.assert_called_once_with(
+            test_path,
+            browser.get_screenshot_as_png.return_value,
+            Tester.ability_to(BrowseTheWeb),
+        )
+        mocked_writer.write.return_value.result.assert_not_called()
+
+    @mock.patch(
+        "screenpy_selenium.actions.save_screenshot.AttachTheFile", autospec=True
+    )
+    @mock.patch(
+        "screenpy_selenium.actions.save_screenshot.screenshot_writer", autospec=True
+    )
+    def test_background_screenshot_is_written_before_attaching(
+        self, mocked_writer: mock.Mock, mocked_atf: mock.Mock, Tester: Actor
+    ) -> None:
+        test_path = "souiiie.png"
+        mock_settings = ScreenPySeleniumSettings(BACKGROUND_SCREENSHOTS=True)
+
+        with mock.patch(self.settings_path, mock_settings):
+            SaveScreenshot(test_path).and_attach_it().perform_as(Tester)
+
+        mocked_writer.write.return_value.result.assert_called_once()
+        mocked_atf.assert_called_once_with(test_path)
+
+    @mock.patch("screenpy_selenium.actions.save_screenshot.save_screenshot")
+    def test_of_the_element(self, mocked_save: mock.Mock, Tester: Actor) -> None:
+        target, element = get_mocked_target_and_element()
+        browser = get_mocked_browser(Tester)
+
+        SaveScreenshot("spam.png").of_the(target).perform_as(Tester)
+
+        target.found_by.assert_called_once_with(Tester)
+        browser.get_screenshot_as_png.assert_not_called()
+        mocked_save.assert_called_once_with("spam.png", element.screenshot_as_png)
+
+    @mock.patch("screenpy_selenium.actions.save_screenshot.save_screenshot")
+    @mock.patch("screenpy_selenium.actions.save_screenshot.crop_screenshot")
+    def test_cropped_and_downscaled(
+        self, mocked_crop: mock.Mock, mocked_save: mock.Mock, Tester: Actor
+    ) -> None:
+        browser = get_mocked_browser(Tester)
+
+        SaveScreenshot("spam.png").cropped_to(1, 2, 3, 4).downscaled(2).perform_as(
+            Tester
+        )
+
+        mocked_crop.assert_called_once_with(
+            browser.get_screenshot_as_png.return_value, (1, 2, 3, 4), 2
+        )
+        mocked_save.assert_called_once_with("spam.png", mocked_crop.return_value)
+
+    @mock.patch("screenpy_selenium.actions.save_screenshot.crop_screenshot")
+    def test_not_cropped_by_default(
+        self, mocked_crop: mock.Mock, Tester: Actor
+    ) -> None:
+        with mock.patch("builtins.open", new_callable=mock.mock_open):
+            SaveScreenshot("spam.png").perform_as(Tester)
+
+        mocked_crop.assert_not_called()
+
+    @mock.patch(
+        "screenpy_selenium.actions.save_screenshot.AttachTheFile", autospec=True
+    )
+    def test_element_screenshot_can_be_attached(
+        self, mocked_atf: mock.Mock, Tester: Actor
+    ) -> None:
+        target, _ = get_mocked_target_and_element()
+
+        with mock.patch("builtins.open", new_callable=mock.mock_open):
+            SaveScreenshot("spam.png").of_the(target).and_attach_it().perform_as(Tester)
+
+        mocked_atf.assert_called_once_with("spam.png")
+
+    def test_describe_element_screenshot(self) -> None:
+        assert (
+            SaveScreenshot("pth").of_the(TARGET).describe()
+            == f"Save screenshot of the {TARGET} as pth"
+        )
+
     def test_describe(self) -> None:
         assert SaveScreenshot("pth").describe() == "Save screenshot as pth"
 
@@ -1202,6 +1523,188 @@ class TestSaveScreenshot:
         assert SubSaveScreenshot.as_("").new_method() is True
 
 
+class TestScreenshotWriter:
+    settings_path = "screenpy_selenium.screenshots.settings"
+
+    def test_write_and_flush(self, tmp_path: Path) -> None:
+        writer = ScreenshotWriter()
+        path = tmp_path / "screenshot.png"
+
+        writer.write(str(path), b"spam")
+        writer.flush()
+
+        assert path.read_bytes() == b"spam"
+        assert writer.pending == {}
+
+    def test_flush_raises_write_errors(self, tmp_path: Path) -> None:
+        writer = ScreenshotWriter()
+        path = tmp_path / "missing" / "screenshot.png"
+
+        writer.write(str(path), b"spam")
+
+        with pytest.raises(OSError, match="No such file"):
+            writer.flush()
+        writer.flush()  # the error is only raised once
+
+    def test_flush_for_owner_only_raises_its_errors(self, tmp_path: Path) -> None:
+        writer = ScreenshotWriter()
+        owner, other_owner = object(), object()
+
+        writer.write(str(tmp_path / "missing" / "other.png"), b"eggs", other_owner)
+        writer.write(str(tmp_path / "screenshot.png"), b"spam", owner)
+        writer.flush(owner)
+
+        assert (tmp_path / "screenshot.png").read_bytes() == b"spam"
+        with pytest.raises(OSError, match="No such file"):
+            writer.flush(other_owner)
+
+    def test_write_blocks_when_full(self, tmp_path: Path) -> None:
+        writer = ScreenshotWriter(max_pending=1)
+        release = threading.Event()
+        blocked_write = mock.Mock(side_effect=lambda *_: release.wait())
+
+        with mock.patch("screenpy_selenium.screenshots.save_screenshot", blocked_write):
+            writer.write(str(tmp_path / "first.png"), b"spam")
+            second = threading.Thread(
+                target=writer.write, args=(str(tmp_path / "second.png"), b"eggs")
+            )
+            second.start()
+            second.join(0.1)
+            assert second.is_alive()
+
+            release.set()
+            second.join(1)
+            writer.flush()
+
+        assert not second.is_alive()
+        assert blocked_write.call_count == 2
+
+    def test_queue_size_from_settings(self, tmp_path: Path) -> None:
+        mock_settings = ScreenPySeleniumSettings(SCREENSHOT_QUEUE_SIZE=3)
+        writer = ScreenshotWriter()
+
+        with mock.patch(self.settings_path, mock_settings):
+            writer.write(str(tmp_path / "screenshot.png"), b"spam")
+            writer.flush()
+
+        assert writer.slots is not None
+        assert writer.slots._initial_value == 3  # type: ignore[attr-defined]
+
+
+class TestScreenshotStorage:
+    settings_path = "screenpy_selenium.screenshots.settings"
+
+    @pytest.fixture(autouse=True)
+    def _forget_saved_screenshots(self) -> Generator:
+        with mock.patch.dict(saved_screenshots, clear=True):
+            yield
+
+    def test_deduplicates_identical_screenshots(self, tmp_path: Path) -> None:
+        mock_settings = ScreenPySeleniumSettings(DEDUPLICATE_SCREENSHOTS=True)
+        first, second = tmp_path / "first.png", tmp_path / "second.png"
+
+        with mock.patch(self.settings_path, mock_settings):
+            save_screenshot(str(first), b"spam")
+            save_screenshot(str(second), b"spam")
+
+        assert second.read_bytes() == b"spam"
+        assert first.stat().st_ino == second.stat().st_ino
+
+    def test_different_screenshots_are_not_linked(self, tmp_path: Path) -> None:
+        mock_settings = ScreenPySeleniumSettings(DEDUPLICATE_SCREENSHOTS=True)
+        first, second = tmp_path / "first.png", tmp_path / "second.png"
+
+        with mock.patch(self.settings_path, mock_settings):
+            save_screenshot(str(first), b"spam")
+            save_screenshot(str(second), b"eggs")
+
+        assert first.stat().st_ino != second.stat().st_ino
+
+    def test_overwriting_a_linked_screenshot(self, tmp_path: Path) -> None:
+        mock_settings = ScreenPySeleniumSettings(DEDUPLICATE_SCREENSHOTS=True)
+        first, second = tmp_path / "first.png", tmp_path / "second.png"
+
+        with mock.patch(self.settings_path, mock_settings):
+            save_screenshot(str(first), b"spam")
+            save_screenshot(str(second), b"spam")
+            save_screenshot(str(first), b"eggs")
+            save_screenshot(str(tmp_path / "third.png"), b"spam")
+
+        assert first.read_bytes() == b"eggs"
+        assert second.read_bytes() == b"spam"
+        assert (tmp_path / "third.png").read_bytes() == b"spam"
+
+    def test_falls_back_to_writing(self, tmp_path: Path) -> None:
+        mock_settings = ScreenPySeleniumSettings(DEDUPLICATE_SCREENSHOTS=True)
+        first, second = tmp_path / "first.png", tmp_path / "second.png"
+
+        with mock.patch(self.settings_path, mock_settings):
+            save_screenshot(str(first), b"spam")
+            first.unlink()
+            save_screenshot(str(second), b"spam")
+
+        assert second.read_bytes() == b"spam"
+
+    def test_screenshot_path(self) -> None:
+        webp_settings = ScreenPySeleniumSettings(SCREENSHOT_FORMAT="webp")
+        palette_settings = ScreenPySeleniumSettings(SCREENSHOT_FORMAT="palette")
+
+        with mock.patch(self.settings_path, webp_settings):
+            webp_path = screenshot_path("shots/spam.png")
+        with mock.patch(self.settings_path, palette_settings):
+            palette_path = screenshot_path("shots/spam.png")
+
+        assert webp_path == os.path.join("shots", "spam.webp")
+        assert palette_path == os.path.join("shots", "spam.png")
+        assert screenshot_path("shots/spam") == "shots/spam"
+
+    @mock.patch("screenpy_selenium.screenshots.encode_screenshot", autospec=True)
+    def test_reencodes(self, mocked_encode: mock.Mock, tmp_path: Path) -> None:
+        mocked_encode.return_value = b"small spam"
+        mock_settings = ScreenPySeleniumSettings(
+            SCREENSHOT_FORMAT="jpeg", SCREENSHOT_QUALITY=50
+        )
+        path = tmp_path / "spam.jpg"
+
+        with mock.patch(self.settings_path, mock_settings):
+            save_screenshot(str(path), b"spam")
+
+        mocked_encode.assert_called_once_with(b"spam", "jpeg", 50)
+        assert path.read_bytes() == b"small spam"
+
+    def test_crop_screenshot(self) -> None:
+        image_module = pytest.importorskip("PIL.Image")
+        png = BytesIO()
+        image_module.new("RGB", (40, 20), "red").save(png, format="PNG")
+
+        cropped = crop_screenshot(png.getvalue(), (5, 5, 20, 10), 2)
+
+        assert image_module.open(BytesIO(cropped)).size == (10, 5)
+
+    @mock.patch.dict(sys.modules, {"PIL": None})
+    def test_cropping_needs_pillow(self) -> None:
+        with pytest.raises(ImportError, match="needs Pillow"):
+            crop_screenshot(b"spam", (0, 0, 1, 1))
+
+    @mock.patch.dict(sys.modules, {"PIL": None})
+    def test_reencoding_needs_pillow(self) -> None:
+        with pytest.raises(ImportError, match="needs Pillow"):
+            encode_screenshot(b"spam", "webp", 80)
+
+    @pytest.mark.parametrize(
+        ("image_format", "magic"),
+        [("jpeg", b"\xff\xd8"), ("webp", b"RIFF"), ("palette", b"\x89PNG")],
+    )
+    def test_encode_screenshot(self, image_format: str, magic: bytes) -> None:
+        image_module = pytest.importorskip("PIL.Image")
+        png = BytesIO()
+        image_module.new("RGB", (4, 4), "red").save(png, format="PNG")
+
+        encoded = encode_screenshot(png.getvalue(), image_format, 50)
+
+        assert encoded.startswith(magic)
+
+
 class TestSelect:
     def test_specifics_can_be_instantiated(self) -> None:
         by_index1 = Select.the_option_at_index(0)
@@ -1226,6 +1729,8 @@ class TestSelect:
 
 
 class TestSelectByIndex:
+    settings_path = "screenpy_selenium.actions.select.settings"
+
     def test_can_be_instantiated(self) -> None:
         sbi = SelectByIndex(1)
 
@@ -1250,6 +1755,23 @@ class TestSelectByIndex:
             int(index)
         )
 
+    @mock.patch("screenpy_selenium.actions.select.SeleniumSelect", autospec=True)
+    def test_perform_with_script(
+        self, mocked_selselect: mock.Mock, Tester: Actor
+    ) -> None:
+        target, element = get_mocked_target_and_element()
+        browser = get_mocked_browser(Tester)
+        browser.execute_script.return_value = True
+        mock_settings = ScreenPySeleniumSettings(SCRIPTED_SELECT=True)
+
+        with mock.patch(self.settings_path, mock_settings):
+            SelectByIndex(1).from_the(target).perform_as(Tester)
+
+        browser.execute_script.assert_called_once_with(
+            SELECT_OPTION, element, "index", "1"
+        )
+        mocked_selselect.assert_not_called()
+
     def test_perform_complains_for_no_target(self, Tester: Actor) -> None:
         with pytest.raises(UnableToAct):
             SelectByIndex(1).perform_as(Tester)
@@ -1281,6 +1803,8 @@ class TestSelectByIndex:
 
 
 class TestSelectByText:
+    settings_path = "screenpy_selenium.actions.select.settings"
+
     def test_can_be_instantiated(self) -> None:
         sbt = SelectByText("")
 
@@ -1305,6 +1829,53 @@ class TestSelectByText:
             text
         )
 
+    @mock.patch("screenpy_selenium.actions.select.SeleniumSelect", autospec=True)
+    def test_perform_with_script(
+        self, mocked_selselect: mock.Mock, Tester: Actor
+    ) -> None:
+        target, element = get_mocked_target_and_element()
+        browser = get_mocked_browser(Tester)
+        browser.execute_script.return_value = True
+        mock_settings = ScreenPySeleniumSettings(SCRIPTED_SELECT=True)
+
+        with mock.patch(self.settings_path, mock_settings):
+            SelectByText("blah").from_the(target).perform_as(Tester)
+
+        browser.execute_script.assert_called_once_with(
+            SELECT_OPTION, element, "text", "blah"
+        )
+        mocked_selselect.assert_not_called()
+
+    @mock.patch("screenpy_selenium.actions.select.SeleniumSelect", autospec=True)
+    def test_script_falls_back_to_select(
+        self, mocked_selselect: mock.Mock, Tester: Actor
+    ) -> None:
+        target, element = get_mocked_target_and_element()
+        browser = get_mocked_browser(Tester)
+        mock_settings = ScreenPySeleniumSettings(SCRIPTED_SELECT=True)
+
+        for result in (False, WebDriverException()):
+            mocked_selselect.reset_mock()
+            browser.execute_script.side_effect = [result]
+            with mock.patch(self.settings_path, mock_settings):
+                SelectByText("blah").from_the(target).perform_as(Tester)
+
+            mocked_selselect(element).select_by_visible_text.assert_called_once_with(
+                "blah"
+            )
+
+    @mock.patch("screenpy_selenium.actions.select.SeleniumSelect", autospec=True)
+    def test_no_script_by_default(
+        self, mocked_selselect: mock.Mock, Tester: Actor
+    ) -> None:
+        target, element = get_mocked_target_and_element()
+        browser = get_mocked_browser(Tester)
+
+        SelectByText("blah").from_the(target).perform_as(Tester)
+
+        browser.execute_script.assert_not_called()
+        mocked_selselect(element).select_by_visible_text.assert_called_once_with("blah")
+
     def test_perform_complains_for_no_target(self, Tester: Actor) -> None:
         with pytest.raises(UnableToAct):
             SelectByText("text").perform_as(Tester)
@@ -1338,6 +1909,8 @@ class TestSelectByText:
 
 
 class TestSelectByValue:
+    settings_path = "screenpy_selenium.actions.select.settings"
+
     def test_can_be_instantiated(self) -> None:
         sbv = SelectByValue(0)
 
@@ -1361,6 +1934,23 @@ class TestSelectByValue:
 
         mocked_selselect(element).select_by_value.assert_called_once_with(str(value))
 
+    @mock.patch("screenpy_selenium.actions.select.SeleniumSelect", autospec=True)
+    def test_perform_with_script(
+        self, mocked_selselect: mock.Mock, Tester: Actor
+    ) -> None:
+        target, element = get_mocked_target_and_element()
+        browser = get_mocked_browser(Tester)
+        browser.execute_script.return_value = True
+        mock_settings = ScreenPySeleniumSettings(SCRIPTED_SELECT=True)
+
+        with mock.patch(self.settings_path, mock_settings):
+            SelectByValue(0).from_the(target).perform_as(Tester)
+
+        browser.execute_script.assert_called_once_with(
+            SELECT_OPTION, element, "value", "0"
+        )
+        mocked_selselect.assert_not_called()
+
     def test_perform_complains_for_no_target(self, Tester: Actor) -> None:
         with pytest.raises(UnableToAct):
             SelectByValue("value").perform_as(Tester)
@@ -1460,6 +2050,7 @@ class TestSwitchToTab:
 
 class TestWait:
     settings_path = "screenpy_selenium.actions.wait.settings"
+    selenium_settings_path = "screenpy_selenium.actions.wait.selenium_settings"
 
     def test_can_be_instantiated(self) -> None:
         def foo() -> None:
@@ -1583,9 +2174,234 @@ class TestWait:
 
         assert str(test_target) in str(excinfo.value)
 
+    @mock.patch("screenpy_selenium.actions.wait.WebDriverWait", autospec=True)
+    def test_reactively(self, mocked_webdriverwait: mock.Mock, Tester: Actor) -> None:
+        browser = get_mocked_browser(Tester)
+        browser.execute_async_script.return_value = True
+        test_target = Target.the("foo").located_by("//bar")
+
+        Wait(5).seconds_for(test_target).to_appear().reactively().perform_as(Tester)
+
+        browser.execute_async_script.assert_called_once_with(
+            WAIT_FOR_CONDITION,
+            *test_target,
+            "appear",
+            "",
+            5000,
+            int(settings.POLLING * 1000),
+        )
+        browser.set_script_timeout.assert_called_with(browser.timeouts.script)
+        mocked_webdriverwait.assert_not_called()
+
+    @mock.patch("screenpy_selenium.actions.wait.WebDriverWait", autospec=True)
+    def test_reactively_contain_text(
+        self, mocked_webdriverwait: mock.Mock, Tester: Actor
+    ) -> None:
+        browser = get_mocked_browser(Tester)
+        browser.execute_async_script.return_value = True
+        test_target = Target.the("foo").located_by("#bar")
+
+        Wait.for_the(test_target).to_contain_text("baz").reactively().perform_as(Tester)
+
+        args = browser.execute_async_script.call_args[0]
+        assert args[3:5] == ("contain text", "baz")
+        mocked_webdriverwait.assert_not_called()
+
+    def test_reactively_uses_seleniums_is_displayed_atom(self) -> None:
+        atom = pkgutil.get_data("selenium", "webdriver/remote/isDisplayed.js")
+
+        assert atom is not None
+        assert atom.decode("utf-8") in WAIT_FOR_CONDITION
+
+    def test_reactively_times_out(self, Tester: Actor) -> None:
+        browser = get_mocked_browser(Tester)
+        browser.execute_async_script.return_value = False
+        test_target = Target.the("foo").located_by("//bar")
+
+        with pytest.raises(DeliveryError) as excinfo:
+            Wait.for_the(test_target).reactively().perform_as(Tester)
+
+        assert "TimeoutException" in str(excinfo.value)
+
+    @mock.patch("screenpy_selenium.actions.wait.WebDriverWait", autospec=True)
+    def test_reactively_falls_back_to_polling(
+        self, mocked_webdriverwait: mock.Mock, Tester: Actor
+    ) -> None:
+        browser = get_mocked_browser(Tester)
+        browser.execute_async_script.side_effect = WebDriverException
+        test_target = Target.the("foo").located_by("//bar")
+
+        Wait.for_the(test_target).to_disappear().reactively().perform_as(Tester)
+
+        mocked_webdriverwait.assert_called_once()
+        mocked_webdriverwait.return_value.until.assert_called_once()
+
+    @mock.patch("screenpy_selenium.actions.wait.WebDriverWait", autospec=True)
+    def test_reactively_custom_strategy_polls(
+        self, mocked_webdriverwait: mock.Mock, Tester: Actor
+    ) -> None:
+        browser = get_mocked_browser(Tester)
+        test_func = mock.Mock()
+        test_func.__name__ = "foo"
+
+        Wait().using(test_func).with_(TARGET).reactively().perform_as(Tester)
+
+        browser.execute_async_script.assert_not_called()
+        mocked_webdriverwait(browser, settings.TIMEOUT).until.assert_called_once_with(
+            test_func(TARGET)
+        )
+
+    def test_for_all(self, Tester: Actor) -> None:
+        browser = get_mocked_browser(Tester)
+        browser.execute_script.return_value = [True, True]
+        target1 = Target.the("header").located_by("#header")
+        target2 = Target.the("sidebar").located_by("//aside")
+        condition = mock.Mock(return_value=True)
+
+        Wait.for_all(target1, target2, condition).perform_as(Tester)
+
+        browser.execute_script.assert_called_once_with(
+            ARE_DISPLAYED, [list(target1), list(target2)]
+        )
+        condition.assert_called_once_with(browser)
+
+    def test_for_all_uses_seleniums_is_displayed_atom(self) -> None:
+        atom = pkgutil.get_data("selenium", "webdriver/remote/isDisplayed.js")
+
+        assert atom is not None
+        assert atom.decode("utf-8") in ARE_DISPLAYED
+
+    def test_for_all_names_unmet_conditions(self, Tester: Actor) -> None:
+        browser = get_mocked_browser(Tester)
+        browser.execute_script.return_value = [True, False]
+        target1 = Target.the("header").located_by("#header")
+        target2 = Target.the("sidebar").located_by("//aside")
+
+        with pytest.raises(DeliveryError) as excinfo:
+            Wait(0).using(AllOf).with_(target1, target2).perform_as(Tester)
+
+        assert str(excinfo.value).endswith("Unmet: sidebar")
+
+    def test_for_any(self, Tester: Actor, caplog: pytest.LogCaptureFixture) -> None:
+        browser = get_mocked_browser(Tester)
+        browser.execute_script.return_value = [False, True]
+        target1 = Target.the("error banner").located_by("#error")
+        target2 = Target.the("success banner").located_by("#success")
+        caplog.set_level(logging.INFO)
+
+        Wait.for_any(target1, target2).perform_as(Tester)
+
+        assert "the success banner came through first" in caplog.records[-1].msg
+
+    def test_compound_condition_unscriptable_target(self) -> None:
+        driver = get_mocked_webdriver()
+        element = get_mocked_element()
+        element.is_displayed.return_value = True
+        driver.find_element.return_value = element
+        target = Target.the("button").located_by(("accessibility id", "button"))
+
+        assert AllOf(target)(driver)
+        driver.execute_script.assert_not_called()
+
+    def test_compound_condition_ignores_missing_elements(self) -> None:
+        driver = get_mocked_webdriver()
+        condition = mock.Mock(side_effect=NoSuchElementException)
+
+        assert AnyOf(condition)(driver) is False
+
+    def test_compound_condition_raises_for_bad_locator(self) -> None:
+        driver = get_mocked_webdriver()
+        driver.execute_script.return_value = [{"error": "SyntaxError"}]
+
+        with pytest.raises(InvalidSelectorException):
+            AllOf(Target.the("bad").located_by("!!"))(driver)
+
+    def test_compound_names(self) -> None:
+        target = Target.the("header").located_by("#header")
+        condition = EC.title_contains("Welcome")
+
+        assert CompoundCondition(target, condition).names == [
+            "header",
+            "title_contains",
+        ]
+        assert Wait.for_all(target, condition).log_message == (
+            "for all of: header, title_contains..."
+        )
+
+    @mock.patch("screenpy_selenium.actions.wait.WebDriverWait", autospec=True)
+    def test_traces_polls(self, mocked_webdriverwait: mock.Mock, Tester: Actor) -> None:
+        tracer = Tracer()
+        condition = mock.Mock(__name__="spam", return_value=mock.Mock())
+
+        with mock.patch("screenpy_selenium.tracing.active_tracer", tracer):
+            Wait().using(condition).perform_as(Tester)
+        poll = mocked_webdriverwait.return_value.until.call_args[0][0]
+        poll(get_mocked_browser(Tester))
+
+        condition.return_value.assert_called_once()
+        assert tracer.events[0]["name"] == "poll spam"
+        assert tracer.events[0]["cat"] == "poll"
+
+    @mock.patch("screenpy_selenium.actions.wait.BackoffWait", autospec=True)
+    def test_backoff_polling(
+        self, mocked_backoffwait: mock.Mock, Tester: Actor
+    ) -> None:
+        mocked_browser = get_mocked_browser(Tester)
+        mock_settings = ScreenPySeleniumSettings(BACKOFF_POLLING=True)
+
+        with mock.patch(self.selenium_settings_path, mock_settings):
+            Wait.for_the(TARGET).perform_as(Tester)
+
+        mocked_backoffwait.assert_called_once_with(
+            mocked_browser, settings.TIMEOUT, settings.POLLING
+        )
+
+    @mock.patch("screenpy_selenium.actions.wait.random.uniform", return_value=0)
+    def test_backoff_intervals(self, mocked_uniform: mock.Mock) -> None:
+        mock_settings = ScreenPySeleniumSettings(
+            BACKOFF_POLLING_START=0.1,
+            BACKOFF_POLLING_FACTOR=3,
+            BACKOFF_POLLING_MAX=1,
+        )
+
+        with mock.patch(self.selenium_settings_path, mock_settings):
+            intervals = BackoffWait.intervals()
+            first_four = [round(next(intervals), 2) for _ in range(4)]
+
+        assert first_four == [0.1, 0.3, 0.9, 1]
+        mocked_uniform.assert_called_with(0, BackoffWait.JITTER)
+
+    def test_backoff_intervals_are_jittered(self) -> None:
+        mock_settings = ScreenPySeleniumSettings(BACKOFF_POLLING_START=1)
+
+        with mock.patch(self.selenium_settings_path, mock_settings):
+            interval = next(BackoffWait.intervals())
+
+        assert 1 - BackoffWait.JITTER <= interval <= 1
+
+    def test_backoff_wait_returns_truthy_value(self) -> None:
+        condition = mock.Mock(side_effect=[False, "done"])
+        mock_settings = ScreenPySeleniumSettings(BACKOFF_POLLING_START=0)
+        driver = get_mocked_webdriver()
+
+        with mock.patch(self.selenium_settings_path, mock_settings):
+            result = BackoffWait(driver, 1).until(condition)
+
+        assert result == "done"
+        assert condition.call_count == 2
+
+    def test_backoff_wait_times_out(self) -> None:
+        condition = mock.Mock(side_effect=NoSuchElementException("gone"))
+
+        with pytest.raises(TimeoutException):
+            BackoffWait(get_mocked_webdriver(), 0).until(condition)
+
+        condition.assert_called_once()
+
     def test_helpful_methods(self) -> None:
         assert Wait(1).to_appear().condition == EC.visibility_of_element_located
         assert Wait(1).to_be_clickable().condition == EC.element_to_be_clickable
+        assert Wait(1).reactively().reactive
         assert Wait(1).to_disappear().condition == EC.invisibility_of_element_located
         assert Wait(1).to_contain_text("").condition == EC.text_to_be_present_in_element
 
@@ -1,6 +1,20 @@
 from __future__ import annotations
 
+import json
+import subprocess
+import sys
+
+import screenpy_selenium
+
+# A fresh interpreter imports screenpy, then this package, and reports which
+# modules the package brought along with it.
+MEASURE_IMPORT = """
+import json, sys
+import screenpy
+before = set(sys.modules)
 import screenpy_selenium
+print(json.dumps(sorted(set(sys.modules) - before)))
+"""
 
 
 def test_screenpy_selenium() -> None:
@@ -34,6 +48,8 @@ def test_screenpy_selenium() -> None:
         "Enter2FAToken",
         "Enters",
         "Enters2FAToken",
+        "FillForm",
+        "FillsForm",
         "Exist",
         "Exists",
         "GoBack",
@@ -52,6 +68,18 @@ def test_screenpy_selenium() -> None:
         "IsNotDisplayed",
         "IsPresent",
         "IsVisible",
+        "AllClickable",
+        "AllDisplayed",
+        "AllEnabled",
+        "AllVisible",
+        "AnyDisplayed",
+        "AnyVisible",
+        "AreAllClickable",
+        "AreAllVisible",
+        "AreNoneVisible",
+        "IsAnyVisible",
+        "NoneDisplayed",
+        "NoneVisible",
         "List",
         "MoveMouse",
         "MovesMouse",
@@ -89,6 +117,7 @@ def test_screenpy_selenium() -> None:
         "SelectByText",
         "SelectByValue",
         "Selected",
+        "Table",
         "Selects",
         "SelectsByIndex",
         "SelectsByText",
@@ -113,6 +142,7 @@ def test_screenpy_selenium() -> None:
         "TheList",
         "TheNumber",
         "TheSelected",
+        "TheTable",
         "TheText",
         "TheTextOfTheAlert",
         "Visible",
@@ -152,6 +182,8 @@ def test_actions() -> None:
         "Enter2FAToken",
         "Enters",
         "Enters2FAToken",
+        "FillForm",
+        "FillsForm",
         "GoBack",
         "GoesBack",
         "GoesForward",
@@ -222,6 +254,7 @@ def test_questions() -> None:
         "List",
         "Number",
         "Selected",
+        "Table",
         "Text",
         "TextOfTheAlert",
         "TheAttribute",
@@ -232,6 +265,7 @@ def test_questions() -> None:
         "TheList",
         "TheNumber",
         "TheSelected",
+        "TheTable",
         "TheText",
         "TheTextOfTheAlert",
     ]
@@ -253,8 +287,50 @@ def test_resolutions() -> None:
         "IsNotDisplayed",
         "IsPresent",
         "IsVisible",
+        "AllClickable",
+        "AllDisplayed",
+        "AllEnabled",
+        "AllVisible",
+        "AnyDisplayed",
+        "AnyVisible",
+        "AreAllClickable",
+        "AreAllVisible",
+        "AreNoneVisible",
+        "IsAnyVisible",
+        "NoneDisplayed",
+        "NoneVisible",
         "NotDisplayed",
         "Present",
         "Visible",
     ]
     assert sorted(screenpy_selenium.resolutions.__all__) == sorted(expected)
+
+
+def test_lazy_names_match_subpackages() -> None:
+    for subpackage in screenpy_selenium.SUBPACKAGES:
+        module = getattr(screenpy_selenium, subpackage)
+        lazy_names = screenpy_selenium.LAZY_NAMES[subpackage]
+
+        assert sorted(lazy_names) == sorted(module.__all__)
+        for name in lazy_names:
+            assert getattr(screenpy_selenium, name) is getattr(module, name)
+
+
+def test_unknown_name_raises_attribute_error() -> None:
+    assert not hasattr(screenpy_selenium, "NotAThing")
+
+
+def test_import_budget() -> None:
+    result = subprocess.run(
+        [sys.executable, "-c", MEASURE_IMPORT],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    imported = json.loads(result.stdout)
+
+    assert len(imported) <= 10
+    for lazy_module in ("screenpy_pyotp", "selenium.webdriver.chrome.webdriver"):
+        assert lazy_module not in imported
+    for subpackage in screenpy_selenium.SUBPACKAGES:
+        assert f"screenpy_selenium.{subpackage}" not in imported
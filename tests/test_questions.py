@@ -8,22 +8,35 @@ import pytest
 from screenpy import Answerable, Describable, ErrorKeeper, UnableToAnswer
 from selenium.common.exceptions import WebDriverException
 from selenium.webdriver.common.alert import Alert as SeleniumAlert
+from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webelement import WebElement
 
 from screenpy_selenium import (
     Attribute,
     BrowserTitle,
     BrowserURL,
+    BrowseTheWeb,
     Cookies,
     Element,
     List,
     Number,
     Selected,
+    Table,
     Target,
     TargetingError,
     Text,
     TextOfTheAlert,
 )
+from screenpy_selenium.configuration import ScreenPySeleniumSettings
+from screenpy_selenium.page_snapshot import ElementSnapshot, PageSnapshot
+from screenpy_selenium.questions.table import GRID_ROWS_XPATH
+from screenpy_selenium.scripts import (
+    COUNT_ELEMENTS,
+    READ_ATTRIBUTES,
+    READ_SELECTED_OPTIONS,
+    READ_TABLE,
+    READ_VISIBLE_TEXTS,
+)
 
 from .useful_mocks import get_mock_target_class, get_mocked_browser, get_mocked_element
 
@@ -34,13 +47,27 @@ FakeTarget = get_mock_target_class()
 TARGET = FakeTarget()
 
 
+def use_snapshot(
+    actor: Actor, target: Target, elements: list[ElementSnapshot]
+) -> PageSnapshot:
+    """Give the Actor a snapshot of the page, which found the elements."""
+    snapshot = PageSnapshot("Snapshot Title", "https://example.com/snapshot")
+    snapshot.elements[target.get_locator()] = elements
+    actor.ability_to(BrowseTheWeb).snapshot = snapshot
+    return snapshot
+
+
 class TestAttribute:
+    settings_path = "screenpy_selenium.questions.attribute.settings"
+
     def test_can_be_instantiated(self) -> None:
         a1 = Attribute("")
         a2 = Attribute("").of_the(TARGET)
+        a3 = Attribute("", "").of_all(TARGET)
 
         assert isinstance(a1, Attribute)
         assert isinstance(a2, Attribute)
+        assert isinstance(a3, Attribute)
 
     def test_implements_protocol(self) -> None:
         a = Attribute("")
@@ -81,8 +108,94 @@ class TestAttribute:
         mocked_browser.find_elements.assert_called_once_with(*fake_target)
         element.get_attribute.assert_called_once_with(attr)
 
+    def test_ask_for_many_attributes(self, Tester: Actor) -> None:
+        fake_target = Target.the("fake").located_by("//html")
+        mocked_browser = get_mocked_browser(Tester)
+        element = get_mocked_element()
+        element.get_attribute.side_effect = ["/home", "home-link"]
+        mocked_browser.find_element.return_value = element
+
+        answer = Attribute("href", "data-id").of_the(fake_target).answered_by(Tester)
+
+        assert answer == ["/home", "home-link"]
+
+    def test_ask_for_many_attributes_multi(self, Tester: Actor) -> None:
+        fake_target = Target.the("fake").located_by("//html")
+        mocked_browser = get_mocked_browser(Tester)
+        element1, element2 = get_mocked_element(), get_mocked_element()
+        element1.get_attribute.side_effect = ["/home", "home-link"]
+        element2.get_attribute.side_effect = ["/away", None]
+        mocked_browser.find_elements.return_value = [element1, element2]
+
+        answer = Attribute("href", "data-id").of_all(fake_target).answered_by(Tester)
+
+        assert answer == [["/home", "home-link"], ["/away", None]]
+
+    def test_ask_for_attribute_multi_in_bulk(self, Tester: Actor) -> None:
+        fake_target = Target.the("fake").located_by("//html")
+        mocked_browser = get_mocked_browser(Tester)
+        mocked_browser.execute_script.return_value = [["bar"], [None]]
+        mock_settings = ScreenPySeleniumSettings(BULK_QUERIES=True)
+
+        with mock.patch(self.settings_path, mock_settings):
+            answer = Attribute("foo").of_all(fake_target).answered_by(Tester)
+
+        assert answer == ["bar", None]
+        mocked_browser.execute_script.assert_called_once_with(
+            READ_ATTRIBUTES, *fake_target, ["foo"]
+        )
+        mocked_browser.find_elements.assert_not_called()
+
+    def test_ask_for_many_attributes_multi_in_bulk(self, Tester: Actor) -> None:
+        fake_target = Target.the("fake").located_by("//html")
+        mocked_browser = get_mocked_browser(Tester)
+        rows = [["/home", "home-link"], ["/away", None]]
+        mocked_browser.execute_script.return_value = rows
+        mock_settings = ScreenPySeleniumSettings(BULK_QUERIES=True)
+
+        with mock.patch(self.settings_path, mock_settings):
+            answer = (
+                Attribute("href", "data-id").of_all(fake_target).answered_by(Tester)
+            )
+
+        assert answer == rows
+
+    def test_answers_from_snapshot(self, Tester: Actor) -> None:
+        target = Target.the("links").located_by("a")
+        mocked_browser = get_mocked_browser(Tester)
+        use_snapshot(
+            Tester,
+            target,
+            [
+                ElementSnapshot("Home", {"href": "/home", "id": "home"}, None),
+                ElementSnapshot("About", {"href": "/about", "id": "about"}, None),
+            ],
+        )
+
+        assert Attribute("href").of_the(target).answered_by(Tester) == "/home"
+        assert Attribute("href", "id").of_all(target).answered_by(Tester) == [
+            ["/home", "home"],
+            ["/about", "about"],
+        ]
+        mocked_browser.find_element.assert_not_called()
+        mocked_browser.find_elements.assert_not_called()
+
+    def test_asks_browser_for_attributes_not_in_snapshot(self, Tester: Actor) -> None:
+        target = Target.the("links").located_by("a")
+        mocked_browser = get_mocked_browser(Tester)
+        element = get_mocked_element()
+        element.get_attribute.return_value = "nofollow"
+        mocked_browser.find_element.return_value = element
+        use_snapshot(Tester, target, [ElementSnapshot("Home", {"href": "/"}, None)])
+
+        assert Attribute("rel").of_the(target).answered_by(Tester) == "nofollow"
+
     def test_describe(self) -> None:
         assert Attribute("foo").describe() == 'The "foo" attribute of the None.'
+        assert (
+            Attribute("foo", "bar").describe()
+            == 'The "foo" and "bar" attributes of the None.'
+        )
 
 
 class TestBrowserTitle:
@@ -104,6 +217,17 @@ class TestBrowserTitle:
 
         assert BrowserTitle().answered_by(Tester) == expected_title
 
+    def test_answers_from_snapshot(self, Tester: Actor) -> None:
+        mocked_browser = get_mocked_browser(Tester)
+        mocked_browser.title = "Live Title"
+        snapshot = use_snapshot(Tester, TARGET, [])
+
+        assert BrowserTitle().answered_by(Tester) == "Snapshot Title"
+
+        snapshot.invalidate()
+
+        assert BrowserTitle().answered_by(Tester) == "Live Title"
+
     def test_describe(self) -> None:
         assert BrowserTitle().describe() == "The current page's title."
 
@@ -127,6 +251,13 @@ class TestBrowserURL:
 
         assert BrowserURL().answered_by(Tester) == expected_url
 
+    def test_answers_from_snapshot(self, Tester: Actor) -> None:
+        mocked_browser = get_mocked_browser(Tester)
+        mocked_browser.current_url = "https://example.com/live"
+        use_snapshot(Tester, TARGET, [])
+
+        assert BrowserURL().answered_by(Tester) == "https://example.com/snapshot"
+
     def test_describe(self) -> None:
         assert BrowserURL().describe() == "The browser URL."
 
@@ -239,6 +370,8 @@ class TestList:
 
 
 class TestNumber:
+    settings_path = "screenpy_selenium.questions.number.settings"
+
     def test_can_be_instantiated(self) -> None:
         n1 = Number.of(TARGET)
 
@@ -259,11 +392,46 @@ class TestNumber:
         assert Number.of(fake_target).answered_by(Tester) == len(return_value)
         mocked_browser.find_elements.assert_called_once_with(*fake_target)
 
+    def test_ask_for_number_in_bulk(self, Tester: Actor) -> None:
+        fake_target = Target.the("fake").located_by("//xpath")
+        mocked_browser = get_mocked_browser(Tester)
+        mocked_browser.execute_script.return_value = 9001
+        mock_settings = ScreenPySeleniumSettings(BULK_QUERIES=True)
+
+        with mock.patch(self.settings_path, mock_settings):
+            assert Number.of(fake_target).answered_by(Tester) == 9001
+
+        mocked_browser.execute_script.assert_called_once_with(
+            COUNT_ELEMENTS, *fake_target
+        )
+        mocked_browser.find_elements.assert_not_called()
+
+    def test_ask_for_number_in_bulk_falls_back(self, Tester: Actor) -> None:
+        fake_target = Target.the("fake").located_by(("accessibility id", "spam"))
+        mocked_browser = get_mocked_browser(Tester)
+        mocked_browser.find_elements.return_value = [1, 2]
+        mock_settings = ScreenPySeleniumSettings(BULK_QUERIES=True)
+
+        with mock.patch(self.settings_path, mock_settings):
+            assert Number.of(fake_target).answered_by(Tester) == 2
+
+        mocked_browser.execute_script.assert_not_called()
+
+    def test_answers_from_snapshot(self, Tester: Actor) -> None:
+        target = Target.the("results").located_by(".result")
+        mocked_browser = get_mocked_browser(Tester)
+        use_snapshot(Tester, target, [ElementSnapshot("", {}, None)] * 3)
+
+        assert Number.of(target).answered_by(Tester) == 3
+        mocked_browser.find_elements.assert_not_called()
+
     def test_describe(self) -> None:
         assert Number(TARGET).describe() == f"The number of {TARGET}."
 
 
 class TestSelected:
+    settings_path = "screenpy_selenium.questions.selected.settings"
+
     def test_can_be_instantiated(self) -> None:
         s1 = Selected.option_from(TARGET)
         s2 = Selected.option_from_the(TARGET)
@@ -309,6 +477,85 @@ class TestSelected:
         assert Selected.options_from(fake_target).answered_by(Tester) == expected_value
         mocked_browser.find_element.assert_called_once_with(*fake_target)
 
+    @mock.patch("screenpy_selenium.questions.selected.SeleniumSelect", autospec=True)
+    def test_ask_for_selected_values_and_indexes(
+        self, mocked_selenium_select: mock.Mock, Tester: Actor
+    ) -> None:
+        fake_target = Target.the("fake").located_by("//xpath")
+        option = get_mocked_element()
+        option.get_attribute.side_effect = lambda name: {"value": "mn", "index": "23"}[
+            name
+        ]
+        mocked_selenium_select.return_value.first_selected_option = option
+        mocked_selenium_select.return_value.all_selected_options = [option]
+
+        assert Selected.option_from(fake_target).as_values().answered_by(Tester) == "mn"
+        assert Selected.options_from(fake_target).as_indexes().answered_by(Tester) == [
+            23
+        ]
+
+    @mock.patch("screenpy_selenium.questions.selected.SeleniumSelect", autospec=True)
+    def test_ask_with_bulk_queries(
+        self, mocked_selenium_select: mock.Mock, Tester: Actor
+    ) -> None:
+        fake_target = Target.the("fake").located_by("#industries")
+        mocked_browser = get_mocked_browser(Tester)
+        mocked_browser.execute_script.return_value = [
+            ["Farming", "farm", 2],
+            ["Fishing", "fish", 5],
+        ]
+        mock_settings = ScreenPySeleniumSettings(BULK_QUERIES=True)
+
+        with mock.patch(self.settings_path, mock_settings):
+            texts = Selected.options_from(fake_target).answered_by(Tester)
+            values = Selected.options_from(fake_target).as_values().answered_by(Tester)
+            index = Selected.option_from(fake_target).as_indexes().answered_by(Tester)
+
+        assert texts == ["Farming", "Fishing"]
+        assert values == ["farm", "fish"]
+        assert index == 2
+        mocked_browser.execute_script.assert_called_with(
+            READ_SELECTED_OPTIONS, "css selector", "#industries"
+        )
+        mocked_browser.find_element.assert_not_called()
+        mocked_selenium_select.assert_not_called()
+
+    @mock.patch("screenpy_selenium.questions.selected.SeleniumSelect", autospec=True)
+    def test_bulk_queries_fall_back(
+        self, mocked_selenium_select: mock.Mock, Tester: Actor
+    ) -> None:
+        """Selenium answers for non-selects, and raises when nothing is selected"""
+        fake_target = Target.the("fake").located_by("#state")
+        mocked_browser = get_mocked_browser(Tester)
+        mocked_selenium_select.return_value.first_selected_option.text = "Iowa"
+        mock_settings = ScreenPySeleniumSettings(BULK_QUERIES=True)
+
+        for result in (None, []):
+            mocked_browser.execute_script.return_value = result
+            with mock.patch(self.settings_path, mock_settings):
+                answer = Selected.option_from(fake_target).answered_by(Tester)
+
+            assert answer == "Iowa"
+        assert mocked_selenium_select.call_count == 2
+
+    @mock.patch("screenpy_selenium.questions.selected.SeleniumSelect", autospec=True)
+    def test_answers_from_snapshot(
+        self, mocked_selenium_select: mock.Mock, Tester: Actor
+    ) -> None:
+        target = Target.the("states").located_by("#states")
+        use_snapshot(
+            Tester,
+            target,
+            [ElementSnapshot("", {}, [("Iowa", "ia", 15), ("Ohio", "oh", 35)])],
+        )
+
+        assert Selected.option_from(target).answered_by(Tester) == "Iowa"
+        assert Selected.options_from(target).as_values().answered_by(Tester) == [
+            "ia",
+            "oh",
+        ]
+        mocked_selenium_select.assert_not_called()
+
     def test_describe(self) -> None:
         assert (
             Selected(TARGET).describe() == f"The selected option(s) from the {TARGET}."
@@ -328,7 +575,188 @@ class TestSelected:
             Selected(TARGET, multi=True)
 
 
+class TestTable:
+    table = Target.the("orders table").located_by("#orders")
+
+    def test_can_be_instantiated(self) -> None:
+        t1 = Table.of_the(TARGET)
+        t2 = Table.of(TARGET)
+
+        assert isinstance(t1, Table)
+        assert isinstance(t2, Table)
+
+    def test_implements_protocol(self) -> None:
+        t = Table(TARGET)
+
+        assert isinstance(t, Answerable)
+        assert isinstance(t, Describable)
+
+    def test_describe(self) -> None:
+        assert Table(TARGET).describe() == f"The data in the {TARGET}."
+
+    def test_reads_columns_with_one_script(self, Tester: Actor) -> None:
+        mocked_browser = get_mocked_browser(Tester)
+        mocked_browser.execute_script.return_value = [
+            ["Item", "Quantity"],
+            [["Banana stand", "1"], ["Cornballer", "2"]],
+        ]
+
+        answer = Table.of_the(self.table).answered_by(Tester)
+
+        assert answer == {
+            "Item": ["Banana stand", "Cornballer"],
+            "Quantity": ["1", "2"],
+        }
+        mocked_browser.execute_script.assert_called_once_with(
+            READ_TABLE, *self.table, True
+        )
+        mocked_browser.find_element.assert_not_called()
+
+    def test_names_columns_without_headers_by_index(self, Tester: Actor) -> None:
+        mocked_browser = get_mocked_browser(Tester)
+        mocked_browser.execute_script.return_value = [
+            ["Item", "", "Item"],
+            [["Banana stand", "1", "Cornballer"], ["Seal", "2"]],
+        ]
+
+        answer = Table.of_the(self.table).answered_by(Tester)
+
+        assert answer == {
+            "Item": ["Banana stand", "Seal"],
+            "1": ["1", "2"],
+            "Item 2": ["Cornballer", None],
+        }
+
+    def test_without_headers(self, Tester: Actor) -> None:
+        mocked_browser = get_mocked_browser(Tester)
+        mocked_browser.execute_script.return_value = [None, [["a", "b"]]]
+
+        answer = Table.of_the(self.table).without_headers().answered_by(Tester)
+
+        assert answer == {"0": ["a"], "1": ["b"]}
+        mocked_browser.execute_script.assert_called_once_with(
+            READ_TABLE, *self.table, False
+        )
+
+    def test_with_types(self, Tester: Actor) -> None:
+        mocked_browser = get_mocked_browser(Tester)
+        mocked_browser.execute_script.return_value = [
+            ["Item", "Quantity"],
+            [["Banana stand", "1"], ["Cornballer", ""]],
+        ]
+
+        answer = Table.of(self.table).with_types({"Quantity": int}).answered_by(Tester)
+
+        assert answer == {
+            "Item": ["Banana stand", "Cornballer"],
+            "Quantity": [1, None],
+        }
+
+    def test_as_records(self, Tester: Actor) -> None:
+        mocked_browser = get_mocked_browser(Tester)
+        mocked_browser.execute_script.return_value = [
+            ["Item", "Quantity"],
+            [["Banana stand", "1"], ["Cornballer", "2"]],
+        ]
+
+        answer = Table.of(self.table).as_records().answered_by(Tester)
+
+        assert answer == [
+            {"Item": "Banana stand", "Quantity": "1"},
+            {"Item": "Cornballer", "Quantity": "2"},
+        ]
+
+    @mock.patch.dict("sys.modules", {"numpy": None})
+    def test_as_numpy_needs_numpy(self, Tester: Actor) -> None:
+        mocked_browser = get_mocked_browser(Tester)
+        mocked_browser.execute_script.return_value = [["Item"], [["Seal"]]]
+
+        with pytest.raises(ImportError, match="pip install numpy"):
+            Table.of(self.table).as_numpy().answered_by(Tester)
+
+    def test_raises_targeting_error_if_not_found(self, Tester: Actor) -> None:
+        mocked_browser = get_mocked_browser(Tester)
+        mocked_browser.execute_script.return_value = {"error": "not found"}
+
+        with pytest.raises(TargetingError):
+            Table.of(self.table).answered_by(Tester)
+
+    def test_raises_unable_to_answer_if_not_a_table(self, Tester: Actor) -> None:
+        mocked_browser = get_mocked_browser(Tester)
+        mocked_browser.execute_script.return_value = {"error": "not a table"}
+
+        with pytest.raises(UnableToAnswer, match="not a table or grid"):
+            Table.of(self.table).answered_by(Tester)
+
+    def _mocked_row(self, tag_name: str, *cells: tuple[str, str | None]) -> mock.Mock:
+        row = get_mocked_element()
+        row.find_elements.return_value = [
+            mock.create_autospec(
+                WebElement, text=text, tag_name=tag_name, instance=True
+            )
+            for text, _ in cells
+        ]
+        for cell, (_, colspan) in zip(row.find_elements.return_value, cells):
+            cell.get_attribute.return_value = colspan
+        return row
+
+    def test_falls_back_to_reading_each_cell(self, Tester: Actor) -> None:
+        mocked_browser = get_mocked_browser(Tester)
+        mocked_browser.execute_script.side_effect = WebDriverException()
+        head_rows = [
+            self._mocked_row("th", ("Stock", "2")),
+            self._mocked_row("th", ("Item", None), ("Quantity", None)),
+        ]
+        body_rows = [
+            self._mocked_row("td", ("Seal", "2")),
+            self._mocked_row("td", ("Cornballer", None), ("1", None)),
+        ]
+        mocked_table = get_mocked_element()
+        mocked_table.tag_name = "table"
+        mocked_table.find_elements.side_effect = [head_rows, body_rows, []]
+        mocked_browser.find_element.return_value = mocked_table
+
+        answer = Table.of(self.table).answered_by(Tester)
+
+        assert answer == {"Item": ["Seal", "Cornballer"], "Quantity": ["", "1"]}
+        mocked_table.find_elements.assert_has_calls(
+            [
+                mock.call(By.XPATH, "./thead/tr"),
+                mock.call(By.XPATH, "./tbody/tr | ./tr"),
+                mock.call(By.XPATH, "./tfoot/tr"),
+            ]
+        )
+
+    def test_falls_back_for_grids(self, Tester: Actor) -> None:
+        mocked_browser = get_mocked_browser(Tester)
+        mocked_browser.execute_script.side_effect = WebDriverException()
+        rows = [self._mocked_row("div", ("Seal", None), ("1", None))]
+        mocked_grid = get_mocked_element()
+        mocked_grid.tag_name = "div"
+        mocked_grid.get_attribute.return_value = "grid"
+        mocked_grid.find_elements.return_value = rows
+        mocked_browser.find_element.return_value = mocked_grid
+
+        answer = Table.of(self.table).without_headers().answered_by(Tester)
+
+        assert answer == {"0": ["Seal"], "1": ["1"]}
+        mocked_grid.find_elements.assert_called_once_with(By.XPATH, GRID_ROWS_XPATH)
+
+    def test_fallback_raises_if_not_a_table(self, Tester: Actor) -> None:
+        mocked_browser = get_mocked_browser(Tester)
+        mocked_browser.execute_script.side_effect = WebDriverException()
+        mocked_element = get_mocked_element()
+        mocked_element.tag_name = "div"
+        mocked_element.get_attribute.return_value = None
+        mocked_browser.find_element.return_value = mocked_element
+
+        with pytest.raises(UnableToAnswer, match="not a table or grid"):
+            Table.of(self.table).answered_by(Tester)
+
+
 class TestText:
+    settings_path = "screenpy_selenium.questions.text.settings"
+
     def test_can_be_instantiated(self) -> None:
         t1 = Text.of(TARGET)
         t2 = Text.of_all(TARGET)
@@ -370,6 +798,61 @@ class TestText:
         assert Text.of_all(fake_target).answered_by(Tester) == expected_texts
         mocked_browser.find_elements.assert_called_once_with(*fake_target)
 
+    def test_ask_for_all_text_in_bulk(self, Tester: Actor) -> None:
+        fake_target = Target.the("fakes").located_by("//xpath")
+        mocked_browser = get_mocked_browser(Tester)
+        expected_texts = ["spam", "eggs", "baked beans"]
+        mocked_browser.execute_script.return_value = expected_texts
+        mock_settings = ScreenPySeleniumSettings(BULK_QUERIES=True)
+
+        with mock.patch(self.settings_path, mock_settings):
+            texts = Text.of_all(fake_target).answered_by(Tester)
+
+        assert texts == expected_texts
+        mocked_browser.execute_script.assert_called_once_with(
+            READ_VISIBLE_TEXTS, *fake_target
+        )
+        mocked_browser.find_elements.assert_not_called()
+
+    def test_ask_for_all_text_in_bulk_falls_back(self, Tester: Actor) -> None:
+        fake_target = Target.the("fakes").located_by("//xpath")
+        mocked_browser = get_mocked_browser(Tester)
+        mocked_browser.execute_script.side_effect = WebDriverException
+        expected_texts = ["spam", "eggs"]
+        mocked_browser.find_elements.return_value = [
+            mock.create_autospec(WebElement, text=text, instance=True)
+            for text in expected_texts
+        ]
+        mock_settings = ScreenPySeleniumSettings(BULK_QUERIES=True)
+
+        with mock.patch(self.settings_path, mock_settings):
+            texts = Text.of_all(fake_target).answered_by(Tester)
+
+        assert texts == expected_texts
+        mocked_browser.find_elements.assert_called_once_with(*fake_target)
+
+    def test_answers_from_snapshot(self, Tester: Actor) -> None:
+        target = Target.the("headings").located_by("h2")
+        mocked_browser = get_mocked_browser(Tester)
+        use_snapshot(
+            Tester,
+            target,
+            [ElementSnapshot("First", {}, None), ElementSnapshot("Second", {}, None)],
+        )
+
+        assert Text.of_the(target).answered_by(Tester) == "First"
+        assert Text.of_all(target).answered_by(Tester) == ["First", "Second"]
+        mocked_browser.find_element.assert_not_called()
+        mocked_browser.find_elements.assert_not_called()
+
+    def test_asks_browser_when_not_in_snapshot(self, Tester: Actor) -> None:
+        target = Target.the("headings").located_by("h2")
+        mocked_browser = get_mocked_browser(Tester)
+        mocked_browser.find_element.return_value.text = "Live"
+        use_snapshot(Tester, Target.the("other").located_by("h3"), [])
+
+        assert Text.of_the(target).answered_by(Tester) == "Live"
+
     def test_describe(self) -> None:
         assert Text(TARGET).describe() == f"The text from the {TARGET}."
 
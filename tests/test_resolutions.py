@@ -1,13 +1,34 @@
 from __future__ import annotations
 
 import logging
+import pkgutil
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
 import pytest
 from hamcrest.core.string_description import StringDescription
+from selenium.common.exceptions import (
+    StaleElementReferenceException,
+    WebDriverException,
+)
 
-from screenpy_selenium import IsClickable, IsInvisible, IsPresent, IsVisible
+from screenpy_selenium import (
+    AllClickable,
+    AllVisible,
+    AnyVisible,
+    IsClickable,
+    IsInvisible,
+    IsPresent,
+    IsVisible,
+    NoneVisible,
+)
+from screenpy_selenium.resolutions.custom_matchers.element_state import (
+    ElementState,
+    read_states,
+)
+from screenpy_selenium.resolutions.custom_matchers.elements_in_state import (
+    ElementsInState,
+)
 from screenpy_selenium.resolutions.custom_matchers.is_clickable_element import (
     IsClickableElement,
 )
@@ -20,10 +41,13 @@ from screenpy_selenium.resolutions.custom_matchers.is_present_element import (
 from screenpy_selenium.resolutions.custom_matchers.is_visible_element import (
     IsVisibleElement,
 )
+from screenpy_selenium.scripts import ELEMENT_STATES
 
 from .useful_mocks import get_mocked_element
 
 if TYPE_CHECKING:
+    from unittest import mock
+
     from hamcrest.core.matcher import Matcher
     from selenium.webdriver.remote.webelement import WebElement
 
@@ -36,6 +60,19 @@ class ExpectedDescriptions:
     describe_none: str
 
 
+def get_elements_with_states(*states: list[bool]) -> list[mock.Mock]:
+    """Get mocked elements whose states are read by one script."""
+    elements = [get_mocked_element() for _ in states]
+    elements[0].parent.execute_script.return_value = [list(s) for s in states]
+    return elements
+
+
+def _describe_mismatch(obj: Matcher[Any], item: Any) -> str:  # noqa: ANN401
+    description = StringDescription()
+    obj.describe_mismatch(item, description)
+    return description.out
+
+
 def _assert_descriptions(
     obj: Matcher[Any], element: WebElement, expected: ExpectedDescriptions
 ) -> None:
@@ -83,6 +120,26 @@ class TestIsClickable:
         assert not ic._matches(invisible_element)
         assert not ic._matches(inactive_element)
 
+    def test_reads_state_with_one_script(self) -> None:
+        element = get_mocked_element()
+        element.parent.execute_script.return_value = [[True, True, False]]
+        ic = IsClickable().resolve()
+        describe_mismatch = StringDescription()
+
+        assert not ic._matches(element)
+        ic.describe_mismatch(element, describe_mismatch)
+
+        element.parent.execute_script.assert_called_once_with(ELEMENT_STATES, [element])
+        element.is_displayed.assert_not_called()
+        element.is_enabled.assert_not_called()
+        assert describe_mismatch.out == "was not enabled/clickable"
+
+    def test_script_uses_seleniums_is_displayed_atom(self) -> None:
+        atom = pkgutil.get_data("selenium", "webdriver/remote/isDisplayed.js")
+
+        assert atom is not None
+        assert atom.decode("utf-8") in ELEMENT_STATES
+
     def test_descriptions(self) -> None:
         element = get_mocked_element()
         expected = ExpectedDescriptions(
@@ -133,6 +190,14 @@ class TestIsVisible:
         assert not iv._matches(None)  # element was not found by Element()
         assert not iv._matches(element)
 
+    def test_reads_state_with_one_script(self) -> None:
+        element = get_mocked_element()
+        element.parent.execute_script.return_value = [[True, False, True]]
+        iv = IsVisible().resolve()
+
+        assert not iv._matches(element)
+        element.is_displayed.assert_not_called()
+
     def test_descriptions(self) -> None:
         element = get_mocked_element()
         expected = ExpectedDescriptions(
@@ -278,3 +343,200 @@ class TestIsPresent:
             "... hoping it's present.",
             "    => the element is present",
         ]
+
+
+class TestAllVisible:
+    def test_can_be_instantiated(self) -> None:
+        av = AllVisible()
+
+        assert isinstance(av, AllVisible)
+
+    def test_matches_all_visible_elements(self) -> None:
+        elements = get_elements_with_states([True, True, True], [True, True, False])
+        av = AllVisible().resolve()
+
+        assert av._matches(elements)
+        elements[0].parent.execute_script.assert_called_once_with(
+            ELEMENT_STATES, elements
+        )
+        for element in elements:
+            element.is_displayed.assert_not_called()
+
+    def test_does_not_match_some_invisible_elements(self) -> None:
+        elements = get_elements_with_states(
+            [True, True, True],
+            [True, False, True],
+            [True, True, True],
+            [False, False, True],
+        )
+        av = AllVisible().resolve()
+
+        assert not av._matches(elements)
+        assert not av._matches([])
+        assert not av._matches(None)
+
+    def test_descriptions(self) -> None:
+        elements = get_elements_with_states(
+            [True, False, True], [True, True, True], [True, False, True]
+        )
+        av = AllVisible()
+        matcher = av.resolve()
+        describe_to = StringDescription()
+        matcher.describe_to(describe_to)
+
+        assert av.describe() == "all visible"
+        assert describe_to.out == "all of the elements are visible"
+        assert not matcher._matches(elements)
+        assert _describe_mismatch(matcher, elements) == (
+            "the elements at indexes 0, 2 were not visible"
+        )
+        assert _describe_mismatch(matcher, []) == "there were no elements"
+        elements[0].parent.execute_script.assert_called_once()
+
+    def test_type_hint(self) -> None:
+        av = AllVisible()
+        annotation = av.resolve.__annotations__["return"]
+        assert annotation == "ElementsInState"
+        assert type(av.resolve()) is ElementsInState
+
+    def test_beat_logging(self, caplog: pytest.LogCaptureFixture) -> None:
+        caplog.set_level(logging.INFO)
+        AllVisible().resolve()
+
+        assert [r.msg for r in caplog.records] == [
+            "... hoping they're all visible.",
+            "    => all of the elements are visible",
+        ]
+
+
+class TestAnyVisible:
+    def test_can_be_instantiated(self) -> None:
+        av = AnyVisible()
+
+        assert isinstance(av, AnyVisible)
+
+    def test_matches_one_visible_element(self) -> None:
+        elements = get_elements_with_states([True, False, True], [True, True, True])
+        av = AnyVisible().resolve()
+        describe_match = StringDescription()
+
+        assert av._matches(elements)
+        av.describe_match(elements, describe_match)
+        assert describe_match.out == "1 of 2 were visible"
+
+    def test_does_not_match_all_invisible_elements(self) -> None:
+        elements = get_elements_with_states([True, False, True], [True, False, True])
+        av = AnyVisible().resolve()
+
+        assert not av._matches(elements)
+        assert not av._matches([])
+        assert _describe_mismatch(av, elements) == "none of the 2 were visible"
+
+    def test_describe(self) -> None:
+        describe_to = StringDescription()
+        AnyVisible().resolve().describe_to(describe_to)
+
+        assert AnyVisible().describe() == "any visible"
+        assert describe_to.out == "at least one of the elements is visible"
+
+
+class TestNoneVisible:
+    def test_can_be_instantiated(self) -> None:
+        nv = NoneVisible()
+
+        assert isinstance(nv, NoneVisible)
+
+    def test_matches_invisible_elements(self) -> None:
+        elements = get_elements_with_states([True, False, True], [False, False, True])
+        nv = NoneVisible().resolve()
+
+        assert nv._matches(elements)
+        assert nv._matches([])
+
+    def test_does_not_match_visible_elements(self) -> None:
+        elements = get_elements_with_states(
+            [True, True, True], [True, False, True], [True, True, False]
+        )
+        nv = NoneVisible().resolve()
+
+        assert not nv._matches(elements)
+        assert _describe_mismatch(nv, elements) == (
+            "the elements at indexes 0, 2 were visible"
+        )
+
+    def test_describe(self) -> None:
+        describe_to = StringDescription()
+        NoneVisible().resolve().describe_to(describe_to)
+
+        assert NoneVisible().describe() == "none visible"
+        assert describe_to.out == "none of the elements are visible"
+
+
+class TestAllClickable:
+    def test_can_be_instantiated(self) -> None:
+        ac = AllClickable()
+
+        assert isinstance(ac, AllClickable)
+
+    def test_matches_clickable_elements(self) -> None:
+        elements = get_elements_with_states([True, True, True], [True, True, True])
+        ac = AllClickable().resolve()
+
+        assert ac._matches(elements)
+
+    def test_does_not_match_unclickable_elements(self) -> None:
+        elements = get_elements_with_states(
+            [True, True, False], [True, True, True], [True, False, True]
+        )
+        ac = AllClickable().resolve()
+
+        assert not ac._matches(elements)
+        assert _describe_mismatch(ac, elements) == (
+            "the elements at indexes 0, 2 were not enabled/clickable"
+        )
+
+    def test_describe(self) -> None:
+        describe_to = StringDescription()
+        AllClickable().resolve().describe_to(describe_to)
+
+        assert AllClickable().describe() == "all clickable"
+        assert describe_to.out == "all of the elements are enabled/clickable"
+
+
+class TestReadStates:
+    def test_reads_every_state_at_once(self) -> None:
+        element1, element2 = get_mocked_element(), get_mocked_element()
+        element1.parent.execute_script.return_value = [
+            [True, True, True],
+            [True, False, False],
+        ]
+
+        states = read_states([element1, element2])
+
+        assert states == [
+            ElementState(present=True, displayed=True, enabled=True),
+            ElementState(present=True, displayed=False, enabled=False),
+        ]
+        element1.parent.execute_script.assert_called_once_with(
+            ELEMENT_STATES, [element1, element2]
+        )
+
+    def test_falls_back_when_script_fails(self) -> None:
+        element = get_mocked_element()
+        element.parent.execute_script.side_effect = WebDriverException
+        element.is_displayed.return_value = True
+        element.is_enabled.return_value = False
+
+        states = read_states([element])
+
+        assert states == [ElementState(present=True, displayed=True, enabled=False)]
+
+    def test_stale_element_raises(self) -> None:
+        element = get_mocked_element()
+        element.parent.execute_script.side_effect = StaleElementReferenceException
+
+        with pytest.raises(StaleElementReferenceException):
+            read_states([element])
+
+    def test_no_elements(self) -> None:
+        assert read_states([]) == []
@@ -6,9 +6,11 @@ import pytest
 from selenium.common.exceptions import WebDriverException
 from selenium.webdriver.common.by import By
 
-from screenpy_selenium import Target, TargetingError
+from screenpy_selenium import BrowseTheWeb, Target, TargetingError
+from screenpy_selenium.element_cache import ElementCache
+from screenpy_selenium.scripts import FIND_FIRST_ELEMENTS
 
-from .useful_mocks import get_mocked_browser
+from .useful_mocks import get_mocked_browser, get_mocked_element
 
 if TYPE_CHECKING:
     from screenpy import Actor
@@ -171,3 +173,159 @@ def test_str() -> None:
 
     assert str(t1) == "None"
     assert str(t2) == "foo"
+
+
+def test_found_by_uses_element_cache(Tester: Actor) -> None:
+    test_locator = (By.ID, "spam")
+    cached_element = get_mocked_element()
+    cache = ElementCache()
+    cache.elements[test_locator] = cached_element
+    Tester.ability_to(BrowseTheWeb).element_cache = cache
+    mocked_browser = get_mocked_browser(Tester)
+
+    element = Target.the("test").located(test_locator).found_by(Tester)
+
+    assert element is cached_element
+    mocked_browser.find_element.assert_not_called()
+
+
+def test_found_by_fills_element_cache(Tester: Actor) -> None:
+    test_locator = (By.ID, "eggs")
+    cache = ElementCache()
+    Tester.ability_to(BrowseTheWeb).element_cache = cache
+    mocked_browser = get_mocked_browser(Tester)
+    target = Target.the("test").located(test_locator)
+
+    first = target.found_by(Tester)
+    second = target.found_by(Tester)
+
+    assert first is second
+    assert cache.elements[test_locator] is first
+    mocked_browser.find_element.assert_called_once_with(*test_locator)
+
+
+def test_all_found_by_does_not_use_element_cache(Tester: Actor) -> None:
+    test_locator = (By.ID, "baked beans")
+    Tester.ability_to(BrowseTheWeb).element_cache = ElementCache()
+    mocked_browser = get_mocked_browser(Tester)
+    target = Target.the("test").located(test_locator)
+
+    target.all_found_by(Tester)
+    target.all_found_by(Tester)
+
+    assert mocked_browser.find_elements.call_count == 2
+
+
+def test_resolve_all(Tester: Actor) -> None:
+    element1, element2 = get_mocked_element(), get_mocked_element()
+    target1 = Target.the("one").located_by("#one")
+    target2 = Target.the("two").located_by("//two")
+    target3 = Target.the("three").located_by((By.ID, "three"))
+    mocked_browser = get_mocked_browser(Tester)
+    mocked_browser.execute_script.return_value = [element1, None, element2]
+
+    elements = Target.resolve_all(Tester, target1, target2, target3)
+
+    assert elements == [element1, None, element2]
+    mocked_browser.execute_script.assert_called_once_with(
+        FIND_FIRST_ELEMENTS,
+        [[By.CSS_SELECTOR, "#one"], [By.XPATH, "//two"], [By.ID, "three"]],
+    )
+    mocked_browser.find_element.assert_not_called()
+
+
+def test_resolve_all_unscriptable_strategy(Tester: Actor) -> None:
+    element = get_mocked_element()
+    target1 = Target.the("one").located_by(("accessibility id", "one"))
+    target2 = Target.the("two").located_by(("accessibility id", "two"))
+    mocked_browser = get_mocked_browser(Tester)
+    mocked_browser.find_elements.side_effect = [[element], []]
+
+    elements = Target.resolve_all(Tester, target1, target2)
+
+    assert elements == [element, None]
+    mocked_browser.execute_script.assert_not_called()
+
+
+def test_resolve_all_uses_element_cache(Tester: Actor) -> None:
+    cached_element, found_element = get_mocked_element(), get_mocked_element()
+    cache = ElementCache()
+    cache.elements[(By.CSS_SELECTOR, "#one")] = cached_element
+    Tester.ability_to(BrowseTheWeb).element_cache = cache
+    target1 = Target.the("one").located_by("#one")
+    target2 = Target.the("two").located_by("#two")
+    mocked_browser = get_mocked_browser(Tester)
+    mocked_browser.execute_script.return_value = [found_element]
+
+    elements = Target.resolve_all(Tester, target1, target2)
+
+    assert elements == [cached_element, found_element]
+    mocked_browser.execute_script.assert_called_once_with(
+        FIND_FIRST_ELEMENTS, [[By.CSS_SELECTOR, "#two"]]
+    )
+    assert cache.elements[(By.CSS_SELECTOR, "#two")] is found_element
+
+
+def test_resolve_all_raises_for_bad_locator(Tester: Actor) -> None:
+    test_name = "thingamajig"
+    mocked_browser = get_mocked_browser(Tester)
+    mocked_browser.execute_script.return_value = [
+        None,
+        {"error": "SyntaxError: '!!' is not a valid selector"},
+    ]
+
+    with pytest.raises(TargetingError) as excinfo:
+        Target.resolve_all(
+            Tester,
+            Target.the("fine").located_by("#a"),
+            Target.the(test_name).located_by("!!"),
+        )
+    assert test_name in str(excinfo.value)
+
+
+def test_resolve_all_raises_for_script_error(Tester: Actor) -> None:
+    test_name = "whatchamacallit"
+    mocked_browser = get_mocked_browser(Tester)
+    mocked_browser.execute_script.side_effect = WebDriverException
+
+    with pytest.raises(TargetingError) as excinfo:
+        Target.resolve_all(Tester, Target.the(test_name).located_by("#a"))
+    assert test_name in str(excinfo.value)
+
+
+def test_resolve_all_raises_for_no_locator(Tester: Actor) -> None:
+    with pytest.raises(TargetingError):
+        Target.resolve_all(Tester, Target.the("bogus"))
+
+
+def test_all_scripted_by(Tester: Actor) -> None:
+    test_locator = (By.CSS_SELECTOR, "li")
+    script = "return findElements(arguments[0], arguments[1]).length;"
+    mocked_browser = get_mocked_browser(Tester)
+    mocked_browser.execute_script.return_value = 3
+
+    result = (
+        Target.the("test")
+        .located(test_locator)
+        .all_scripted_by(Tester, script, "extra")
+    )
+
+    assert result == 3
+    mocked_browser.execute_script.assert_called_once_with(
+        script, *test_locator, "extra"
+    )
+
+
+def test_all_scripted_by_unscriptable_strategy(Tester: Actor) -> None:
+    mocked_browser = get_mocked_browser(Tester)
+    target = Target.the("test").located(("accessibility id", "spam"))
+
+    assert target.all_scripted_by(Tester, "return 1;") is None
+    mocked_browser.execute_script.assert_not_called()
+
+
+def test_all_scripted_by_script_error(Tester: Actor) -> None:
+    mocked_browser = get_mocked_browser(Tester)
+    mocked_browser.execute_script.side_effect = WebDriverException
+
+    assert Target.the("test").located("li").all_scripted_by(Tester, "oops") is None